@@ -1,2 +1,55 @@
 # Makes 'algorithms' a package
+#
+# Nothing is imported up front: the algorithm modules (and NumPy, which some
+# of them pull in) load on first use, so tools that need one algorithm start
+# quickly. Both `algorithms.graph.dijkstra` (the module) and the names below
+# resolve on first access. Functions named like their module (bfs, dfs,
+# dijkstra, ...) are imported from the module itself, because a loaded
+# submodule always takes over its name in this package.
+import importlib
 
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'AlgorithmStats': 'stats',
+    'ContractionHierarchy': 'contraction_hierarchy',
+    'DynamicSSSP': 'dynamic_sssp',
+    'ShortestPathCache': 'path_cache',
+    'all_pairs_shortest_paths': 'all_pairs',
+    'check_homomorphism': 'graph_homomorphism',
+    'dijkstra_many': 'dijkstra_batch',
+    'find_homomorphism': 'graph_homomorphism',
+    'frontier_bfs': 'bfs',
+    'get_connected_components': 'connected_components',
+    'get_shortest_path': 'dijkstra',
+    'has_cycle': 'cycle_detection',
+    'is_homomorphism': 'graph_homomorphism',
+    'iter_bfs': 'bfs',
+    'iter_dfs': 'dfs',
+    'minimum_spanning_forest': 'minimum_spanning_tree',
+    'multi_source_dijkstra': 'dijkstra',
+    'spfa': 'bellman_ford',
+}
+
+_SUBMODULES = (
+    'all_pairs', 'bellman_ford', 'bfs', 'connected_components', 'contraction_hierarchy',
+    'cycle_detection', 'dfs', 'dijkstra', 'dijkstra_batch', 'dynamic_sssp', 'graph_coloring',
+    'graph_homomorphism', 'minimum_spanning_tree', 'path_cache', 'shortest_path', 'stats',
+    'strongly_connected_components', 'topological_sort',
+)
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SUBMODULES))
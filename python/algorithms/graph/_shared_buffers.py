@@ -0,0 +1,50 @@
+# graph_project/algorithms/_shared_buffers.py
+from multiprocessing import shared_memory
+
+
+def share_buffers(buffers):
+    """
+    Copies typed arrays into one shared memory block, so worker processes
+    can map them instead of receiving pickled copies.
+
+    Args:
+        buffers (list): array.array instances.
+
+    Returns:
+        A tuple (shm, layout): the SharedMemory block (the caller must close
+        and unlink it) and a picklable [(typecode, length), ...] layout.
+    """
+    size = sum(len(b) * b.itemsize for b in buffers)
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    position = 0
+    for buffer in buffers:
+        raw = buffer.tobytes()
+        shm.buf[position:position + len(raw)] = raw
+        position += len(raw)
+    return shm, [(getattr(b, 'typecode', None) or b.format, len(b)) for b in buffers]
+
+
+def attach_buffers(name, layout, shm=None):
+    """
+    Maps the buffers of a shared memory block as typed memoryviews.
+
+    Args:
+        name (str): Name of the SharedMemory block.
+        layout (list): The layout returned by share_buffers.
+        shm (SharedMemory): An already open handle to reuse, if any.
+
+    Returns:
+        A tuple (shm, views). Keep shm alive for as long as the views are used.
+    """
+    if shm is None:
+        shm = shared_memory.SharedMemory(name=name)
+    views = []
+    position = 0
+    for typecode, length in layout:
+        size = length * _ITEM_SIZES[typecode]
+        views.append(shm.buf[position:position + size].cast(typecode))
+        position += size
+    return shm, views
+
+
+_ITEM_SIZES = {'q': 8, 'd': 8}
@@ -0,0 +1,32 @@
+# graph_project/algorithms/_traversal.py
+from datastructures.graph.csr_graph import CSRGraph
+
+
+def adjacency_view(graph):
+    """
+    Lets the lazy traversals run on a Graph or on the integer ids of a
+    CSRGraph with the same code.
+
+    Args:
+        graph (Graph or CSRGraph): The graph.
+
+    Returns:
+        A tuple (neighbors, key_of, label_of): neighbors(key) iterates the
+        (neighbor key, weight) pairs of a vertex key, key_of maps a vertex
+        label to its key and label_of maps a key back to the label.
+        For a Graph, keys are the labels themselves.
+    """
+    if not isinstance(graph, CSRGraph):
+        return graph.get_neighbors, _identity, _identity
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    def neighbors(vertex_id):
+        start, end = offsets[vertex_id], offsets[vertex_id + 1]
+        return zip(targets[start:end], weights[start:end])
+
+    return neighbors, graph.index.__getitem__, graph.labels.__getitem__
+
+
+def _identity(vertex):
+    return vertex
@@ -0,0 +1,181 @@
+# graph_project/algorithms/all_pairs.py
+from array import array
+
+from datastructures.graph.csr_graph import CSRGraph
+from .dijkstra_batch import _distance_rows
+from .stats import timed
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is required for the distance matrix
+    np = None
+
+METHODS = ('auto', 'floyd_warshall', 'johnson')
+
+
+def all_pairs_shortest_paths(graph, method='auto', dtype='float64', path=None, block_size=64,
+                             workers=None, stats=None):
+    """
+    Computes the shortest distance between every ordered pair of vertices.
+    Negative edge weights are allowed as long as there is no negative cycle
+    (in an undirected graph, a negative edge is itself one).
+
+    Two engines are available:
+    - 'floyd_warshall': Floyd-Warshall vectorized with NumPy. Pivots are
+      applied in blocks of block_size, one strip of rows at a time, so each
+      strip stays in cache for a whole block instead of the full matrix being
+      streamed once per pivot. O(V^3), best for dense graphs.
+    - 'johnson': one vectorized Bellman-Ford pass computes vertex potentials
+      that make every edge weight non-negative, then a Dijkstra runs from
+      every vertex across a process pool, as in dijkstra_many. O(V E log V),
+      best for sparse graphs.
+    'auto' picks Floyd-Warshall when the graph has more than V^2 / 256 edge
+    entries and Johnson otherwise.
+
+    Args:
+        graph (Graph or CSRGraph): The graph.
+        method (str): 'auto', 'floyd_warshall' or 'johnson'.
+        dtype (str): 'float64' (default) or 'float32', which halves the memory
+                     but rounds distances beyond 2**24.
+        path (str): If given, the matrix is a .npy file memory-mapped at this
+                    path instead of living in RAM; np.load(path, mmap_mode='r')
+                    reopens it later.
+        block_size (int): Pivots per Floyd-Warshall block.
+        workers (int): Worker processes for Johnson (default: os.cpu_count()).
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
+
+    Returns:
+        A tuple (matrix, labels):
+        - matrix (numpy.ndarray): matrix[i, j] is the distance from labels[i]
+                                  to labels[j], inf if unreachable.
+        - labels (list): The vertices in get_all_vertices() order.
+        Raises ValueError if the graph contains a negative weight cycle.
+    """
+    if np is None:
+        raise ImportError("all_pairs_shortest_paths requires NumPy.")
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}; expected one of {list(METHODS)}.")
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError("dtype must be 'float32' or 'float64'.")
+
+    with timed(stats, 'setup'):
+        csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        labels = list(csr.labels)
+        n = len(labels)
+        offsets, targets, weights = csr.to_numpy()
+        sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+        if path is None:
+            matrix = np.empty((n, n), dtype=dtype)
+        else:
+            matrix = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(n, n))
+
+    if method == 'auto':
+        method = 'floyd_warshall' if len(targets) * 256 > n * n else 'johnson'
+    if method == 'floyd_warshall':
+        _floyd_warshall(matrix, labels, sources, targets, weights, block_size, stats)
+    else:
+        _johnson(matrix, csr, sources, targets, weights, workers, stats)
+
+    if path is not None:
+        matrix.flush()
+    return matrix, labels
+
+
+def _floyd_warshall(matrix, labels, sources, targets, weights, block_size, stats=None):
+    """
+    Blocked Floyd-Warshall in place on the distance matrix.
+    """
+    n = len(matrix)
+    with timed(stats, 'setup'):
+        matrix.fill(np.inf)
+        matrix[sources, targets] = weights  # A CSR row lists each neighbor once
+        np.fill_diagonal(matrix, np.minimum(np.diagonal(matrix), 0))
+        scratch = np.empty((min(block_size, n), n), dtype=matrix.dtype)
+
+    with timed(stats, 'relax'):
+        for start in range(0, n, block_size):
+            pivots = range(start, min(start + block_size, n))
+            pivot_rows = matrix[pivots.start:pivots.stop]
+            # The pivot rows go first, so every other strip then sees them
+            # already updated by the whole block
+            _relax_strip(pivot_rows, pivots, pivot_rows, scratch)
+            for row in range(0, n, block_size):
+                if row != start:
+                    _relax_strip(matrix[row:row + block_size], pivots, pivot_rows, scratch)
+
+    if stats is not None:
+        stats.add('rounds_run', n)
+
+    with timed(stats, 'cycle_check'):
+        negative = np.flatnonzero(np.diagonal(matrix) < 0)
+        if len(negative):
+            raise ValueError(f"Graph contains a negative weight cycle involving vertex {labels[negative[0]]}")
+
+
+def _relax_strip(strip, pivots, pivot_rows, scratch):
+    """
+    Applies the Floyd-Warshall step of every pivot, in order, to a strip of rows.
+    """
+    scratch = scratch[:len(strip)]
+    for k in pivots:
+        np.add(strip[:, k, None], pivot_rows[k - pivots.start], out=scratch)
+        np.minimum(strip, scratch, out=strip)
+
+
+def _johnson(matrix, csr, sources, targets, weights, workers, stats=None):
+    """
+    Johnson's algorithm, writing one matrix row per Dijkstra.
+    """
+    with timed(stats, 'potentials'):
+        potential = _potentials(csr.labels, sources, targets, weights, len(matrix))
+
+    with timed(stats, 'setup'):
+        reweighted = csr.weights
+        if potential is not None:
+            shifted = weights + potential[sources] - potential[targets]
+            np.maximum(shifted, 0, out=shifted)  # Rounding can leave tiny negatives
+            reweighted = array('d')
+            reweighted.frombytes(shifted.tobytes())
+
+    with timed(stats, 'dijkstra'):
+        rows = _distance_rows(csr.offsets, csr.targets, reweighted, list(range(len(matrix))),
+                              workers, stats)
+        for source_id, dist in rows:
+            row = np.frombuffer(dist, dtype=np.float64)
+            if potential is not None:
+                row = row - potential[source_id] + potential
+            matrix[source_id] = row
+
+
+def _potentials(labels, sources, targets, weights, n):
+    """
+    Bellman-Ford from a virtual source joined to every vertex by a zero-weight
+    edge, relaxing every edge at once per round like
+    bellman_ford(vectorized=True).
+
+    Returns:
+        The potential of every vertex id, or None if no weight is negative
+        and no reweighting is needed.
+        Raises ValueError if the graph contains a negative weight cycle.
+    """
+    if len(weights) == 0 or weights.min() >= 0:
+        return None
+
+    order = np.argsort(targets, kind='stable')
+    sources, targets, weights = sources[order], targets[order], weights[order]
+    group_targets, group_starts = np.unique(targets, return_index=True)
+
+    potential = np.zeros(n)
+    # Shortest paths from the virtual source have at most n - 1 real edges,
+    # so a graph without negative cycles settles within n - 1 rounds
+    for _ in range(n):
+        best = np.minimum.reduceat(potential[sources] + weights, group_starts)
+        improved = best < potential[group_targets]
+        if not improved.any():
+            return potential
+        potential[group_targets[improved]] = best[improved]
+
+    k = np.flatnonzero(potential[sources] + weights < potential[targets])[0]
+    raise ValueError(f"Graph contains a negative weight cycle involving edge "
+                     f"({labels[sources[k]]} -> {labels[targets[k]]})")
@@ -1,6 +1,16 @@
 # graph_project/algorithms/bellman_ford.py
+from collections import deque
 
-def bellman_ford(graph, start_vertex):
+from datastructures.graph.csr_graph import CSRGraph
+from ._traversal import adjacency_view
+from .stats import CountingNeighbors, timed
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for vectorized=True
+    np = None
+
+def bellman_ford(graph, start_vertex, vectorized=False, stats=None):
     """
     Implements the Bellman-Ford algorithm to find the shortest paths from a single
     source vertex to all other vertices in a weighted graph.
@@ -9,52 +19,359 @@ def bellman_ford(graph, start_vertex):
     Args:
         graph (Graph): An instance of the Graph class.
         start_vertex: The starting vertex.
+        vectorized (bool): If True, hold the edges as NumPy source/target/weight
+                           arrays and relax the whole edge set per round with
+                           array operations. Requires NumPy.
+        stats (AlgorithmStats): Optional collector for work counters and phase
+                                times, including how many of the n - 1 rounds
+                                ran and how many the early exit skipped.
 
     Returns:
         A tuple (distances, predecessors):
         - distances (dict): A dictionary mapping each vertex to its shortest distance
                             from the start_vertex. float('inf') for unreachable.
-                            Contains float('-inf') for vertices in or reachable
-                            from a negative cycle.
         - predecessors (dict): A dictionary mapping each vertex to its predecessor
                                on the shortest path.
         Returns (None, None) if start_vertex is not in graph.
         Raises ValueError if a negative weight cycle is detected and reports it.
+        Use spfa() to get the cycle and -inf distances instead.
     """
-    vertices = graph.get_all_vertices()
-    if start_vertex not in vertices:
+    if vectorized:
+        return _bellman_ford_numpy(graph, start_vertex, stats)
+    if isinstance(graph, CSRGraph):
+        return _bellman_ford_csr(graph, start_vertex, stats)
+
+    if start_vertex not in graph:
         return None, None
+    vertices = graph.get_all_vertices()
 
-    edges = graph.get_all_edges() # Needs Graph.get_all_edges() method
+    with timed(stats, 'setup'):
+        edges = graph.get_all_edges() # Needs Graph.get_all_edges() method
 
     distances = {vertex: float('inf') for vertex in vertices}
     predecessors = {vertex: None for vertex in vertices}
     distances[start_vertex] = 0
 
     num_vertices = len(vertices)
+    rounds = relaxations = 0
 
     # Relax edges repeatedly
-    for _ in range(num_vertices - 1):
-        changed_in_iteration = False
+    with timed(stats, 'relax'):
+        for _ in range(num_vertices - 1):
+            rounds += 1
+            relaxed_in_iteration = 0
+            for u, v, weight in edges:
+                if distances[u] != float('inf') and distances[u] + weight < distances[v]:
+                    distances[v] = distances[u] + weight
+                    predecessors[v] = u
+                    relaxed_in_iteration += 1
+            relaxations += relaxed_in_iteration
+            if not relaxed_in_iteration: # Optimization: if no changes, shortest paths found
+                break
+
+    if stats is not None:
+        _add_rounds(stats, num_vertices, rounds, relaxations, len(edges),
+                    sum(1 for d in distances.values() if d != float('inf')))
+
+    # Check for negative weight cycles
+    with timed(stats, 'cycle_check'):
         for u, v, weight in edges:
             if distances[u] != float('inf') and distances[u] + weight < distances[v]:
-                distances[v] = distances[u] + weight
-                predecessors[v] = u
-                changed_in_iteration = True
-        if not changed_in_iteration: # Optimization: if no changes, shortest paths found
-             break
+                # spfa() marks the vertices reachable from the cycle as -inf instead
+                raise ValueError(f"Graph contains a negative weight cycle involving edge ({u} -> {v})")
+
+    return distances, predecessors
+
+
+def _add_rounds(stats, num_vertices, rounds, relaxations, num_edges, reachable):
+    """
+    Adds the counters of one Bellman-Ford run: every round and the final
+    negative cycle check scan the whole edge list.
+    """
+    stats.add('rounds_run', rounds)
+    stats.add('rounds_skipped', max(num_vertices - 1 - rounds, 0))
+    stats.add('relaxations', relaxations)
+    stats.add('edges_scanned', (rounds + 1) * num_edges)
+    stats.add('vertices_settled', reachable)
+
+
+def _bellman_ford_csr(graph, start_vertex, stats=None):
+    """
+    Bellman-Ford over the integer arrays of a CSRGraph. Same result as bellman_ford().
+    """
+    start = graph.index.get(start_vertex)
+    if start is None:
+        return None, None
+
+    labels, offsets, targets, weights = graph.labels, graph.offsets, graph.targets, graph.weights
+    n = len(labels)
+    # Flatten the CSR rows into (u, v, weight) id triples, listing undirected
+    # edges once exactly like Graph.get_all_edges() does
+    directed = graph._directed
+    with timed(stats, 'setup'):
+        edges = [(u, targets[k], weights[k])
+                 for u in range(n)
+                 for k in range(offsets[u], offsets[u + 1])
+                 if directed or u <= targets[k]]
+
+    inf = float('inf')
+    dist = [inf] * n
+    pred = [-1] * n
+    dist[start] = 0
+    rounds = relaxations = 0
+
+    with timed(stats, 'relax'):
+        for _ in range(n - 1):
+            rounds += 1
+            relaxed_in_iteration = 0
+            for u, v, weight in edges:
+                du = dist[u]
+                if du != inf and du + weight < dist[v]:
+                    dist[v] = du + weight
+                    pred[v] = u
+                    relaxed_in_iteration += 1
+            relaxations += relaxed_in_iteration
+            if not relaxed_in_iteration:
+                break
+
+    if stats is not None:
+        _add_rounds(stats, n, rounds, relaxations, len(edges), n - dist.count(inf))
+
+    with timed(stats, 'cycle_check'):
+        for u, v, weight in edges:
+            if dist[u] != inf and dist[u] + weight < dist[v]:
+                raise ValueError(f"Graph contains a negative weight cycle involving edge ({labels[u]} -> {labels[v]})")
+
+    with timed(stats, 'output'):
+        distances = dict(zip(labels, dist))
+        predecessors = {labels[i]: (labels[p] if p >= 0 else None) for i, p in enumerate(pred)}
+    return distances, predecessors
+
+
+def _edge_arrays(graph):
+    """
+    Returns (labels, sources, targets, weights) with the edges of the graph as
+    NumPy id arrays, listing undirected edges once like get_all_edges().
+    """
+    if isinstance(graph, CSRGraph):
+        labels = graph.labels
+        offsets, targets, weights = graph.to_numpy()
+        sources = np.repeat(np.arange(len(labels), dtype=np.int64), np.diff(offsets))
+        if not graph._directed:
+            keep = sources <= targets
+            sources, targets, weights = sources[keep], targets[keep], weights[keep]
+        return labels, sources, targets, weights
+
+    labels = graph.get_all_vertices()
+    index = {label: i for i, label in enumerate(labels)}
+    edges = graph.get_all_edges()
+    sources = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=len(edges))
+    targets = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=len(edges))
+    weights = np.array([w for _, _, w in edges])
+    if weights.dtype.kind not in 'if':
+        weights = weights.astype(np.float64)
+    return labels, sources, targets, weights
+
+
+def _bellman_ford_numpy(graph, start_vertex, stats=None):
+    """
+    Vectorized Bellman-Ford. Each round computes dist[u] + w for every edge at
+    once and scatters the per-target minimum back into the distance array.
+    Same result as bellman_ford() (predecessors may differ between equally
+    short paths).
+    """
+    if np is None:
+        raise ImportError("bellman_ford(vectorized=True) requires NumPy.")
+
+    if start_vertex not in graph:
+        return None, None
+
+    with timed(stats, 'setup'):
+        labels, sources, targets, weights = _edge_arrays(graph)
+        index = {label: i for i, label in enumerate(labels)}
+        num_vertices = len(labels)
+
+        # Group edges by target once, so the per-target minimum of every round is
+        # a single reduceat over contiguous slices.
+        order = np.argsort(targets, kind='stable')
+        sources, targets, weights = sources[order], targets[order], weights[order]
+        group_targets, group_starts = np.unique(targets, return_index=True)
 
+    dist = np.full(num_vertices, np.inf)
+    pred = np.full(num_vertices, -1, dtype=np.int64)
+    dist[index[start_vertex]] = 0
+    rounds = relaxations = 0
+
+    # Relax edges repeatedly
+    with timed(stats, 'relax'):
+        for _ in range(num_vertices - 1):
+            if len(targets) == 0:
+                break
+            rounds += 1
+            candidates = dist[sources] + weights
+            improved = candidates < dist[targets]
+            if not improved.any(): # Optimization: if no changes, shortest paths found
+                break
+            best = np.minimum.reduceat(candidates, group_starts)
+            winners = improved & (candidates == np.repeat(best, np.diff(np.append(group_starts, len(targets)))))
+            pred[targets[winners]] = sources[winners]
+            if stats is not None:
+                # One relaxation per vertex whose distance goes down this round
+                relaxations += int(np.count_nonzero(best < dist[group_targets]))
+            dist[group_targets] = np.minimum(dist[group_targets], best)
+
+    if stats is not None:
+        _add_rounds(stats, num_vertices, rounds, relaxations, len(targets),
+                    int(np.count_nonzero(np.isfinite(dist))))
 
     # Check for negative weight cycles
-    for u, v, weight in edges:
-        if distances[u] != float('inf') and distances[u] + weight < distances[v]:
-            # Propagate negative infinity to all reachable nodes from cycle
-            # This part can be complex to implement fully to mark all affected nodes
-            # For now, we raise an error. A more robust solution might mark specific nodes.
-            # To simply detect and mark nodes in a cycle or reachable from it as -inf:
-            # Perform a traversal (DFS/BFS) from 'v' if distances[v] is further reduced,
-            # and mark all reachable nodes as -inf.
-            # However, for this implementation, we will just raise an error.
-            raise ValueError(f"Graph contains a negative weight cycle involving edge ({u} -> {v})")
-
-    return distances, predecessors
\ No newline at end of file
+    with timed(stats, 'cycle_check'):
+        if len(targets):
+            violated = np.flatnonzero(dist[sources] + weights < dist[targets])
+            if len(violated):
+                k = violated[0]
+                raise ValueError(f"Graph contains a negative weight cycle involving edge "
+                                 f"({labels[sources[k]]} -> {labels[targets[k]]})")
+
+    with timed(stats, 'output'):
+        integral = weights.dtype.kind == 'i' or len(weights) == 0
+        distances = {}
+        for label, d in zip(labels, dist.tolist()):
+            distances[label] = int(d) if integral and d != float('inf') else d
+        predecessors = {labels[i]: (labels[p] if p >= 0 else None) for i, p in enumerate(pred.tolist())}
+    return distances, predecessors
+
+
+def spfa(graph, start_vertex, stats=None):
+    """
+    Queue-based Bellman-Ford (the "shortest path faster algorithm"): only the
+    out-edges of vertices whose distance just went down are relaxed again,
+    instead of every edge in every round.
+
+    Negative cycles are found early with an amortized walk-to-root check:
+    after every n relaxations the predecessor pointers are scanned for a
+    cycle, which always has negative weight. Rather than failing, every
+    vertex reachable from a detected cycle gets distance float('-inf') and
+    no predecessor, and the search goes on for the rest of the graph.
+
+    Unlike bellman_ford(), edges are followed through get_neighbors, so an
+    undirected edge can be used in both directions and a negative undirected
+    edge is itself a negative cycle.
+
+    Args:
+        graph (Graph or CSRGraph): The graph.
+        start_vertex: The starting vertex.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
+
+    Returns:
+        A tuple (distances, predecessors, negative_cycle):
+        - distances (dict): Shortest distance from start_vertex to each vertex;
+                            float('inf') if unreachable, float('-inf') if
+                            reachable through a negative cycle.
+        - predecessors (dict): Predecessor on the shortest path (None for the
+                               start, unreachable and -inf vertices).
+        - negative_cycle (list): The vertices of the first negative cycle
+                                 found, in edge order (the last one links back
+                                 to the first), or None if there is none.
+        Returns (None, None, None) if start_vertex is not in graph.
+    """
+    if start_vertex not in graph:
+        return None, None, None
+
+    neighbors, key_of, label_of = adjacency_view(graph)
+    if stats is not None:
+        neighbors = CountingNeighbors(lambda key, view=neighbors: list(view(key)))
+
+    keys = [key_of(vertex) for vertex in graph.get_all_vertices()]
+    inf = float('inf')
+    dist = dict.fromkeys(keys, inf)
+    pred = dict.fromkeys(keys)
+    source = key_of(start_vertex)
+    dist[source] = 0
+
+    queue = deque([source])
+    queued = {source}
+    negative_cycle = None
+    relaxations = since_check = 0
+    check_every = max(len(keys), 1)
+
+    with timed(stats, 'relax'):
+        while queue:
+            u = queue.popleft()
+            queued.discard(u)
+            du = dist[u]
+            if du == -inf:  # Already marked unbounded, along with everything it reaches
+                continue
+            for v, weight in neighbors(u):
+                if du + weight < dist[v]:
+                    dist[v] = du + weight
+                    pred[v] = u
+                    since_check += 1
+                    if v not in queued:
+                        queued.add(v)
+                        queue.append(v)
+
+            if since_check >= check_every:
+                relaxations += since_check
+                since_check = 0
+                with timed(stats, 'cycle_check'):
+                    cycle = _predecessor_cycle(pred)
+                    if cycle is not None:
+                        if negative_cycle is None:
+                            negative_cycle = [label_of(key) for key in cycle]
+                        _mark_unbounded(cycle, neighbors, dist, pred)
+    relaxations += since_check
+
+    if stats is not None:
+        stats.add('vertices_settled', neighbors.calls)
+        stats.add('edges_scanned', neighbors.edges)
+        stats.add('relaxations', relaxations)
+
+    with timed(stats, 'output'):
+        if isinstance(graph, CSRGraph):
+            dist = {label_of(key): d for key, d in dist.items()}
+            pred = {label_of(key): (label_of(p) if p is not None else None) for key, p in pred.items()}
+    return dist, pred, negative_cycle
+
+
+def _predecessor_cycle(pred):
+    """
+    Finds a cycle in the predecessor pointers in O(V) by walking from every
+    vertex towards the root, stamping each walk with its starting vertex.
+
+    Returns:
+        The cycle's vertices in edge order, or None if the pointers form a forest.
+    """
+    stamp = {}
+    for start in pred:
+        v = start
+        while v is not None and v not in stamp:
+            stamp[v] = start
+            v = pred[v]
+        if v is not None and stamp[v] == start:
+            # The walk came back to a vertex of its own: v is on a cycle
+            cycle = [v]
+            u = pred[v]
+            while u != v:
+                cycle.append(u)
+                u = pred[u]
+            cycle.reverse()
+            return cycle
+    return None
+
+
+def _mark_unbounded(cycle, neighbors, dist, pred):
+    """
+    Sets every vertex reachable from the cycle to -inf with no predecessor.
+    """
+    unbounded = float('-inf')
+    stack = list(cycle)
+    for v in cycle:
+        dist[v] = unbounded
+        pred[v] = None
+    while stack:
+        for v, _ in neighbors(stack.pop()):
+            if dist[v] != unbounded:
+                dist[v] = unbounded
+                pred[v] = None
+                stack.append(v)
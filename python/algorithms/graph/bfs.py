@@ -1,35 +1,287 @@
 # graph_project/algorithms/bfs.py
 from collections import deque
 
-def bfs(graph, start_vertex):
+from datastructures.graph.csr_graph import CSRGraph
+from ._traversal import adjacency_view
+from .stats import CountingNeighbors, degree_sum, timed
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for frontier_bfs
+    np = None
+
+def bfs(graph, start_vertex, stats=None):
     """
     Performs a Breadth-First Search on the graph starting from start_vertex.
 
     Args:
         graph (Graph): An instance of the Graph class.
         start_vertex: The vertex to start the BFS from.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
 
     Returns:
         A list of vertices in the order they were visited.
         Returns an empty list if the start_vertex is not in the graph.
     """
-    if start_vertex not in graph.get_all_vertices():
+    if isinstance(graph, CSRGraph):
+        return _bfs_csr(graph, start_vertex, stats)
+
+    if start_vertex not in graph:
         return []
 
+    get_neighbors = graph.get_neighbors if stats is None else CountingNeighbors(graph.get_neighbors)
+
     visited = set()
     queue = deque([start_vertex])
     order_visited = []
 
     visited.add(start_vertex)
 
-    while queue:
-        current_vertex = queue.popleft()
-        order_visited.append(current_vertex)
-
-        # Neighbors are tuples (neighbor, weight)
-        for neighbor, weight in graph.get_neighbors(current_vertex):
-            if neighbor not in visited:
-                visited.add(neighbor)
-                queue.append(neighbor)
-    
-    return order_visited
\ No newline at end of file
+    with timed(stats, 'search'):
+        while queue:
+            current_vertex = queue.popleft()
+            order_visited.append(current_vertex)
+
+            # Neighbors are tuples (neighbor, weight)
+            for neighbor, weight in get_neighbors(current_vertex):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+
+    if stats is not None:
+        stats.add('vertices_settled', get_neighbors.calls)
+        stats.add('edges_scanned', get_neighbors.edges)
+    return order_visited
+
+
+def _bfs_csr(graph, start_vertex, stats=None):
+    """
+    BFS over the integer arrays of a CSRGraph. Same result as bfs().
+    """
+    start = graph.index.get(start_vertex)
+    if start is None:
+        return []
+
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.num_vertices)
+    queue = deque([start])
+    order_visited = []
+
+    visited[start] = 1
+
+    with timed(stats, 'search'):
+        while queue:
+            current = queue.popleft()
+            order_visited.append(current)
+
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[k]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
+
+    if stats is not None:
+        stats.add('vertices_settled', len(order_visited))
+        stats.add('edges_scanned', degree_sum(offsets, order_visited))
+    labels = graph.labels
+    return [labels[i] for i in order_visited]
+
+
+def iter_bfs(graph, start_vertex, max_depth=None, stop_when=None, levels=False, details=False,
+             stats=None):
+    """
+    Lazily yields the vertices of a Breadth-First Search as they are
+    discovered, in the same order as bfs(). Only the part of the graph that
+    is actually consumed gets explored, so "find the nearest X" queries can
+    stop after touching a handful of vertices.
+
+    Args:
+        graph (Graph or CSRGraph): The graph.
+        start_vertex: The vertex to start the BFS from.
+        max_depth (int): If given, vertices more than max_depth edges away
+                         from start_vertex are not visited.
+        stop_when (callable): Optional predicate called with every visited
+                              vertex; the search ends right after the first
+                              vertex for which it returns True (in levels
+                              mode, after the level containing it).
+        levels (bool): If True, yield one list per depth level instead of
+                       single vertices.
+        details (bool): If True, yield (vertex, depth, parent, weight) tuples,
+                        where weight is that of the edge parent -> vertex
+                        (parent and weight are None for start_vertex).
+        stats (AlgorithmStats): Optional collector for the vertices expanded
+                                and edges scanned, added when the iteration
+                                ends, even if it is stopped early.
+
+    Yields:
+        Vertices, (vertex, depth, parent, weight) tuples or lists of either.
+        Nothing is yielded if start_vertex is not in the graph.
+    """
+    if start_vertex not in graph:
+        return
+    neighbors, key_of, label_of = adjacency_view(graph)
+    if stats is not None:
+        neighbors = CountingNeighbors(lambda key, view=neighbors: list(view(key)))
+    start = key_of(start_vertex)
+
+    # Runs even when the caller stops iterating early
+    try:
+        first = (start_vertex, 0, None, None) if details else start_vertex
+        yield [first] if levels else first
+        if stop_when is not None and stop_when(start_vertex):
+            return
+
+        visited = {start}
+        frontier = [start]
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            next_frontier = []
+            level = []
+            stop = False
+            for current in frontier:
+                for neighbor, weight in neighbors(current):
+                    if neighbor in visited:
+                        continue
+                    visited.add(neighbor)
+                    next_frontier.append(neighbor)
+                    vertex = label_of(neighbor)
+                    item = (vertex, depth, label_of(current), weight) if details else vertex
+                    if levels:
+                        level.append(item)
+                    else:
+                        yield item
+                    if stop_when is not None and stop_when(vertex):
+                        if not levels:
+                            return
+                        stop = True
+            if levels and level:
+                yield level
+            if stop:
+                return
+            frontier = next_frontier
+    finally:
+        if stats is not None:
+            stats.add('vertices_settled', neighbors.calls)
+            stats.add('edges_scanned', neighbors.edges)
+
+
+def frontier_bfs(graph, sources, direction='auto', alpha=14, beta=24, stats=None):
+    """
+    Breadth-First Search that expands whole frontiers at once with NumPy
+    array operations, for hop distances and reachability on large graphs.
+
+    Each step is either top-down (gather the out-edges of the frontier) or
+    bottom-up (gather the in-edges of every unvisited vertex and keep those
+    that touch the frontier). With direction='auto' the search switches
+    like Beamer's direction-optimizing BFS: bottom-up once the frontier's
+    out-edges outnumber the unvisited vertices' in-edges divided by alpha, and
+    back to top-down once the frontier shrinks below n / beta vertices.
+    Bottom-up pays off on low-diameter graphs, where a few middle levels
+    hold most of the vertices. Requires NumPy.
+
+    Args:
+        graph (Graph or CSRGraph): The graph. A Graph is frozen first.
+        sources (iterable): The start vertices, searched from all at once, so
+                            every vertex gets its hop distance to the nearest
+                            source. Pass [start_vertex] for a single source.
+        direction (str): 'auto' (default), 'top_down' or 'bottom_up'.
+        alpha (float): Top-down to bottom-up switching threshold.
+        beta (float): Bottom-up to top-down switching threshold.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
+
+    Returns:
+        A tuple (hops, parents) of int64 NumPy arrays indexed by the vertex
+        ids of graph.freeze() (insertion order):
+        - hops: Number of edges from the nearest source, -1 if unreachable.
+        - parents: Id of the predecessor on a shortest path, -1 for sources
+                   and unreachable vertices.
+        The set of vertices with hops >= 0 is exactly what bfs() visits.
+        Returns (None, None) if no source is in the graph.
+    """
+    if np is None:
+        raise ImportError("frontier_bfs requires NumPy.")
+    if direction not in ('auto', 'top_down', 'bottom_up'):
+        raise ValueError(f"Unknown direction {direction!r}; expected 'auto', 'top_down' or 'bottom_up'.")
+
+    with timed(stats, 'setup'):
+        csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        source_ids = sorted({csr.index[s] for s in sources if s in csr.index})
+        if not source_ids:
+            return None, None
+        offsets, targets, _ = csr.to_numpy()
+        # Bottom-up steps look at in-edges; an undirected graph is its own reverse
+        in_offsets, in_targets, _ = (csr.reverse() if csr._directed else csr).to_numpy()
+
+    n = csr.num_vertices
+    out_degree = np.diff(offsets)
+    in_degree = np.diff(in_offsets)
+    hops = np.full(n, -1, dtype=np.int64)
+    parents = np.full(n, -1, dtype=np.int64)
+    frontier = np.array(source_ids, dtype=np.int64)
+    hops[frontier] = 0
+
+    # Work of the next step: top-down scans the out-edges of the frontier,
+    # bottom-up the in-edges of the unvisited vertices
+    frontier_edges = int(out_degree[frontier].sum())
+    unvisited_edges = int(in_degree.sum()) - int(in_degree[frontier].sum())
+    bottom_up = direction == 'bottom_up'
+    depth = 0
+    edges_scanned = top_down_steps = bottom_up_steps = 0
+
+    with timed(stats, 'search'):
+        while len(frontier):
+            if direction == 'auto':
+                if not bottom_up and frontier_edges > unvisited_edges / alpha:
+                    bottom_up = True
+                elif bottom_up and len(frontier) < n / beta:
+                    bottom_up = False
+            depth += 1
+
+            if bottom_up:
+                unvisited = np.flatnonzero(hops < 0)
+                in_frontier = np.zeros(n, dtype=bool)
+                in_frontier[frontier] = True
+                owners, candidates = _gather(in_offsets, in_targets, unvisited)
+                hit = in_frontier[candidates]
+                reached, first = np.unique(owners[hit], return_index=True)
+                new_parents = candidates[hit][first]
+                edges_scanned += len(candidates)
+                bottom_up_steps += 1
+            else:
+                owners, candidates = _gather(offsets, targets, frontier)
+                fresh = hops[candidates] < 0
+                reached, first = np.unique(candidates[fresh], return_index=True)
+                new_parents = owners[fresh][first]
+                edges_scanned += len(candidates)
+                top_down_steps += 1
+
+            hops[reached] = depth
+            parents[reached] = new_parents
+            frontier = reached
+            frontier_edges = int(out_degree[frontier].sum())
+            unvisited_edges -= int(in_degree[frontier].sum())
+
+    if stats is not None:
+        stats.add('vertices_settled', int(np.count_nonzero(hops >= 0)))
+        stats.add('edges_scanned', edges_scanned)
+        stats.add('top_down_steps', top_down_steps)
+        stats.add('bottom_up_steps', bottom_up_steps)
+    return hops, parents
+
+
+def _gather(offsets, targets, vertices):
+    """
+    Returns (owners, neighbors): every CSR edge entry of the given vertex
+    ids as two parallel arrays, without a Python loop.
+    """
+    starts = offsets[vertices]
+    counts = offsets[vertices + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    # Position of each gathered entry within its vertex's slice, shifted to the slice start
+    ends = np.cumsum(counts)
+    positions = np.arange(total, dtype=np.int64) - np.repeat(ends - counts - starts, counts)
+    return np.repeat(vertices, counts), targets[positions]
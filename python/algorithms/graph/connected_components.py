@@ -1,13 +1,18 @@
 # graph_project/algorithms/connected_components.py
+from collections import deque
+
+from datastructures.graph.csr_graph import CSRGraph
 from .dfs import dfs_recursive_util # Can use DFS or BFS for traversal
+from .stats import CountingNeighbors, timed
 
-def get_connected_components(graph):
+def get_connected_components(graph, stats=None):
     """
     Finds all connected components in an undirected graph.
     Each component is a set of vertices.
 
     Args:
         graph (Graph): An undirected Graph instance.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
 
     Returns:
         list: A list of sets, where each set contains the vertices
@@ -19,9 +24,22 @@ def get_connected_components(graph):
         raise TypeError("Connected components are typically defined for undirected graphs. "
                         "For directed graphs, consider 'strongly connected components'.")
 
+    with timed(stats, 'search'):
+        return _connected_components(graph, stats)
+
+
+def _connected_components(graph, stats):
+    if isinstance(graph, CSRGraph):
+        return _connected_components_csr(graph, stats)
+    if getattr(graph, '_components', None) is not None:
+        # Graph.track_components() keeps these up to date, no traversal needed
+        return graph._components.components()
+
     if not graph.get_all_vertices():
         return []
 
+    get_neighbors = graph.get_neighbors if stats is None else CountingNeighbors(graph.get_neighbors)
+
     visited = set()
     components = []
 
@@ -35,18 +53,53 @@ def get_connected_components(graph):
             current_component_nodes = []
             # Using a utility from dfs.py (make sure dfs.py has dfs_recursive_util or adapt)
             # For simplicity, let's write a small traversal here:
-            q = [vertex]
+            q = deque([vertex])
             comp_visited_locally = {vertex}
             
             while q:
-                curr = q.pop(0) # BFS-like for component finding
+                curr = q.popleft() # BFS-like for component finding
                 current_component_nodes.append(curr)
                 visited.add(curr)
-                for neighbor, _ in graph.get_neighbors(curr):
+                for neighbor, _ in get_neighbors(curr):
                     if neighbor not in comp_visited_locally:
                         comp_visited_locally.add(neighbor)
                         q.append(neighbor)
             
             components.append(set(current_component_nodes))
-            
-    return components
\ No newline at end of file
+
+    if stats is not None:
+        stats.add('vertices_settled', get_neighbors.calls)
+        stats.add('edges_scanned', get_neighbors.edges)
+    return components
+
+
+def _connected_components_csr(graph, stats=None):
+    """
+    Connected components over the integer arrays of a CSRGraph.
+    Same result as get_connected_components().
+    """
+    labels, offsets, targets = graph.labels, graph.offsets, graph.targets
+    visited = bytearray(len(labels))
+    components = []
+
+    for vertex in range(len(labels)):
+        if visited[vertex]:
+            continue
+        visited[vertex] = 1
+        stack = [vertex]
+        component = set()
+        while stack:
+            curr = stack.pop()
+            component.add(labels[curr])
+            for k in range(offsets[curr], offsets[curr + 1]):
+                neighbor = targets[k]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    stack.append(neighbor)
+        components.append(component)
+
+    if stats is not None:
+        # Every vertex and every edge entry is visited once
+        stats.add('vertices_settled', len(labels))
+        stats.add('edges_scanned', len(targets))
+    return components
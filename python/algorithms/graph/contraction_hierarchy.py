@@ -0,0 +1,364 @@
+# graph_project/algorithms/contraction_hierarchy.py
+import heapq
+import pickle
+from array import array
+
+from datastructures.graph.csr_graph import CSRGraph
+from .stats import CountingCall, timed
+
+_FORMAT_VERSION = 1
+
+
+class ContractionHierarchy:
+    """
+    A contraction hierarchies (CH) index for fast repeated shortest-path
+    queries on a static graph with non-negative edge weights.
+
+    build() contracts the vertices one by one in order of importance, adding
+    a shortcut edge u -> w whenever removing v would break the only shortest
+    path u -> v -> w. Every vertex keeps its "upward" edges (towards vertices
+    contracted later), so a query only needs a small bidirectional search
+    over those edges. Shortcuts remember the vertex they bypass, which lets
+    query() unpack them back into a path of original vertices.
+    """
+
+    def __init__(self, labels, rank, forward, backward, directed):
+        """
+        Initializes the index from already-built parts.
+        Most callers should use ContractionHierarchy.build() or load().
+
+        Args:
+            labels (list): Vertex labels, indexed by vertex id.
+            rank (array): Contraction order position of every vertex id.
+            forward (tuple): (offsets, targets, weights, middles) arrays of the
+                             upward out-edges of every vertex.
+            backward (tuple): (offsets, targets, weights, middles) arrays of the
+                              upward in-edges of every vertex, stored reversed.
+            directed (bool): Whether the source graph was directed.
+        """
+        self.labels = labels
+        self.index = {label: i for i, label in enumerate(labels)}
+        self.rank = rank
+        self.forward = forward
+        self.backward = backward
+        self._directed = directed
+
+    @classmethod
+    def build(cls, graph, witness_settle_limit=500, stats=None):
+        """
+        Preprocesses a graph into a contraction hierarchy.
+
+        Args:
+            graph (Graph or CSRGraph): The graph. Edge weights must be non-negative.
+            witness_settle_limit (int): Maximum number of vertices settled by each
+                                        local witness search. Lower values build
+                                        faster but may add unneeded shortcuts.
+            stats (AlgorithmStats): Optional collector for work counters and phase times.
+
+        Returns:
+            ContractionHierarchy: The built index.
+        """
+        with timed(stats, 'setup'):
+            csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        n = csr.num_vertices
+
+        # Working adjacency of the not-yet-contracted graph:
+        # out_edges[u][w] = in_edges[w][u] = (weight, middle vertex id or -1)
+        out_edges = [dict() for _ in range(n)]
+        in_edges = [dict() for _ in range(n)]
+        offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+        for u in range(n):
+            for k in range(offsets[u], offsets[u + 1]):
+                w, weight = targets[k], weights[k]
+                if weight < 0:
+                    raise ValueError("Contraction hierarchies do not support negative edge weights.")
+                if u != w and (w not in out_edges[u] or weight < out_edges[u][w][0]):
+                    out_edges[u][w] = in_edges[w][u] = (weight, -1)
+
+        contracted = bytearray(n)
+        deleted_neighbors = [0] * n
+
+        def shortcuts_for(v):
+            """Returns the (u, w, weight) shortcuts needed to contract v."""
+            shortcuts = []
+            outgoing = [(w, entry[0]) for w, entry in out_edges[v].items()]
+            if not outgoing:
+                return shortcuts
+            max_out = max(weight for _, weight in outgoing)
+            for u, (in_weight, _) in in_edges[v].items():
+                limit = in_weight + max_out
+                witness = _witness_search(out_edges, u, v, limit, witness_settle_limit)
+                for w, out_weight in outgoing:
+                    if w == u:
+                        continue
+                    candidate = in_weight + out_weight
+                    if witness.get(w, float('inf')) > candidate:
+                        shortcuts.append((u, w, candidate))
+            return shortcuts
+
+        def priority(v, shortcuts):
+            edge_difference = len(shortcuts) - len(in_edges[v]) - len(out_edges[v])
+            return edge_difference + deleted_neighbors[v]
+
+        with timed(stats, 'ordering'):
+            queue = [(priority(v, shortcuts_for(v)), v) for v in range(n)]
+            heapq.heapify(queue)
+        push = heapq.heappush if stats is None else CountingCall(heapq.heappush)
+
+        rank = array('q', bytes(8 * n))
+        up_forward = [None] * n
+        up_backward = [None] * n
+        order = 0
+
+        with timed(stats, 'contraction'):
+            while queue:
+                _, v = heapq.heappop(queue)
+                if contracted[v]:
+                    continue
+                # Lazy update: re-check the priority against the next candidate
+                shortcuts = shortcuts_for(v)
+                current = priority(v, shortcuts)
+                if queue and current > queue[0][0]:
+                    push(queue, (current, v))
+                    continue
+
+                for u, w, weight in shortcuts:
+                    existing = out_edges[u].get(w)
+                    if existing is None or weight < existing[0]:
+                        out_edges[u][w] = in_edges[w][u] = (weight, v)
+
+                # Every remaining neighbor is contracted later, so these edges point upward
+                up_forward[v] = [(w, weight, middle) for w, (weight, middle) in out_edges[v].items()]
+                up_backward[v] = [(u, weight, middle) for u, (weight, middle) in in_edges[v].items()]
+                for w in out_edges[v]:
+                    del in_edges[w][v]
+                    deleted_neighbors[w] += 1
+                for u in in_edges[v]:
+                    del out_edges[u][v]
+                    deleted_neighbors[u] += 1
+                out_edges[v] = {}
+                in_edges[v] = {}
+
+                contracted[v] = 1
+                rank[v] = order
+                order += 1
+
+        if stats is not None:
+            # Every vertex is contracted once; the other pops were stale or re-pushed
+            stats.add('vertices_settled', n)
+            stats.add('heap_pushes', push.calls)
+            stats.add('heap_pops', n + push.calls)
+            stats.add('stale_pops', push.calls)
+
+        return cls(list(csr.labels), rank, _pack(up_forward, csr.weight_typecode),
+                   _pack(up_backward, csr.weight_typecode), csr._directed)
+
+    def query(self, start_vertex, end_vertex, stats=None):
+        """
+        Finds a shortest path between two vertices with a bidirectional
+        upward search, then unpacks the shortcuts on it.
+
+        Args:
+            start_vertex: The starting vertex.
+            end_vertex: The target vertex.
+            stats (AlgorithmStats): Optional collector for work counters and phase times.
+
+        Returns:
+            A tuple (distance, path):
+            - distance: The length of the shortest path, float('inf') if unreachable.
+            - path (list): The original vertices from start_vertex to end_vertex,
+                           or an empty list if there is no path.
+            Returns (None, None) if either vertex is not in the index.
+        """
+        s = self.index.get(start_vertex)
+        t = self.index.get(end_vertex)
+        if s is None or t is None:
+            return None, None
+        if s == t:
+            return 0, [start_vertex]
+
+        # Index 0 is the forward search from s, 1 the backward search from t
+        sides = (self.forward, self.backward)
+        distances = ({s: 0}, {t: 0})
+        # Vertex: (previous vertex, edge index) in the search tree of each side
+        parent_edges = ({s: None}, {t: None})
+        queues = ([(0, s)], [(0, t)])
+        best = float('inf')
+        meeting_vertex = -1
+        push, pop, scan = heapq.heappush, heapq.heappop, range
+        if stats is not None:
+            # Each call of scan expands one vertex
+            push, pop, scan = CountingCall(push), CountingCall(pop), CountingCall(range)
+
+        # Upward searches are small, so run them one after the other; the
+        # forward search is complete before the backward one checks meetings
+        with timed(stats, 'search'):
+            for side in (0, 1):
+                offsets, targets, weights, _ = sides[side]
+                dist, parents, queue = distances[side], parent_edges[side], queues[side]
+                other = distances[1 - side]
+                while queue:
+                    current_distance, current = pop(queue)
+                    if current_distance > dist[current]:
+                        continue
+                    if current_distance >= best:
+                        break
+                    if current in other and current_distance + other[current] < best:
+                        best = current_distance + other[current]
+                        meeting_vertex = current
+                    for k in scan(offsets[current], offsets[current + 1]):
+                        neighbor = targets[k]
+                        distance = current_distance + weights[k]
+                        if distance < dist.get(neighbor, float('inf')):
+                            dist[neighbor] = distance
+                            parents[neighbor] = (current, k)
+                            push(queue, (distance, neighbor))
+
+        if stats is not None:
+            stats.add('vertices_settled', scan.calls)
+            stats.add('relaxations', push.calls)
+            stats.add('heap_pushes', push.calls)
+            stats.add('heap_pops', pop.calls)
+        if meeting_vertex < 0:
+            return float('inf'), []
+
+        with timed(stats, 'unpack'):
+            path = self._unpack_side(0, parent_edges[0], meeting_vertex)[::-1]
+            path += self._unpack_side(1, parent_edges[1], meeting_vertex)[1:]
+            labels = self.labels
+            return best, [labels[v] for v in path]
+
+    def _unpack_side(self, side, parent_edges, vertex):
+        """
+        Walks one search tree from vertex back to its root, expanding every
+        shortcut on the way. Returns the ids in walk order (vertex first).
+        """
+        middles = (self.forward if side == 0 else self.backward)[3]
+        path = [vertex]
+        current = vertex
+        while parent_edges[current] is not None:
+            previous, k = parent_edges[current]
+            # An upward edge previous -> current of this side's search,
+            # i.e. the original direction is previous -> current for the
+            # forward side and current -> previous for the backward side
+            if side == 0:
+                segment = self._expand(previous, current, middles[k])
+                path.extend(reversed(segment[:-1]))
+            else:
+                segment = self._expand(current, previous, middles[k])
+                path.extend(segment[1:])
+            current = previous
+        return path
+
+    def _expand(self, u, w, middle):
+        """
+        Expands the edge u -> w (with the given middle vertex, -1 if original)
+        into the list of original vertex ids from u to w.
+        """
+        path = [u]
+        stack = [(u, w, middle)]
+        while stack:
+            a, b, mid = stack.pop()
+            if mid < 0:
+                path.append(b)
+                continue
+            # a -> mid was an upward in-edge of mid, mid -> b an upward out-edge
+            stack.append((mid, b, self._middle_of(self.forward, mid, b)))
+            stack.append((a, mid, self._middle_of(self.backward, mid, a)))
+        return path
+
+    @staticmethod
+    def _middle_of(side_arrays, vertex, neighbor):
+        offsets, targets, _, middles = side_arrays
+        for k in range(offsets[vertex], offsets[vertex + 1]):
+            if targets[k] == neighbor:
+                return middles[k]
+        raise ValueError("Corrupt contraction hierarchy: missing shortcut edge.")
+
+    @property
+    def num_shortcuts(self):
+        """The number of shortcut edges in the index."""
+        return sum(1 for m in self.forward[3] if m >= 0) + sum(1 for m in self.backward[3] if m >= 0)
+
+    def save(self, path):
+        """
+        Serializes the index to a file, so it can be reloaded with load()
+        instead of being rebuilt.
+
+        Args:
+            path (str): The file to write.
+        """
+        payload = {
+            'format_version': _FORMAT_VERSION,
+            'labels': self.labels,
+            'rank': self.rank,
+            'forward': self.forward,
+            'backward': self.backward,
+            'directed': self._directed,
+        }
+        with open(path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads an index written by save(). Only load files from trusted
+        sources: the format is based on pickle.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            ContractionHierarchy: The loaded index.
+        """
+        with open(path, 'rb') as f:
+            payload = pickle.load(f)
+        if payload.get('format_version') != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported contraction hierarchy format: {payload.get('format_version')!r}")
+        return cls(payload['labels'], payload['rank'], payload['forward'],
+                   payload['backward'], payload['directed'])
+
+
+def _witness_search(out_edges, source, excluded, limit, settle_limit):
+    """
+    Local Dijkstra from source that avoids the excluded vertex, giving up past
+    the distance limit or after settle_limit vertices.
+
+    Returns:
+        dict: Tentative distances of the vertices that were reached.
+    """
+    distances = {source: 0}
+    queue = [(0, source)]
+    settled = 0
+    while queue and settled < settle_limit:
+        current_distance, current = heapq.heappop(queue)
+        if current_distance > distances[current]:
+            continue
+        if current_distance > limit:
+            break
+        settled += 1
+        for neighbor, (weight, _) in out_edges[current].items():
+            if neighbor == excluded:
+                continue
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                heapq.heappush(queue, (distance, neighbor))
+    return distances
+
+
+def _pack(adjacency, weight_typecode):
+    """
+    Packs per-vertex [(target, weight, middle), ...] lists into CSR arrays.
+    """
+    offsets = array('q', [0])
+    targets = array('q')
+    weights = array(weight_typecode)
+    middles = array('q')
+    for edges in adjacency:
+        for target, weight, middle in edges:
+            targets.append(target)
+            weights.append(weight)
+            middles.append(middle)
+        offsets.append(len(targets))
+    return offsets, targets, weights, middles
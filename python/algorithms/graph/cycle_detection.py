@@ -1,25 +1,36 @@
 # graph_project/algorithms/cycle_detection.py
+from datastructures.graph.csr_graph import CSRGraph
+from .stats import CountingNeighbors, degree_sum, timed
 
-def _is_cyclic_util_directed(graph, vertex, visited, recursion_stack):
+def _is_cyclic_util_directed(graph, vertex, visited, recursion_stack, get_neighbors=None):
+    # Explicit-stack DFS: each frame holds a vertex and an iterator over its neighbors
+    get_neighbors = get_neighbors or graph.get_neighbors
     visited.add(vertex)
     recursion_stack.add(vertex)
+    stack = [(vertex, iter(get_neighbors(vertex)))]
 
-    for neighbor, weight in graph.get_neighbors(vertex):
-        if neighbor not in visited:
-            if _is_cyclic_util_directed(graph, neighbor, visited, recursion_stack):
+    while stack:
+        current, neighbors = stack[-1]
+        for neighbor, weight in neighbors:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                recursion_stack.add(neighbor)
+                stack.append((neighbor, iter(get_neighbors(neighbor))))
+                break
+            elif neighbor in recursion_stack: # Found a back edge
                 return True
-        elif neighbor in recursion_stack: # Found a back edge
-            return True
-    
-    recursion_stack.remove(vertex) # Backtrack
+        else:
+            recursion_stack.remove(current) # Backtrack
+            stack.pop()
     return False
 
-def has_cycle_directed(graph):
+def has_cycle_directed(graph, stats=None):
     """
-    Checks if a directed graph has a cycle using DFS.
+    Checks if a directed graph has a cycle using an iterative DFS.
 
     Args:
         graph (Graph): A directed Graph instance.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
 
     Returns:
         bool: True if the graph contains a cycle, False otherwise.
@@ -30,32 +41,49 @@ def has_cycle_directed(graph):
         # For now, let's proceed but note it's primarily for directed.
         pass
 
-    visited = set()
-    recursion_stack = set()
-    for vertex in graph.get_all_vertices():
-        if vertex not in visited:
-            if _is_cyclic_util_directed(graph, vertex, visited, recursion_stack):
-                return True
-    return False
+    with timed(stats, 'search'):
+        if isinstance(graph, CSRGraph):
+            return _has_cycle_directed_csr(graph, stats)
 
+        get_neighbors = graph.get_neighbors if stats is None else CountingNeighbors(graph.get_neighbors)
+        visited = set()
+        recursion_stack = set()
+        found = False
+        for vertex in graph.get_all_vertices():
+            if vertex not in visited:
+                if _is_cyclic_util_directed(graph, vertex, visited, recursion_stack, get_neighbors):
+                    found = True
+                    break
+        _add_expanded(stats, get_neighbors)
+        return found
 
-def _is_cyclic_util_undirected(graph, vertex, visited, parent):
+
+def _is_cyclic_util_undirected(graph, vertex, visited, parent, get_neighbors=None):
+    # Explicit-stack DFS: each frame holds a vertex, its parent and a neighbor iterator
+    get_neighbors = get_neighbors or graph.get_neighbors
     visited.add(vertex)
+    stack = [(vertex, parent, iter(get_neighbors(vertex)))]
 
-    for neighbor, weight in graph.get_neighbors(vertex):
-        if neighbor not in visited:
-            if _is_cyclic_util_undirected(graph, neighbor, visited, vertex):
+    while stack:
+        current, current_parent, neighbors = stack[-1]
+        for neighbor, weight in neighbors:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                stack.append((neighbor, current, iter(get_neighbors(neighbor))))
+                break
+            elif neighbor != current_parent: # Visited and not parent means a back edge
                 return True
-        elif neighbor != parent: # Visited and not parent means a back edge
-            return True
+        else:
+            stack.pop()
     return False
 
-def has_cycle_undirected(graph):
+def has_cycle_undirected(graph, stats=None):
     """
-    Checks if an undirected graph has a cycle using DFS.
+    Checks if an undirected graph has a cycle using an iterative DFS.
 
     Args:
         graph (Graph): An undirected Graph instance.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
 
     Returns:
         bool: True if the graph contains a cycle, False otherwise.
@@ -63,19 +91,99 @@ def has_cycle_undirected(graph):
     if graph._directed:
         raise TypeError("Use has_cycle_directed for directed graphs.")
 
-    visited = set()
-    for vertex in graph.get_all_vertices():
-        if vertex not in visited:
-            # For undirected graphs, parent is initially None or a marker
-            if _is_cyclic_util_undirected(graph, vertex, visited, None):
+    with timed(stats, 'search'):
+        if isinstance(graph, CSRGraph):
+            return _has_cycle_undirected_csr(graph, stats)
+
+        get_neighbors = graph.get_neighbors if stats is None else CountingNeighbors(graph.get_neighbors)
+        visited = set()
+        found = False
+        for vertex in graph.get_all_vertices():
+            if vertex not in visited:
+                # For undirected graphs, parent is initially None or a marker
+                if _is_cyclic_util_undirected(graph, vertex, visited, None, get_neighbors):
+                    found = True
+                    break
+        _add_expanded(stats, get_neighbors)
+        return found
+
+def _add_expanded(stats, get_neighbors):
+    if stats is not None:
+        stats.add('vertices_settled', get_neighbors.calls)
+        stats.add('edges_scanned', get_neighbors.edges)
+
+def _add_visited_csr(stats, offsets, visited):
+    # Counted like the Graph path: every visited vertex with all of its edges
+    if stats is not None:
+        ids = [v for v in range(len(visited)) if visited[v]]
+        stats.add('vertices_settled', len(ids))
+        stats.add('edges_scanned', degree_sum(offsets, ids))
+
+def _has_cycle_directed_csr(graph, stats=None):
+    """
+    Directed cycle check over the integer arrays of a CSRGraph,
+    using an explicit stack of (vertex, next edge offset) frames.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    # 0 = unvisited, 1 = on the recursion stack, 2 = finished
+    state = bytearray(graph.num_vertices)
+
+    for root in range(graph.num_vertices):
+        if state[root]:
+            continue
+        state[root] = 1
+        stack = [(root, offsets[root])]
+        while stack:
+            vertex, k = stack[-1]
+            if k == offsets[vertex + 1]:
+                state[vertex] = 2
+                stack.pop()
+                continue
+            stack[-1] = (vertex, k + 1)
+            neighbor = targets[k]
+            if state[neighbor] == 1: # Found a back edge
+                _add_visited_csr(stats, offsets, state)
+                return True
+            if state[neighbor] == 0:
+                state[neighbor] = 1
+                stack.append((neighbor, offsets[neighbor]))
+    _add_visited_csr(stats, offsets, state)
+    return False
+
+def _has_cycle_undirected_csr(graph, stats=None):
+    """
+    Undirected cycle check over the integer arrays of a CSRGraph,
+    using an explicit stack of (vertex, parent, next edge offset) frames.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.num_vertices)
+
+    for root in range(graph.num_vertices):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        stack = [(root, -1, offsets[root])]
+        while stack:
+            vertex, parent, k = stack[-1]
+            if k == offsets[vertex + 1]:
+                stack.pop()
+                continue
+            stack[-1] = (vertex, parent, k + 1)
+            neighbor = targets[k]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                stack.append((neighbor, vertex, offsets[neighbor]))
+            elif neighbor != parent: # Visited and not parent means a back edge
+                _add_visited_csr(stats, offsets, visited)
                 return True
+    _add_visited_csr(stats, offsets, visited)
     return False
 
-def has_cycle(graph):
+def has_cycle(graph, stats=None):
     """
     Generic cycle detection. Calls the appropriate specific function.
     """
     if graph._directed:
-        return has_cycle_directed(graph)
+        return has_cycle_directed(graph, stats)
     else:
-        return has_cycle_undirected(graph)
\ No newline at end of file
+        return has_cycle_undirected(graph, stats)
\ No newline at end of file
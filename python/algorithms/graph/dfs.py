@@ -1,6 +1,9 @@
 # graph_project/algorithms/dfs.py
+from datastructures.graph.csr_graph import CSRGraph
+from ._traversal import adjacency_view
+from .stats import CountingNeighbors, degree_sum, timed
 
-def dfs(graph, start_vertex):
+def dfs(graph, start_vertex, stats=None):
     """
     Performs a Depth-First Search on the graph starting from start_vertex.
     This is an iterative version using a stack.
@@ -8,52 +11,179 @@ def dfs(graph, start_vertex):
     Args:
         graph (Graph): An instance of the Graph class.
         start_vertex: The vertex to start the DFS from.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
 
     Returns:
         A list of vertices in the order they were visited (one possible DFS order).
         Returns an empty list if the start_vertex is not in the graph.
     """
-    if start_vertex not in graph.get_all_vertices():
+    if isinstance(graph, CSRGraph):
+        return _dfs_csr(graph, start_vertex, stats)
+
+    if start_vertex not in graph:
         return []
 
+    get_neighbors = graph.get_neighbors if stats is None else CountingNeighbors(graph.get_neighbors)
     visited = set()
     stack = [start_vertex]
     order_visited = []
 
-    while stack:
-        vertex = stack.pop()
-        if vertex not in visited:
-            visited.add(vertex)
-            order_visited.append(vertex)
-            # Add neighbors to stack (in reverse order to process them "left-to-right" typically)
-            # Neighbors are tuples (neighbor, weight)
-            for neighbor, weight in reversed(graph.get_neighbors(vertex)):
-                if neighbor not in visited:
-                    stack.append(neighbor)
+    with timed(stats, 'search'):
+        while stack:
+            vertex = stack.pop()
+            if vertex not in visited:
+                visited.add(vertex)
+                order_visited.append(vertex)
+                # Add neighbors to stack (in reverse order to process them "left-to-right" typically)
+                # Neighbors are tuples (neighbor, weight)
+                for neighbor, weight in reversed(get_neighbors(vertex)):
+                    if neighbor not in visited:
+                        stack.append(neighbor)
+
+    if stats is not None:
+        stats.add('vertices_settled', get_neighbors.calls)
+        stats.add('edges_scanned', get_neighbors.edges)
     return order_visited
 
-def dfs_recursive_util(graph, vertex, visited, path):
+def _dfs_csr(graph, start_vertex, stats=None):
+    """
+    Iterative DFS over the integer arrays of a CSRGraph. Same result as dfs().
+    """
+    start = graph.index.get(start_vertex)
+    if start is None:
+        return []
+
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(graph.num_vertices)
+    stack = [start]
+    order_visited = []
+
+    with timed(stats, 'search'):
+        while stack:
+            vertex = stack.pop()
+            if not visited[vertex]:
+                visited[vertex] = 1
+                order_visited.append(vertex)
+                for k in range(offsets[vertex + 1] - 1, offsets[vertex] - 1, -1):
+                    neighbor = targets[k]
+                    if not visited[neighbor]:
+                        stack.append(neighbor)
+
+    if stats is not None:
+        stats.add('vertices_settled', len(order_visited))
+        stats.add('edges_scanned', degree_sum(offsets, order_visited))
+    labels = graph.labels
+    return [labels[i] for i in order_visited]
+
+def dfs_recursive_util(graph, vertex, visited, path, stats=None):
+    """
+    Appends the vertices reachable from vertex to path in recursive DFS
+    preorder. Recursion is emulated with an explicit stack of neighbor
+    iterators, so arbitrarily deep graphs never hit RecursionError.
+    """
+    get_neighbors = graph.get_neighbors if stats is None else CountingNeighbors(graph.get_neighbors)
     visited.add(vertex)
     path.append(vertex)
-    for neighbor, weight in graph.get_neighbors(vertex):
-        if neighbor not in visited:
-            dfs_recursive_util(graph, neighbor, visited, path)
+    stack = [iter(get_neighbors(vertex))]
+    while stack:
+        for neighbor, weight in stack[-1]:
+            if neighbor not in visited:
+                visited.add(neighbor)
+                path.append(neighbor)
+                stack.append(iter(get_neighbors(neighbor)))
+                break
+        else:
+            stack.pop() # All neighbors done, backtrack
+
+    if stats is not None:
+        stats.add('vertices_settled', get_neighbors.calls)
+        stats.add('edges_scanned', get_neighbors.edges)
 
-def dfs_recursive(graph, start_vertex):
+def dfs_recursive(graph, start_vertex, stats=None):
     """
-    Performs a Depth-First Search on the graph starting from start_vertex (recursive).
+    Performs a Depth-First Search on the graph starting from start_vertex,
+    visiting vertices in the order of the recursive formulation
+    (see dfs_recursive_util; no Python recursion is used).
 
     Args:
         graph (Graph): An instance of the Graph class.
         start_vertex: The vertex to start the DFS from.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
 
     Returns:
         A list of vertices in one possible DFS traversal order.
     """
-    if start_vertex not in graph.get_all_vertices():
+    if start_vertex not in graph:
         return []
     
     visited = set()
     path = []
-    dfs_recursive_util(graph, start_vertex, visited, path)
-    return path
\ No newline at end of file
+    with timed(stats, 'search'):
+        dfs_recursive_util(graph, start_vertex, visited, path, stats)
+    return path
+
+def iter_dfs(graph, start_vertex, max_depth=None, stop_when=None, details=False, stats=None):
+    """
+    Lazily yields the vertices of a Depth-First Search in preorder, in the
+    same order as dfs_recursive(). Only the part of the graph that is
+    actually consumed gets explored.
+
+    Args:
+        graph (Graph or CSRGraph): The graph.
+        start_vertex: The vertex to start the DFS from.
+        max_depth (int): If given, the search does not descend more than
+                         max_depth edges below start_vertex. As in any
+                         depth-limited DFS, a vertex first reached through
+                         a long path is not revisited through a shorter one.
+        stop_when (callable): Optional predicate called with every visited
+                              vertex; the search ends right after the first
+                              vertex for which it returns True.
+        details (bool): If True, yield (vertex, depth, parent, weight) tuples,
+                        where depth is measured along the DFS tree and weight
+                        is that of the edge parent -> vertex (parent and
+                        weight are None for start_vertex).
+        stats (AlgorithmStats): Optional collector for the vertices expanded
+                                and edges scanned, added when the iteration
+                                ends, even if it is stopped early.
+
+    Yields:
+        Vertices, or (vertex, depth, parent, weight) tuples.
+        Nothing is yielded if start_vertex is not in the graph.
+    """
+    if start_vertex not in graph:
+        return
+    neighbors, key_of, label_of = adjacency_view(graph)
+    if stats is not None:
+        neighbors = CountingNeighbors(lambda key, view=neighbors: list(view(key)))
+    start = key_of(start_vertex)
+
+    # Runs even when the caller stops iterating early
+    try:
+        yield (start_vertex, 0, None, None) if details else start_vertex
+        if (stop_when is not None and stop_when(start_vertex)) or max_depth == 0:
+            return
+
+        visited = {start}
+        # Frames are (vertex key, neighbor iterator); the depth of a frame's
+        # neighbors is the stack height
+        stack = [(start, iter(neighbors(start)))]
+        while stack:
+            current, candidates = stack[-1]
+            for neighbor, weight in candidates:
+                if neighbor in visited:
+                    continue
+                visited.add(neighbor)
+                vertex = label_of(neighbor)
+                depth = len(stack)
+                yield (vertex, depth, label_of(current), weight) if details else vertex
+                if stop_when is not None and stop_when(vertex):
+                    return
+                if max_depth is None or depth < max_depth:
+                    stack.append((neighbor, iter(neighbors(neighbor))))
+                    break
+            else:
+                stack.pop() # All neighbors done, backtrack
+    finally:
+        if stats is not None:
+            stats.add('vertices_settled', neighbors.calls)
+            stats.add('edges_scanned', neighbors.edges)
@@ -1,7 +1,10 @@
 # graph_project/algorithms/dijkstra.py
 import heapq
 
-def dijkstra(graph, start_vertex):
+from datastructures.graph.csr_graph import CSRGraph
+from .stats import CountingCall, CountingNeighbors, degree_sum, timed
+
+def dijkstra(graph, start_vertex, stats=None):
     """
     Implements Dijkstra's algorithm to find the shortest paths from a single source
     to all other vertices in a weighted graph with non-negative edge weights.
@@ -9,6 +12,7 @@ def dijkstra(graph, start_vertex):
     Args:
         graph (Graph): An instance of the Graph class. Edge weights must be non-negative.
         start_vertex: The starting vertex.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
 
     Returns:
         A tuple (distances, predecessors):
@@ -18,36 +22,175 @@ def dijkstra(graph, start_vertex):
                                on the shortest path from the start_vertex.
         Returns (None, None) if start_vertex is not in graph.
     """
-    if start_vertex not in graph.get_all_vertices():
-        return None, None
+    if isinstance(graph, CSRGraph):
+        return _dijkstra_csr(graph, [start_vertex], stats)
+    return _dijkstra_from(graph, [start_vertex], stats)
+
+def multi_source_dijkstra(graph, sources, stats=None):
+    """
+    Runs a single Dijkstra seeded from a set of sources at distance 0, so every
+    vertex gets its distance to the nearest source (nearest-facility queries).
+
+    Args:
+        graph (Graph): An instance of the Graph class. Edge weights must be non-negative.
+        sources (iterable): The source vertices.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
+
+    Returns:
+        A tuple (distances, predecessors, nearest):
+        - distances (dict): Distance from each vertex to its nearest source.
+                            Unreachable vertices will have float('inf').
+        - predecessors (dict): Predecessor on the shortest path from the nearest
+                               source (None for sources and unreachable vertices).
+        - nearest (dict): The nearest source of each vertex (None if unreachable).
+        Returns (None, None, None) if no source is in the graph.
+    """
+    sources = list(dict.fromkeys(sources))
+    if isinstance(graph, CSRGraph):
+        distances, predecessors = _dijkstra_csr(graph, sources, stats)
+    else:
+        distances, predecessors = _dijkstra_from(graph, sources, stats)
+    if distances is None:
+        return None, None, None
+    return distances, predecessors, _nearest_sources(distances, predecessors)
+
+def _dijkstra_from(graph, sources, stats=None):
+    """
+    Dijkstra over a Graph seeded with every source in `sources` at distance 0.
+    Sources that are not in the graph are ignored.
+    """
+    # With stats enabled, counting wrappers replace these; otherwise the
+    # plain functions run and nothing is counted
+    get_neighbors = graph.get_neighbors
+    push = heapq.heappush
+    if stats is not None:
+        get_neighbors = CountingNeighbors(get_neighbors)
+        push = CountingCall(push)
+
+    vertices = graph.get_all_vertices()
+    distances = dict.fromkeys(vertices, float('inf'))
+    predecessors = dict.fromkeys(vertices)
 
-    distances = {vertex: float('inf') for vertex in graph.get_all_vertices()}
-    predecessors = {vertex: None for vertex in graph.get_all_vertices()}
-    distances[start_vertex] = 0
-    
     # Priority queue stores (distance, vertex)
-    priority_queue = [(0, start_vertex)]
+    priority_queue = []
+    for source in sources:
+        if source in distances:
+            distances[source] = 0
+            priority_queue.append((0, source))
+    if not priority_queue:
+        return None, None
+    seeded = len(priority_queue)
 
-    while priority_queue:
-        current_distance, current_vertex = heapq.heappop(priority_queue)
+    with timed(stats, 'search'):
+        while priority_queue:
+            current_distance, current_vertex = heapq.heappop(priority_queue)
 
-        # If we found a shorter path already, skip
-        if current_distance > distances[current_vertex]:
-            continue
+            # If we found a shorter path already, skip
+            if current_distance > distances[current_vertex]:
+                continue
+
+            # Neighbors are (neighbor, weight)
+            for neighbor, weight in get_neighbors(current_vertex):
+                if weight < 0:
+                    raise ValueError("Dijkstra's algorithm does not support negative edge weights.")
+
+                distance = current_distance + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    predecessors[neighbor] = current_vertex
+                    push(priority_queue, (distance, neighbor))
+
+    if stats is not None:
+        # Every improvement pushes, and the queue is drained completely
+        stats.add_search(get_neighbors.calls, get_neighbors.edges, push.calls,
+                         push.calls, seeded + push.calls)
+    return distances, predecessors
 
-        # Neighbors are (neighbor, weight)
-        for neighbor, weight in graph.get_neighbors(current_vertex):
-            if weight < 0:
-                raise ValueError("Dijkstra's algorithm does not support negative edge weights.")
-            
-            distance = current_distance + weight
-            if distance < distances[neighbor]:
-                distances[neighbor] = distance
-                predecessors[neighbor] = current_vertex
-                heapq.heappush(priority_queue, (distance, neighbor))
-                
+def _dijkstra_csr(graph, sources, stats=None):
+    """
+    Dijkstra over the integer arrays of a CSRGraph. Same result as dijkstra().
+    """
+    source_ids = [graph.index[s] for s in sources if s in graph.index]
+    if not source_ids:
+        return None, None
+
+    dist, pred = _dijkstra_ids(graph.offsets, graph.targets, graph.weights, source_ids, stats)
+    with timed(stats, 'output'):
+        return _map_back(graph.labels, dist, pred)
+
+def _dijkstra_ids(offsets, targets, weights, source_ids, stats=None):
+    """
+    Dijkstra on raw CSR buffers, seeded with every id in source_ids.
+
+    Returns:
+        A tuple (dist, pred) of id-indexed lists; pred is -1 for no predecessor.
+    """
+    n = len(offsets) - 1
+    inf = float('inf')
+    dist = [inf] * n
+    pred = [-1] * n
+    push = heapq.heappush if stats is None else CountingCall(heapq.heappush)
+
+    priority_queue = []
+    for source in source_ids:
+        dist[source] = 0
+        priority_queue.append((0, source))
+    seeded = len(priority_queue)
+
+    with timed(stats, 'search'):
+        while priority_queue:
+            current_distance, current = heapq.heappop(priority_queue)
+            if current_distance > dist[current]:
+                continue
+
+            for k in range(offsets[current], offsets[current + 1]):
+                weight = weights[k]
+                if weight < 0:
+                    raise ValueError("Dijkstra's algorithm does not support negative edge weights.")
+
+                neighbor = targets[k]
+                distance = current_distance + weight
+                if distance < dist[neighbor]:
+                    dist[neighbor] = distance
+                    pred[neighbor] = current
+                    push(priority_queue, (distance, neighbor))
+
+    if stats is not None:
+        # Every reachable vertex is settled exactly once
+        settled = [i for i in range(n) if dist[i] != inf]
+        stats.add_search(len(settled), degree_sum(offsets, settled), push.calls,
+                         push.calls, seeded + push.calls)
+    return dist, pred
+
+def _map_back(labels, dist, pred):
+    """
+    Converts id-indexed distance/predecessor lists into label-keyed dicts.
+    """
+    distances = dict(zip(labels, dist))
+    predecessors = {labels[i]: (labels[p] if p >= 0 else None) for i, p in enumerate(pred)}
     return distances, predecessors
 
+def _nearest_sources(distances, predecessors):
+    """
+    Follows the predecessor tree of a multi-source run back to its roots,
+    memoizing along the way so the whole pass is linear.
+    """
+    nearest = {}
+    for vertex in predecessors:
+        if vertex in nearest:
+            continue
+        chain = []
+        current = vertex
+        while current not in nearest and predecessors[current] is not None:
+            chain.append(current)
+            current = predecessors[current]
+        if current not in nearest:
+            nearest[current] = current if distances[current] == 0 else None
+        root = nearest[current]
+        for v in chain:
+            nearest[v] = root
+    return nearest
+
 def get_shortest_path(predecessors, start_vertex, end_vertex):
     """
     Reconstructs the shortest path from start_vertex to end_vertex
@@ -0,0 +1,137 @@
+# graph_project/algorithms/dijkstra_batch.py
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+
+from datastructures.graph.csr_graph import CSRGraph
+from ._shared_buffers import attach_buffers, share_buffers
+from .dijkstra import _dijkstra_ids, _map_back
+from .stats import AlgorithmStats
+
+# Read-only CSR buffers of the graph, attached once per worker process
+_worker_buffers = None
+
+
+def dijkstra_many(graph, sources, workers=None, stats=None):
+    """
+    Runs Dijkstra from many sources across a pool of worker processes.
+
+    The graph is frozen into CSR form and copied once into a shared memory
+    block that every worker maps read-only, so it is never pickled per task.
+    Results are yielded as soon as each source finishes, in completion order.
+
+    Args:
+        graph (Graph or CSRGraph): The graph. Edge weights must be non-negative.
+        sources (iterable): The source vertices. Sources not in the graph are skipped.
+        workers (int): Number of worker processes (default: os.cpu_count()).
+                       With workers=1 everything runs in the calling process.
+        stats (AlgorithmStats): Optional collector for work counters and phase
+                                times. Workers collect their own and the totals
+                                are merged in as each result arrives.
+
+    Yields:
+        Tuples (source, distances, predecessors) shaped like dijkstra() results.
+    """
+    csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+    source_ids = [csr.index[s] for s in dict.fromkeys(sources) if s in csr.index]
+    if not source_ids:
+        return
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        for source_id in source_ids:
+            dist, pred = _dijkstra_ids(csr.offsets, csr.targets, csr.weights, [source_id], stats)
+            yield (csr.labels[source_id],) + _map_back(csr.labels, dist, pred)
+        return
+
+    with _shared_pool(csr.offsets, csr.targets, csr.weights, min(workers, len(source_ids))) as executor:
+        collect = stats is not None
+        futures = [executor.submit(_run_source, source_id, collect) for source_id in source_ids]
+        integral = csr.weight_typecode == 'q'
+        for future in as_completed(futures):
+            source_id, dist_bytes, pred_bytes, worker_stats = future.result()
+            if worker_stats is not None:
+                stats.merge(worker_stats)
+            yield (csr.labels[source_id],) + _decode_result(csr.labels, dist_bytes,
+                                                            pred_bytes, integral)
+
+
+def _distance_rows(offsets, targets, weights, source_ids, workers=None, stats=None):
+    """
+    Like dijkstra_many, but on raw CSR buffers and yielding only the distances:
+    (source_id, dist) pairs in completion order, dist being an array('d')
+    indexed by vertex id. Used by all_pairs_shortest_paths.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(source_ids) <= 1:
+        for source_id in source_ids:
+            dist, _ = _dijkstra_ids(offsets, targets, weights, [source_id], stats)
+            yield source_id, array('d', dist)
+        return
+
+    with _shared_pool(offsets, targets, weights, min(workers, len(source_ids))) as executor:
+        collect = stats is not None
+        futures = [executor.submit(_run_source, source_id, collect, False) for source_id in source_ids]
+        for future in as_completed(futures):
+            source_id, dist_bytes, _, worker_stats = future.result()
+            if worker_stats is not None:
+                stats.merge(worker_stats)
+            dist = array('d')
+            dist.frombytes(dist_bytes)
+            yield source_id, dist
+
+
+@contextmanager
+def _shared_pool(offsets, targets, weights, workers):
+    """
+    A process pool whose workers all map one shared copy of the CSR buffers.
+    """
+    shm, layout = share_buffers([offsets, targets, weights])
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_attach_worker,
+                                   initargs=(shm.name, layout))
+    try:
+        yield executor
+    finally:
+        # Also reached when the caller stops iterating early
+        executor.shutdown(wait=True, cancel_futures=True)
+        shm.close()
+        shm.unlink()
+
+
+def _attach_worker(name, layout):
+    """
+    Worker initializer: maps the shared CSR buffers as typed memoryviews.
+    """
+    global _worker_buffers
+    shm, (offsets, targets, weights) = attach_buffers(name, layout)
+    # Keep the SharedMemory object alive for as long as the views are used
+    _worker_buffers = (shm, offsets, targets, weights)
+
+
+def _run_source(source_id, collect_stats=False, with_predecessors=True):
+    """
+    Worker task: runs one Dijkstra and returns the id-indexed result as packed
+    bytes (predecessors None unless with_predecessors), plus its
+    AlgorithmStats if collect_stats is set.
+    """
+    _, offsets, targets, weights = _worker_buffers
+    stats = AlgorithmStats() if collect_stats else None
+    dist, pred = _dijkstra_ids(offsets, targets, weights, [source_id], stats)
+    pred_bytes = array('q', pred).tobytes() if with_predecessors else None
+    return source_id, array('d', dist).tobytes(), pred_bytes, stats
+
+
+def _decode_result(labels, dist_bytes, pred_bytes, integral):
+    """
+    Unpacks a worker result into (distances, predecessors) dicts.
+    """
+    dist = array('d')
+    dist.frombytes(dist_bytes)
+    pred = array('q')
+    pred.frombytes(pred_bytes)
+    inf = float('inf')
+    dist = [int(d) if integral and d != inf else d for d in dist]
+    return _map_back(labels, dist, pred)
@@ -0,0 +1,199 @@
+# graph_project/algorithms/dynamic_sssp.py
+import heapq
+
+from .dijkstra import dijkstra, get_shortest_path
+from .stats import CountingCall, CountingNeighbors, timed
+
+
+class DynamicSSSP:
+    """
+    Keeps the shortest paths from one source up to date while a Graph
+    changes, instead of rerunning dijkstra after every change.
+
+    Adding an edge or lowering a weight can only shorten paths, and only
+    through the changed edge, so the repair is a Dijkstra seeded at the far
+    end of that edge which stops wherever distances stop improving. Removing
+    an edge or raising its weight can lengthen paths and triggers a full
+    recomputation, unless the edge is not in the current shortest-path tree,
+    in which case no distance changes at all.
+
+    Apply changes through add_edge, set_weight and remove_edge here so they
+    are seen. If the graph is mutated directly, the next update notices the
+    changed graph.version and recomputes from scratch first.
+    """
+
+    def __init__(self, graph, source, stats=None):
+        """
+        Computes the initial shortest paths.
+
+        Args:
+            graph (Graph): The graph. Edge weights must be non-negative.
+            source: The source vertex.
+            stats (AlgorithmStats): Optional collector for the work of every
+                                    recomputation and repair.
+        """
+        if source not in graph:
+            raise ValueError(f"Source vertex {source!r} is not in the graph.")
+        self.graph = graph
+        self.source = source
+        self.algorithm_stats = stats
+        self.distances, self.predecessors = dijkstra(graph, source, stats)
+        self._version = graph.version
+        self.last_touched = 0  # Vertices whose distance the last update recomputed or improved
+        self.total_touched = 0
+        self.updates = 0
+        self.repairs = 0
+        self.recomputations = 0
+
+    def add_edge(self, vertex1, vertex2, weight=1):
+        """
+        Adds an edge to the graph (see Graph.add_edge) and repairs the
+        paths it shortens. Adding an edge that already exists changes nothing.
+
+        Returns:
+            int: The number of vertices whose distance changed.
+        """
+        if weight < 0:
+            raise ValueError("DynamicSSSP does not support negative edge weights.")
+        self._sync()
+        self.graph.add_edge(vertex1, vertex2, weight)
+        for vertex in (vertex1, vertex2):
+            if vertex not in self.distances:
+                self.distances[vertex] = float('inf')
+                self.predecessors[vertex] = None
+        # add_edge keeps the old weight of an existing edge
+        return self._finish(self._repair(vertex1, vertex2, self.graph.get_weight(vertex1, vertex2)))
+
+    def set_weight(self, vertex1, vertex2, weight):
+        """
+        Changes the weight of an existing edge (see Graph.set_weight) and
+        updates the distances: a local repair if the weight decreased, a full
+        recomputation if a shortest-path tree edge got heavier.
+
+        Returns:
+            int: The number of vertices touched by the update.
+        """
+        if weight < 0:
+            raise ValueError("DynamicSSSP does not support negative edge weights.")
+        self._sync()
+        old_weight = self.graph.get_weight(vertex1, vertex2)
+        self.graph.set_weight(vertex1, vertex2, weight)
+        if weight < old_weight:
+            touched = self._repair(vertex1, vertex2, weight)
+        elif weight > old_weight and self._in_tree(vertex1, vertex2):
+            touched = self._recompute()
+        else:
+            touched = 0
+        return self._finish(touched)
+
+    def remove_edge(self, vertex1, vertex2):
+        """
+        Removes an edge from the graph (see Graph.remove_edge), recomputing
+        the distances if it was a shortest-path tree edge.
+
+        Returns:
+            int: The number of vertices touched by the update.
+        """
+        self._sync()
+        self.graph.remove_edge(vertex1, vertex2)
+        touched = self._recompute() if self._in_tree(vertex1, vertex2) else 0
+        return self._finish(touched)
+
+    def path_to(self, vertex):
+        """
+        Returns the current shortest path from the source to vertex as a list,
+        or an empty list if it is unreachable.
+        """
+        return get_shortest_path(self.predecessors, self.source, vertex)
+
+    def stats(self):
+        """
+        Returns the update counters as a dict.
+        """
+        return {
+            'updates': self.updates,
+            'repairs': self.repairs,
+            'recomputations': self.recomputations,
+            'last_touched': self.last_touched,
+            'total_touched': self.total_touched,
+        }
+
+    def _sync(self):
+        if self.graph.version != self._version:
+            self._recompute()
+
+    def _finish(self, touched):
+        self._version = self.graph.version
+        self.last_touched = touched
+        self.total_touched += touched
+        self.updates += 1
+        return touched
+
+    def _in_tree(self, vertex1, vertex2):
+        """
+        Checks whether the edge is in the shortest-path tree, in either
+        direction for undirected graphs.
+        """
+        if self.predecessors.get(vertex2) == vertex1:
+            return True
+        return not self.graph._directed and self.predecessors.get(vertex1) == vertex2
+
+    def _recompute(self):
+        self.distances, self.predecessors = dijkstra(self.graph, self.source, self.algorithm_stats)
+        if self.distances is None:
+            raise ValueError(f"Source vertex {self.source!r} is no longer in the graph.")
+        self._version = self.graph.version
+        self.recomputations += 1
+        return len(self.distances)
+
+    def _repair(self, vertex1, vertex2, weight):
+        """
+        Propagates the improvements made possible by an edge of the given
+        weight between vertex1 and vertex2 that is new or got lighter.
+
+        Returns:
+            int: The number of vertices whose distance improved.
+        """
+        stats = self.algorithm_stats
+        distances, predecessors = self.distances, self.predecessors
+        get_neighbors = self.graph.get_neighbors
+        push = heapq.heappush
+        if stats is not None:
+            get_neighbors = CountingNeighbors(get_neighbors)
+            push = CountingCall(push)
+
+        priority_queue = []
+        ends = [(vertex1, vertex2)]
+        if not self.graph._directed:
+            ends.append((vertex2, vertex1))
+        for tail, head in ends:
+            distance = distances[tail] + weight
+            if distance < distances[head]:
+                distances[head] = distance
+                predecessors[head] = tail
+                push(priority_queue, (distance, head))
+        if not priority_queue:
+            return 0
+
+        self.repairs += 1
+        improved = 0
+        with timed(stats, 'repair'):
+            while priority_queue:
+                current_distance, current_vertex = heapq.heappop(priority_queue)
+                if current_distance > distances[current_vertex]:
+                    continue
+                improved += 1
+
+                for neighbor, edge_weight in get_neighbors(current_vertex):
+                    if edge_weight < 0:
+                        raise ValueError("DynamicSSSP does not support negative edge weights.")
+                    distance = current_distance + edge_weight
+                    if distance < distances[neighbor]:
+                        distances[neighbor] = distance
+                        predecessors[neighbor] = current_vertex
+                        push(priority_queue, (distance, neighbor))
+
+        if stats is not None:
+            # Every push improved a distance, and the queue is drained completely
+            stats.add_search(improved, get_neighbors.edges, push.calls, push.calls, push.calls)
+        return improved
@@ -1,14 +1,105 @@
-def graph_coloring(graph):
+import heapq
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from datastructures.graph.csr_graph import CSRGraph
+from ._shared_buffers import attach_buffers, share_buffers
+from .stats import CountingCall, timed
+
+STRATEGIES = ('insertion', 'largest_first', 'smallest_last', 'dsatur', 'jones_plassmann')
+
+# Shared (offsets, targets, priorities, colors) views, attached once per worker process
+_worker_buffers = None
+
+
+def graph_coloring(graph, strategy='insertion', workers=None, seed=0, stats=None):
     """
     Implements the Greedy Graph Coloring algorithm to color the vertices of a graph.
     Ensures no two adjacent vertices have the same color.
 
+    The order in which vertices are colored decides how many colors are used:
+    - 'insertion' (default): vertices in insertion order.
+    - 'largest_first': Welsh-Powell, vertices by decreasing degree.
+    - 'smallest_last': repeatedly removes a minimum-degree vertex and colors
+      in reverse removal order; optimal on trees and good on sparse graphs.
+    - 'dsatur': always colors the vertex with the most distinct neighbor
+      colors (ties by degree), using a lazy heap as the saturation queue.
+      Usually the fewest colors.
+    - 'jones_plassmann': parallel coloring in rounds; each round colors every
+      vertex whose random priority beats all its uncolored neighbors, split
+      across `workers` processes. Meant for very large sparse graphs.
+
+    Coloring follows get_neighbors, so it is meant for undirected graphs.
+
     Args:
         graph (Graph): An instance of the Graph class.
+        strategy (str): One of STRATEGIES.
+        workers (int): Worker processes for 'jones_plassmann'
+                       (default: os.cpu_count(); 1 runs in-process).
+        seed (int): Seed of the random priorities of 'jones_plassmann'.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
 
     Returns:
         dict: A dictionary mapping each vertex to its assigned color.
     """
+    return graph_coloring_with_stats(graph, strategy, workers, seed, stats)[0]
+
+
+def graph_coloring_with_stats(graph, strategy='insertion', workers=None, seed=0, stats=None):
+    """
+    Runs graph_coloring and also reports how well and how fast it did.
+    The optional AlgorithmStats collector is filled as in graph_coloring.
+
+    Returns:
+        A tuple (color_assignment, summary) where summary is a dict with the
+        strategy, num_colors and seconds taken ('jones_plassmann' also
+        reports the number of rounds).
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy!r}; expected one of {STRATEGIES}.")
+
+    started = time.perf_counter()
+    summary = {'strategy': strategy}
+    if strategy == 'insertion':
+        with timed(stats, 'search'):
+            color_assignment = _insertion_coloring(graph)
+    else:
+        with timed(stats, 'setup'):
+            csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        with timed(stats, 'search'):
+            if strategy == 'largest_first':
+                colors = _largest_first(csr)
+            elif strategy == 'smallest_last':
+                colors = _smallest_last(csr)
+            elif strategy == 'dsatur':
+                colors = _dsatur(csr, stats)
+            else:
+                colors, summary['rounds'] = _jones_plassmann(csr, workers, seed)
+            color_assignment = dict(zip(csr.labels, colors))
+
+    if stats is not None:
+        # Every strategy colors each vertex once, looking at all of its neighbors
+        # (Jones-Plassmann rescans the candidates of every round, so this is a lower bound)
+        if isinstance(graph, CSRGraph) or strategy != 'insertion':
+            edges_scanned = (graph if isinstance(graph, CSRGraph) else csr).num_edges
+        else:
+            edges_scanned = sum(len(graph.get_neighbors(v)) for v in color_assignment)
+        stats.add('vertices_settled', len(color_assignment))
+        stats.add('edges_scanned', edges_scanned)
+        if 'rounds' in summary:
+            stats.add('rounds_run', summary['rounds'])
+    summary['num_colors'] = len(set(color_assignment.values()))
+    summary['seconds'] = time.perf_counter() - started
+    return color_assignment, summary
+
+
+def _insertion_coloring(graph):
+    if isinstance(graph, CSRGraph):
+        return _graph_coloring_csr(graph)
+
     vertices = graph.get_all_vertices()
     if not vertices:
         return {}
@@ -38,6 +129,181 @@ def graph_coloring(graph):
     return color_assignment
 
 
+def _graph_coloring_csr(graph):
+    """
+    Greedy coloring over the integer arrays of a CSRGraph.
+    Same result as graph_coloring().
+    """
+    return dict(zip(graph.labels, _color_in_order(graph, range(graph.num_vertices))))
+
+
+def _smallest_free_color(used):
+    color = 0
+    while color in used:
+        color += 1
+    return color
+
+
+def _color_in_order(csr, order):
+    """
+    Greedily colors the vertex ids of a CSRGraph in the given order.
+    """
+    offsets, targets = csr.offsets, csr.targets
+    colors = [-1] * csr.num_vertices
+    for vertex in order:
+        used = {colors[targets[k]] for k in range(offsets[vertex], offsets[vertex + 1])}
+        colors[vertex] = _smallest_free_color(used)
+    return colors
+
+
+def _largest_first(csr):
+    offsets = csr.offsets
+    order = sorted(range(csr.num_vertices), key=lambda v: offsets[v] - offsets[v + 1])
+    return _color_in_order(csr, order)
+
+
+def _smallest_last(csr):
+    """
+    Smallest-last ordering with a bucket queue indexed by current degree.
+    """
+    n = csr.num_vertices
+    offsets, targets = csr.offsets, csr.targets
+    degree = [offsets[v + 1] - offsets[v] for v in range(n)]
+    buckets = [set() for _ in range(max(degree, default=0) + 1)]
+    for v in range(n):
+        buckets[degree[v]].add(v)
+
+    removed = bytearray(n)
+    removal_order = []
+    lowest = 0
+    for _ in range(n):
+        # A removal lowers neighbor degrees by one, so the minimum can only
+        # drop by one per step
+        lowest = max(lowest - 1, 0)
+        while not buckets[lowest]:
+            lowest += 1
+        vertex = buckets[lowest].pop()
+        removed[vertex] = 1
+        removal_order.append(vertex)
+        for k in range(offsets[vertex], offsets[vertex + 1]):
+            neighbor = targets[k]
+            if not removed[neighbor] and neighbor != vertex:
+                buckets[degree[neighbor]].discard(neighbor)
+                degree[neighbor] -= 1
+                buckets[degree[neighbor]].add(neighbor)
+
+    return _color_in_order(csr, reversed(removal_order))
+
+
+def _dsatur(csr, stats=None):
+    n = csr.num_vertices
+    offsets, targets = csr.offsets, csr.targets
+    push = heapq.heappush if stats is None else CountingCall(heapq.heappush)
+    colors = [-1] * n
+    neighbor_colors = [set() for _ in range(n)]
+    degree = [offsets[v + 1] - offsets[v] for v in range(n)]
+
+    # Saturation queue entries are (-saturation, -degree, vertex); stale ones are skipped
+    queue = [(0, -degree[v], v) for v in range(n)]
+    heapq.heapify(queue)
+    while queue:
+        negative_saturation, _, vertex = heapq.heappop(queue)
+        if colors[vertex] >= 0 or -negative_saturation != len(neighbor_colors[vertex]):
+            continue
+        color = _smallest_free_color(neighbor_colors[vertex])
+        colors[vertex] = color
+        for k in range(offsets[vertex], offsets[vertex + 1]):
+            neighbor = targets[k]
+            if colors[neighbor] < 0 and color not in neighbor_colors[neighbor]:
+                neighbor_colors[neighbor].add(color)
+                push(queue, (-len(neighbor_colors[neighbor]), -degree[neighbor], neighbor))
+
+    if stats is not None:
+        # The queue starts with one entry per vertex and is drained completely
+        stats.add('heap_pushes', push.calls)
+        stats.add('heap_pops', n + push.calls)
+        stats.add('stale_pops', push.calls)
+    return colors
+
+
+def _jones_plassmann(csr, workers, seed):
+    """
+    Jones-Plassmann coloring. Returns (colors, rounds).
+    """
+    n = csr.num_vertices
+    priorities = array('q', range(n))
+    random.Random(seed).shuffle(priorities)
+    colors = array('q', [-1]) * n
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    uncolored = list(range(n))
+    rounds = 0
+
+    if workers <= 1 or n == 0:
+        while uncolored:
+            rounds += 1
+            picked = _jones_plassmann_round(csr.offsets, csr.targets, priorities, colors, uncolored)
+            for vertex, color in picked:
+                colors[vertex] = color
+            uncolored = [v for v in uncolored if colors[v] < 0]
+        return list(colors), rounds
+
+    shm, layout = share_buffers([csr.offsets, csr.targets, priorities, colors])
+    views = attach_buffers(shm.name, layout, shm=shm)[1]
+    shared_colors = views[3]
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_worker,
+                                 initargs=(shm.name, layout)) as executor:
+            while uncolored:
+                rounds += 1
+                chunk_size = -(-len(uncolored) // workers)
+                chunks = [uncolored[i:i + chunk_size] for i in range(0, len(uncolored), chunk_size)]
+                # Apply the round only once every chunk has read the same snapshot
+                for picked in list(executor.map(_run_round_chunk, chunks)):
+                    for vertex, color in picked:
+                        shared_colors[vertex] = color
+                uncolored = [v for v in uncolored if shared_colors[v] < 0]
+        return list(shared_colors), rounds
+    finally:
+        for view in views:
+            view.release()
+        shm.close()
+        shm.unlink()
+
+
+def _jones_plassmann_round(offsets, targets, priorities, colors, candidates):
+    """
+    Returns (vertex, color) for every candidate whose priority is higher than
+    that of all its uncolored neighbors. Those vertices form an independent
+    set, so they can all be colored at once from the same colors snapshot.
+    """
+    picked = []
+    for vertex in candidates:
+        priority = priorities[vertex]
+        used = set()
+        for k in range(offsets[vertex], offsets[vertex + 1]):
+            neighbor = targets[k]
+            color = colors[neighbor]
+            if color >= 0:
+                used.add(color)
+            elif neighbor != vertex and priorities[neighbor] > priority:
+                break
+        else:
+            picked.append((vertex, _smallest_free_color(used)))
+    return picked
+
+
+def _attach_worker(name, layout):
+    global _worker_buffers
+    _worker_buffers = attach_buffers(name, layout)
+
+
+def _run_round_chunk(candidates):
+    _, (offsets, targets, priorities, colors) = _worker_buffers
+    return _jones_plassmann_round(offsets, targets, priorities, colors, candidates)
+
+
 def print_coloring(color_assignment):
     """
     Prints the vertex color assignments in a readable format.
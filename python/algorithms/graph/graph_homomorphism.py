@@ -1,4 +1,7 @@
-def is_homomorphism(graph1, graph2, mapping):
+from datastructures.graph.graph import Graph
+from .stats import timed
+
+def is_homomorphism(graph1, graph2, mapping, stats=None):
     """
     Checks if a given vertex mapping defines a graph homomorphism from graph1 to graph2.
 
@@ -6,34 +9,268 @@ def is_homomorphism(graph1, graph2, mapping):
         graph1 (Graph): The source graph.
         graph2 (Graph): The target graph.
         mapping (dict): A dictionary representing the vertex mapping from graph1 to graph2.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
 
     Returns:
         bool: True if the mapping is a homomorphism, False otherwise.
+              Use check_homomorphism to find out why a mapping fails.
+    """
+    return check_homomorphism(graph1, graph2, mapping, stats=stats)[0]
+
+
+def check_homomorphism(graph1, graph2, mapping, index=None, stats=None):
+    """
+    Checks a vertex mapping like is_homomorphism, but reports the first failure.
+
+    Args:
+        graph1 (Graph): The source graph.
+        graph2 (Graph): The target graph.
+        mapping (dict): A dictionary representing the vertex mapping from graph1 to graph2.
+        index (dict): Optional adjacency_index(graph2), to reuse across calls.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
+
+    Returns:
+        A tuple (is_valid, failure):
+        - is_valid (bool): True if the mapping is a homomorphism.
+        - failure (dict): None if valid, otherwise one of
+          {'reason': 'unmapped_vertex', 'vertex': v} or
+          {'reason': 'missing_edge', 'edge': (u, v), 'mapped_edge': (mapping[u], mapping[v])}.
+    """
+    with timed(stats, 'setup'):
+        if index is None:
+            index = _adjacency(graph2)
+        source = _source_adjacency(graph1)
+    with timed(stats, 'search'):
+        return _check(_counting(source, stats), index, mapping)
+
+
+def check_homomorphisms(graph1, graph2, mappings, stats=None):
+    """
+    Validates a batch of candidate mappings, building the adjacency of both
+    graphs only once.
+
+    Args:
+        graph1 (Graph): The source graph.
+        graph2 (Graph): The target graph.
+        mappings (iterable): Candidate mappings from graph1 to graph2.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
+
+    Returns:
+        list: One (is_valid, failure) tuple per mapping, as in check_homomorphism.
+    """
+    with timed(stats, 'setup'):
+        source = _source_adjacency(graph1)
+        index = _adjacency(graph2)
+    with timed(stats, 'search'):
+        return [_check(_counting(source, stats), index, mapping) for mapping in mappings]
+
+
+def adjacency_index(graph):
+    """
+    Builds a dict mapping every vertex to the set of its neighbors,
+    for O(1) edge existence checks.
+
+    Args:
+        graph (Graph): The graph to index.
+
+    Returns:
+        dict: Vertex -> set of neighbors. It is a copy; changing it does not
+              affect the graph.
+    """
+    return {vertex: {n for n, _ in graph.get_neighbors(vertex)}
+            for vertex in graph.get_all_vertices()}
+
+
+def _adjacency(graph):
+    """
+    Like adjacency_index, but a Graph's own hashed adjacency is used as-is
+    instead of being copied. Only for read-only use inside this module.
+    """
+    if isinstance(graph, Graph):
+        return graph._graph
+    return adjacency_index(graph)
+
+
+def _source_adjacency(graph):
+    return [(vertex, [n for n, _ in graph.get_neighbors(vertex)])
+            for vertex in graph.get_all_vertices()]
+
+
+def _counting(source, stats):
+    """
+    Returns source unchanged, or with stats a generator that counts every
+    vertex _check reaches together with its edges.
     """
-    for vertex1 in graph1.get_all_vertices():
+    if stats is None:
+        return source
+    return _counted_source(source, stats)
+
+
+def _counted_source(source, stats):
+    for vertex, neighbors in source:
+        stats.add('vertices_settled')
+        stats.add('edges_scanned', len(neighbors))
+        yield vertex, neighbors
+
+
+def _check(source, index, mapping):
+    empty = frozenset()
+    for vertex1, neighbors in source:
         # Ensure vertex1 is in the mapping
         if vertex1 not in mapping:
-            print(f"Vertex {vertex1} not found in mapping.")
-            return False
+            return False, {'reason': 'unmapped_vertex', 'vertex': vertex1}
 
         mapped_vertex1 = mapping[vertex1]
+        neighbors2 = index.get(mapped_vertex1, empty)
 
         # Check neighbors of vertex1 in graph1
-        for neighbor, _ in graph1.get_neighbors(vertex1):
+        for neighbor in neighbors:
             # Ensure neighbor is mapped
             if neighbor not in mapping:
-                print(f"Neighbor {neighbor} not found in mapping.")
-                return False
-
-            mapped_neighbor = mapping[neighbor]
+                return False, {'reason': 'unmapped_vertex', 'vertex': neighbor}
 
             # Check the mapped edge in graph2
-            neighbors2 = [n for n, _ in graph2.get_neighbors(mapped_vertex1)]
+            mapped_neighbor = mapping[neighbor]
             if mapped_neighbor not in neighbors2:
-                print(f"Edge ({mapped_vertex1}, {mapped_neighbor}) not found in graph2.")
-                return False
+                return False, {'reason': 'missing_edge',
+                               'edge': (vertex1, neighbor),
+                               'mapped_edge': (mapped_vertex1, mapped_neighbor)}
+    return True, None
+
+
+def find_homomorphism(graph1, graph2, stats=None):
+    """
+    Searches for a homomorphism from graph1 to graph2 by backtracking.
+
+    Every vertex of graph1 starts with the vertices of graph2 it could map
+    to as its domain. The search always branches on the unassigned vertex
+    with the smallest domain (ties broken by highest degree), and after each
+    assignment prunes the domains of its unassigned neighbors to the images
+    that keep every edge (forward checking), backtracking as soon as a
+    domain becomes empty. The search uses an explicit stack, not recursion.
+
+    Args:
+        graph1 (Graph): The source graph.
+        graph2 (Graph): The target graph.
+        stats (AlgorithmStats): Optional collector for phase times.
+
+    Returns:
+        dict: A mapping from graph1 to graph2 that is a homomorphism,
+              or None if none exists.
+    """
+    vertices1 = graph1.get_all_vertices()
+    if not vertices1:
+        return {}
+
+    with timed(stats, 'setup'):
+        domains = _initial_domains(graph1, graph2, vertices1)
+    if domains is None:
+        return None
+    with timed(stats, 'search'):
+        return _search(vertices1, *domains)
+
+
+def _initial_domains(graph1, graph2, vertices1):
+    """
+    Returns (out1, in1, out2, in2, degree, domains) for find_homomorphism,
+    or None if some vertex of graph1 has no possible image.
+    """
+    out1 = _adjacency(graph1)
+    in1 = _reverse_index(out1)
+    out2 = _adjacency(graph2)
+    in2 = _reverse_index(out2)
+    degree = {v: len(out1[v]) + len(in1[v]) for v in vertices1}
+
+    domains = {}
+    for v in vertices1:
+        domain = set()
+        for x in out2:
+            if out1[v] and not out2[x]:
+                continue
+            if in1[v] and not in2[x]:
+                continue
+            if v in out1[v] and x not in out2[x]: # Self-loops must map to self-loops
+                continue
+            domain.add(x)
+        if not domain:
+            return None
+        domains[v] = domain
+    return out1, in1, out2, in2, degree, domains
+
+
+def _search(vertices1, out1, in1, out2, in2, degree, domains):
+    """
+    The backtracking search of find_homomorphism over the initial domains.
+    """
+    assignment = {}
+
+    def select():
+        best, best_key = None, None
+        for v in vertices1:
+            if v not in assignment:
+                key = (len(domains[v]), -degree[v])
+                if best_key is None or key < best_key:
+                    best, best_key = v, key
+        return best
+
+    def ordered_domain(v):
+        # Domains are sets for fast pruning; candidates are tried in graph2's
+        # vertex order so the result does not depend on hashing
+        domain = domains[v]
+        return iter([x for x in out2 if x in domain])
+
+    def undo(trail):
+        for u, y in trail:
+            domains[u].add(y)
+
+    def forward_check(v, x):
+        trail = []
+        for neighbors1, allowed in ((out1[v], out2[x]), (in1[v], in2[x])):
+            for u in neighbors1:
+                if u in assignment or u == v:
+                    continue
+                domain = domains[u]
+                removed = [y for y in domain if y not in allowed]
+                for y in removed:
+                    domain.discard(y)
+                    trail.append((u, y))
+                if not domain:
+                    undo(trail)
+                    return None
+        return trail
+
+    first = select()
+    # Frames are [vertex, candidate iterator, trail of the current choice]
+    stack = [[first, ordered_domain(first), None]]
+    while stack:
+        frame = stack[-1]
+        vertex, candidates, trail = frame
+        if trail is not None:
+            undo(trail)
+            del assignment[vertex]
+            frame[2] = None
+        for candidate in candidates:
+            trail = forward_check(vertex, candidate)
+            if trail is None:
+                continue
+            assignment[vertex] = candidate
+            frame[2] = trail
+            if len(assignment) == len(vertices1):
+                return dict(assignment)
+            following = select()
+            stack.append([following, ordered_domain(following), None])
+            break
+        else:
+            stack.pop()
+    return None
+
 
-    return True
+def _reverse_index(index):
+    reverse = {vertex: set() for vertex in index}
+    for vertex, neighbors in index.items():
+        for neighbor in neighbors:
+            reverse[neighbor].add(vertex)
+    return reverse
 
 
 def print_homomorphism_result(result):
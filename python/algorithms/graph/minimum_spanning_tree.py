@@ -0,0 +1,258 @@
+# graph_project/algorithms/minimum_spanning_tree.py
+import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from datastructures.graph.csr_graph import CSRGraph
+from datastructures.graph.union_find import UnionFind
+from ._shared_buffers import attach_buffers, share_buffers
+from .stats import CountingCall, CountingNeighbors, timed
+
+try:
+    import numpy as np
+except ImportError:  # NumPy only speeds up the edge sort of Kruskal
+    np = None
+
+METHODS = ('kruskal', 'prim', 'boruvka')
+
+# Shared (offsets, targets, weights, components) views, attached once per worker process
+_worker_buffers = None
+
+
+def minimum_spanning_forest(graph, method='kruskal', workers=None, stats=None):
+    """
+    Finds a minimum spanning forest of an undirected weighted graph: a
+    minimum spanning tree of every connected component. Negative weights are
+    allowed.
+
+    Three algorithms are available:
+    - 'kruskal' (default): sorts the edges by weight as flat arrays (with
+      NumPy when installed) and adds them in order with a union-find,
+      skipping those that would close a cycle. O(E log E).
+    - 'prim': grows one tree per component from a lazy heap of the edges
+      leaving it. O(E log E), works on any graph or view without freezing it.
+    - 'boruvka': in rounds, every component picks its cheapest outgoing edge
+      and all of them are added at once, at least halving the number of
+      components per round. The cheapest-edge scan of a round is split
+      across `workers` processes that share the CSR buffers, like
+      graph_coloring's 'jones_plassmann'. Meant for very large graphs.
+
+    Args:
+        graph (Graph or CSRGraph): An undirected graph.
+        method (str): One of METHODS.
+        workers (int): Worker processes for 'boruvka'
+                       (default: os.cpu_count(); 1 runs in-process).
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
+
+    Returns:
+        A tuple (total_weight, edges):
+        - total_weight: The sum of the weights of the forest edges.
+        - edges (list): The forest edges as (vertex1, vertex2, weight) tuples,
+                        V - C of them for a graph with C components.
+        Raises TypeError if the graph is directed.
+    """
+    if graph._directed:
+        raise TypeError("Minimum spanning forests are defined for undirected graphs.")
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}; expected one of {METHODS}.")
+
+    if method == 'prim':
+        with timed(stats, 'search'):
+            edges = _prim(graph, stats)
+    else:
+        with timed(stats, 'setup'):
+            csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        with timed(stats, 'search'):
+            if method == 'kruskal':
+                chosen = _kruskal(csr, stats)
+            else:
+                chosen = _boruvka(csr, workers, stats)
+        labels = csr.labels
+        edges = [(labels[u], labels[v], w) for u, v, w in chosen]
+    return sum(w for _, _, w in edges), edges
+
+
+def _kruskal(csr, stats=None):
+    """
+    Kruskal's algorithm on the CSR arrays. Returns the forest as
+    (id1, id2, weight) tuples in order of weight.
+    """
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    n = csr.num_vertices
+    # Every undirected edge is stored in both directions; keep the one with
+    # source < target, which also drops self-loops
+    if np is not None:
+        np_offsets, np_targets, np_weights = csr.to_numpy()
+        np_sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(np_offsets))
+        kept = np.flatnonzero(np_sources < np_targets)
+        order = kept[np.argsort(np_weights[kept], kind='stable')]
+        sources = np_sources[order].tolist()
+        order = order.tolist()
+    else:
+        sources = array('q')
+        for vertex in range(n):
+            sources.extend([vertex] * (offsets[vertex + 1] - offsets[vertex]))
+        order = [k for k in range(len(targets)) if sources[k] < targets[k]]
+        order.sort(key=weights.__getitem__)
+        sources = [sources[k] for k in order]
+
+    union_find = UnionFind(range(n))
+    union = union_find.union
+    forest = []
+    for source, k in zip(sources, order):
+        if union(source, targets[k]):
+            forest.append((source, targets[k], weights[k]))
+            if len(forest) == n - 1:
+                break
+
+    if stats is not None:
+        stats.add('edges_scanned', len(order))
+    return forest
+
+
+def _prim(graph, stats=None):
+    """
+    Lazy Prim's algorithm, started from every vertex not yet in a tree.
+    Returns the forest as (vertex1, vertex2, weight) tuples.
+    """
+    get_neighbors = graph.get_neighbors
+    push = heapq.heappush
+    if stats is not None:
+        get_neighbors = CountingNeighbors(get_neighbors)
+        push = CountingCall(push)
+
+    in_tree = set()
+    forest = []
+    stale = 0
+    for root in graph.get_all_vertices():
+        if root in in_tree:
+            continue
+        in_tree.add(root)
+        # Entries are (weight, sequence, vertex, neighbor); the sequence
+        # number keeps vertex labels from ever being compared
+        queue = []
+        sequence = 0
+        for neighbor, weight in get_neighbors(root):
+            push(queue, (weight, sequence, root, neighbor))
+            sequence += 1
+        while queue:
+            weight, _, vertex, neighbor = heapq.heappop(queue)
+            if neighbor in in_tree:
+                stale += 1
+                continue
+            in_tree.add(neighbor)
+            forest.append((vertex, neighbor, weight))
+            for following, following_weight in get_neighbors(neighbor):
+                if following not in in_tree:
+                    push(queue, (following_weight, sequence, neighbor, following))
+                    sequence += 1
+
+    if stats is not None:
+        stats.add('vertices_settled', get_neighbors.calls)
+        stats.add('edges_scanned', get_neighbors.edges)
+        stats.add('heap_pushes', push.calls)
+        stats.add('heap_pops', push.calls)
+        stats.add('stale_pops', stale)
+    return forest
+
+
+def _boruvka(csr, workers, stats=None):
+    """
+    Borůvka's algorithm. Returns the forest as (id1, id2, weight) tuples.
+    """
+    n = csr.num_vertices
+    components = array('q', range(n))
+    union_find = UnionFind(range(n))
+    forest = []
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or n == 0:
+        rounds = _boruvka_rounds(n, components, union_find, forest,
+                                 lambda: [_cheapest_edges(csr.offsets, csr.targets, csr.weights,
+                                                          components, 0, n)])
+    else:
+        shm, layout = share_buffers([csr.offsets, csr.targets, csr.weights, components])
+        views = attach_buffers(shm.name, layout, shm=shm)[1]
+        chunk_size = -(-n // workers)
+        ranges = [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach_worker,
+                                     initargs=(shm.name, layout)) as executor:
+                rounds = _boruvka_rounds(n, views[3], union_find, forest,
+                                         lambda: list(executor.map(_run_range, *zip(*ranges))))
+        finally:
+            for view in views:
+                view.release()
+            shm.close()
+            shm.unlink()
+
+    if stats is not None:
+        stats.add('rounds_run', rounds)
+        stats.add('edges_scanned', rounds * csr.num_edges)
+    return forest
+
+
+def _boruvka_rounds(n, components, union_find, forest, scan):
+    """
+    Runs Borůvka rounds until no component has an outgoing edge. scan()
+    returns the cheapest-edge dicts of the current components, one per
+    vertex range. Returns the number of rounds.
+    """
+    rounds = 0
+    while True:
+        rounds += 1
+        cheapest = {}
+        for found in scan():
+            for component, edge in found.items():
+                best = cheapest.get(component)
+                if best is None or edge < best:
+                    cheapest[component] = edge
+        if not cheapest:
+            return rounds
+
+        for weight, u, v in cheapest.values():
+            # Two components can pick the same edge; it is only added once
+            if union_find.union(u, v):
+                forest.append((u, v, weight))
+        # Every vertex is labeled with its new component for the next scan
+        find = union_find.find
+        for vertex in range(n):
+            components[vertex] = find(vertex)
+
+
+def _cheapest_edges(offsets, targets, weights, components, start, stop):
+    """
+    Returns {component: (weight, id1, id2)} with the cheapest edge leaving
+    each component from the vertices in range(start, stop). Edges are
+    compared by (weight, lower id, higher id), a total order, so components
+    that pick edges of equal weight never close a cycle.
+    """
+    cheapest = {}
+    for vertex in range(start, stop):
+        component = components[vertex]
+        best = cheapest.get(component)
+        for k in range(offsets[vertex], offsets[vertex + 1]):
+            neighbor = targets[k]
+            if components[neighbor] == component:
+                continue
+            if vertex < neighbor:
+                edge = (weights[k], vertex, neighbor)
+            else:
+                edge = (weights[k], neighbor, vertex)
+            if best is None or edge < best:
+                best = edge
+        if best is not None:
+            cheapest[component] = best
+    return cheapest
+
+
+def _attach_worker(name, layout):
+    global _worker_buffers
+    _worker_buffers = attach_buffers(name, layout)
+
+
+def _run_range(start, stop):
+    _, (offsets, targets, weights, components) = _worker_buffers
+    return _cheapest_edges(offsets, targets, weights, components, start, stop)
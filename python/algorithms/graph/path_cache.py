@@ -0,0 +1,137 @@
+# graph_project/algorithms/path_cache.py
+import sys
+from collections import OrderedDict
+
+from .bellman_ford import bellman_ford
+from .dijkstra import dijkstra
+
+_ALGORITHMS = {
+    'dijkstra': dijkstra,
+    'bellman_ford': bellman_ford,
+}
+
+
+class ShortestPathCache:
+    """
+    An opt-in LRU cache of single-source shortest-path results for one graph.
+
+    Entries are keyed on (algorithm, source, graph version). Every mutation of
+    a Graph bumps its version counter, so a result computed before a mutation
+    is never served afterwards; stale entries are dropped as soon as a newer
+    version is seen.
+
+    Cached (distances, predecessors) dicts are returned as-is and shared
+    between callers, so treat them as read-only.
+    """
+
+    def __init__(self, graph, max_bytes=64 * 1024 * 1024, stats=None):
+        """
+        Initializes an empty cache.
+
+        Args:
+            graph (Graph): The graph whose results are cached.
+            max_bytes (int): Approximate upper bound on the memory held by
+                             cached results (default 64 MiB).
+            stats (AlgorithmStats): Optional collector passed to the algorithm
+                                    on every miss; hits do no algorithm work.
+        """
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self.algorithm_stats = stats
+        self._entries = OrderedDict()  # (algorithm, source, version): (result, size)
+        self._version = graph.version
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def dijkstra(self, start_vertex):
+        """
+        Cached equivalent of dijkstra(graph, start_vertex).
+        """
+        return self.get('dijkstra', start_vertex)
+
+    def bellman_ford(self, start_vertex):
+        """
+        Cached equivalent of bellman_ford(graph, start_vertex).
+        """
+        return self.get('bellman_ford', start_vertex)
+
+    def get(self, algorithm, start_vertex):
+        """
+        Returns the (distances, predecessors) result of the named algorithm,
+        computing and caching it on a miss.
+
+        Args:
+            algorithm (str): 'dijkstra' or 'bellman_ford'.
+            start_vertex: The source vertex.
+
+        Returns:
+            The algorithm's (distances, predecessors) tuple.
+        """
+        if algorithm not in _ALGORITHMS:
+            raise ValueError(f"Unknown algorithm {algorithm!r}; expected one of {sorted(_ALGORITHMS)}.")
+
+        version = self.graph.version
+        if version != self._version:
+            self.invalidations += len(self._entries)
+            self.clear()
+            self._version = version
+
+        key = (algorithm, start_vertex, version)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        result = _ALGORITHMS[algorithm](self.graph, start_vertex, stats=self.algorithm_stats)
+        if result[0] is None:
+            return result
+
+        size = _estimate_size(result)
+        if size > self.max_bytes:
+            return result
+        self._entries[key] = (result, size)
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+        return result
+
+    def clear(self):
+        """
+        Drops every cached entry. Counters are kept.
+        """
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self):
+        """
+        Returns the cache counters as a dict.
+        """
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _estimate_size(result):
+    """
+    Approximates the memory held by a (distances, predecessors) result:
+    both dict tables plus one boxed number per distance. Vertex labels are
+    shared with the graph and not counted.
+    """
+    distances, predecessors = result
+    return sys.getsizeof(distances) + sys.getsizeof(predecessors) + 24 * len(distances)
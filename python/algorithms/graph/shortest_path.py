@@ -0,0 +1,197 @@
+# graph_project/algorithms/shortest_path.py
+import heapq
+
+from datastructures.graph.csr_graph import CSRGraph
+from datastructures.graph.graph import Graph
+from datastructures.graph.views import ReverseView
+from .stats import CountingCall, CountingNeighbors, timed
+
+def shortest_path(graph, start_vertex, end_vertex, heuristic=None, bidirectional=False,
+                  reverse_graph=None, stats=None):
+    """
+    Finds a shortest path between two vertices, stopping as soon as the
+    end_vertex is settled instead of settling the whole graph like dijkstra().
+
+    Three search modes are available:
+    - default: Dijkstra with an early exit at the target.
+    - heuristic: A* search guided by heuristic(vertex, end_vertex), which must
+      never overestimate the remaining distance (admissible).
+    - bidirectional=True: Dijkstra grown from both ends at once, stopping when
+      the two frontiers can no longer improve the best meeting point.
+
+    Args:
+        graph (Graph): An instance of the Graph class. Edge weights must be non-negative.
+        start_vertex: The starting vertex.
+        end_vertex: The target vertex.
+        heuristic (callable): Optional admissible estimate of the distance from
+                              a vertex to end_vertex. Enables A* search.
+        bidirectional (bool): If True, run a bidirectional search.
+        reverse_graph (Graph): Optional reverse of a directed graph for the
+                               backward search, such as graph.reverse_view().
+                               Without it, a Graph that already tracks its
+                               in-edges (see Graph.track_in_edges) is searched
+                               backwards in place, and any other graph is
+                               copied reversed for this one query. For many
+                               bidirectional queries on a mutable Graph, pass
+                               graph.reverse_view(); a CSRGraph caches its
+                               own reverse.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
+
+    Returns:
+        A tuple (distance, path):
+        - distance: The length of the shortest path, float('inf') if unreachable.
+        - path (list): The vertices from start_vertex to end_vertex, or an
+                       empty list if there is no path.
+        Returns (None, None) if either vertex is not in graph.
+    """
+    if heuristic is not None and bidirectional:
+        raise ValueError("A* heuristic and bidirectional search cannot be combined.")
+
+    if start_vertex not in graph or end_vertex not in graph:
+        return None, None
+
+    if bidirectional:
+        if reverse_graph is None:
+            with timed(stats, 'setup'):
+                reverse_graph = _reverse_of(graph)
+        with timed(stats, 'search'):
+            return _bidirectional(graph, reverse_graph, start_vertex, end_vertex, stats)
+    with timed(stats, 'search'):
+        return _astar(graph, start_vertex, end_vertex, heuristic, stats)
+
+def _reverse_of(graph):
+    """
+    Returns a graph with every edge reversed (the graph itself if undirected).
+    """
+    if not graph._directed:
+        return graph
+    if isinstance(graph, CSRGraph):
+        return graph.reverse()
+    if isinstance(graph, ReverseView):
+        return graph.graph
+    if getattr(graph, '_reverse', None) is not None:
+        return graph.reverse_view()
+
+    # Turning on in-edge tracking here would cost the caller's Graph memory
+    # and upkeep on every later mutation, so build a one-off copy instead
+    reverse = Graph(directed=True)
+    for vertex in graph.get_all_vertices():
+        reverse.add_vertex(vertex)
+    reverse.add_edges_from((v, u, w) for u, v, w in graph.iter_edges())
+    return reverse
+
+def _astar(graph, start_vertex, end_vertex, heuristic, stats=None):
+    """
+    A* search; with no heuristic this is Dijkstra with an early exit.
+    """
+    get_neighbors = graph.get_neighbors
+    push, pop = heapq.heappush, heapq.heappop
+    if stats is not None:
+        get_neighbors = CountingNeighbors(get_neighbors)
+        push, pop = CountingCall(push), CountingCall(pop)
+
+    distances = {start_vertex: 0}
+    predecessors = {start_vertex: None}
+    estimate = heuristic(start_vertex, end_vertex) if heuristic else 0
+
+    # Priority queue stores (distance + estimate, distance, vertex)
+    priority_queue = [(estimate, 0, start_vertex)]
+
+    while priority_queue:
+        _, current_distance, current_vertex = pop(priority_queue)
+
+        # If we found a shorter path already, skip
+        if current_distance > distances[current_vertex]:
+            continue
+        if current_vertex == end_vertex:
+            if stats is not None:
+                # The target is settled without being expanded
+                stats.add_search(get_neighbors.calls + 1, get_neighbors.edges,
+                                 push.calls, push.calls, pop.calls)
+            return current_distance, _walk_back(predecessors, end_vertex)[::-1]
+
+        for neighbor, weight in get_neighbors(current_vertex):
+            if weight < 0:
+                raise ValueError("shortest_path does not support negative edge weights.")
+
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_vertex
+                estimate = heuristic(neighbor, end_vertex) if heuristic else 0
+                push(priority_queue, (distance + estimate, distance, neighbor))
+
+    if stats is not None:
+        stats.add_search(get_neighbors.calls, get_neighbors.edges,
+                         push.calls, push.calls, pop.calls)
+    return float('inf'), []
+
+def _bidirectional(graph, reverse_graph, start_vertex, end_vertex, stats=None):
+    """
+    Bidirectional Dijkstra: alternately settles a vertex from the side with
+    the smaller frontier key, and stops once the two smallest keys together
+    reach the best path seen so far.
+    """
+    if start_vertex == end_vertex:
+        return 0, [start_vertex]
+
+    # Index 0 is the forward search over graph, 1 the backward search over reverse_graph
+    sides = (graph.get_neighbors, reverse_graph.get_neighbors)
+    push, pop = heapq.heappush, heapq.heappop
+    if stats is not None:
+        sides = tuple(CountingNeighbors(get_neighbors) for get_neighbors in sides)
+        push, pop = CountingCall(push), CountingCall(pop)
+    distances = ({start_vertex: 0}, {end_vertex: 0})
+    predecessors = ({start_vertex: None}, {end_vertex: None})
+    settled = (set(), set())
+    queues = ([(0, start_vertex)], [(0, end_vertex)])
+
+    best = float('inf')
+    meeting_vertex = None
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        other = 1 - side
+        current_distance, current_vertex = pop(queues[side])
+        if current_vertex in settled[side] or current_distance > distances[side][current_vertex]:
+            continue
+        settled[side].add(current_vertex)
+
+        for neighbor, weight in sides[side](current_vertex):
+            if weight < 0:
+                raise ValueError("shortest_path does not support negative edge weights.")
+
+            distance = current_distance + weight
+            if distance < distances[side].get(neighbor, float('inf')):
+                distances[side][neighbor] = distance
+                predecessors[side][neighbor] = current_vertex
+                push(queues[side], (distance, neighbor))
+
+            if neighbor in distances[other]:
+                total = distances[side][neighbor] + distances[other][neighbor]
+                if total < best:
+                    best = total
+                    meeting_vertex = neighbor
+
+    if stats is not None:
+        stats.add_search(sides[0].calls + sides[1].calls, sides[0].edges + sides[1].edges,
+                         push.calls, push.calls, pop.calls)
+    if meeting_vertex is None:
+        return float('inf'), []
+
+    forward = _walk_back(predecessors[0], meeting_vertex)[::-1]
+    backward = _walk_back(predecessors[1], meeting_vertex)
+    return best, forward + backward[1:]
+
+def _walk_back(predecessors, vertex):
+    """
+    Follows predecessors from vertex back to the root of the search.
+    """
+    path = []
+    while vertex is not None:
+        path.append(vertex)
+        vertex = predecessors[vertex]
+    return path
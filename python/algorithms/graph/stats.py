@@ -0,0 +1,151 @@
+# graph_project/algorithms/stats.py
+import time
+from contextlib import contextmanager, nullcontext
+
+# Counters reported by the algorithms; each one only adds those that apply to it
+COUNTERS = (
+    'vertices_settled',  # Vertices whose result was fixed and whose edges were expanded
+    'edges_scanned',     # Adjacency entries examined
+    'relaxations',       # Tentative distances that were improved
+    'heap_pushes',
+    'heap_pops',
+    'stale_pops',        # Popped heap entries that were already outdated
+    'rounds_run',        # Bellman-Ford relaxation rounds performed
+    'rounds_skipped',    # Bellman-Ford rounds saved by stopping early
+)
+
+
+class AlgorithmStats:
+    """
+    Collects work counters and wall time per phase from the graph algorithms.
+
+    Every function in algorithms.graph takes an optional stats argument. With
+    the default stats=None nothing is recorded and the plain code runs; pass
+    an AlgorithmStats to find out whether a slow call is due to graph size,
+    heap churn or repeated relaxations.
+
+    Counters accumulate across calls, so one object can aggregate several
+    queries; call reset() to start over. Subclasses can override add() and
+    add_time() to forward values to a metrics system as they are produced.
+    """
+
+    def __init__(self):
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.seconds = {}
+
+    def add(self, counter, amount=1):
+        """
+        Adds amount to a counter.
+        """
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def add_time(self, phase, seconds):
+        """
+        Adds wall time to a phase.
+        """
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Context manager that adds the wall time of its body to the named phase.
+        """
+        started = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    def add_search(self, settled, edges_scanned, relaxations, pushes, pops):
+        """
+        Adds the counters of one priority-queue search. Every pop that did
+        not settle a vertex is counted as stale.
+        """
+        self.add('vertices_settled', settled)
+        self.add('edges_scanned', edges_scanned)
+        self.add('relaxations', relaxations)
+        self.add('heap_pushes', pushes)
+        self.add('heap_pops', pops)
+        self.add('stale_pops', pops - settled)
+
+    def merge(self, other):
+        """
+        Adds the counters and phase times of another AlgorithmStats, e.g.
+        one filled in a worker process.
+        """
+        for counter, amount in other.counters.items():
+            self.add(counter, amount)
+        for phase, seconds in other.seconds.items():
+            self.add_time(phase, seconds)
+
+    def reset(self):
+        """
+        Zeroes every counter and phase time.
+        """
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.seconds = {}
+
+    def as_dict(self):
+        """
+        Returns a flat dict of all counters plus one '<phase>_seconds' entry
+        per timed phase, ready to ship to a metrics pipeline.
+        """
+        result = dict(self.counters)
+        for phase, seconds in self.seconds.items():
+            result[f'{phase}_seconds'] = seconds
+        return result
+
+    def __repr__(self):
+        return f"AlgorithmStats({self.as_dict()})"
+
+
+def timed(stats, phase):
+    """
+    Returns stats.phase(phase), or a no-op context manager when stats is None.
+    """
+    if stats is None:
+        return nullcontext()
+    return stats.phase(phase)
+
+
+class CountingCall:
+    """
+    Wraps a function and counts its calls. With stats enabled the algorithms
+    swap these in for heappush/heappop, so the plain code path never pays
+    for counting.
+    """
+    __slots__ = ('func', 'calls')
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self.func(*args)
+
+
+class CountingNeighbors:
+    """
+    Wraps a get_neighbors method, counting the vertices expanded and the
+    edges returned.
+    """
+    __slots__ = ('get_neighbors', 'calls', 'edges')
+
+    def __init__(self, get_neighbors):
+        self.get_neighbors = get_neighbors
+        self.calls = 0
+        self.edges = 0
+
+    def __call__(self, vertex):
+        neighbors = self.get_neighbors(vertex)
+        self.calls += 1
+        self.edges += len(neighbors)
+        return neighbors
+
+
+def degree_sum(offsets, ids):
+    """
+    Total number of CSR edge entries leaving the given vertex ids.
+    """
+    return sum(offsets[i + 1] - offsets[i] for i in ids)
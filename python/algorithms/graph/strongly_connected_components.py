@@ -0,0 +1,125 @@
+# graph_project/algorithms/strongly_connected_components.py
+from .stats import CountingNeighbors, timed
+
+def strongly_connected_components(graph, method='tarjan', stats=None):
+    """
+    Finds the strongly connected components of a directed graph in linear time.
+    Both methods use explicit stacks, so deep graphs never hit RecursionError.
+
+    Args:
+        graph (Graph): A directed Graph instance.
+        method (str): 'tarjan' (default, single pass) or 'kosaraju'
+                      (two passes over the graph and its reverse).
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
+
+    Returns:
+        list: A list of sets, each holding the vertices of one strongly
+              connected component. Tarjan returns them in reverse
+              topological order of the condensation, Kosaraju in topological order.
+        Raises TypeError if the graph is undirected.
+    """
+    if not graph._directed:
+        raise TypeError("Strongly connected components are defined for directed graphs. "
+                        "For undirected graphs, use get_connected_components.")
+    if method not in ('tarjan', 'kosaraju'):
+        raise ValueError(f"Unknown method {method!r}; expected 'tarjan' or 'kosaraju'.")
+
+    get_neighbors = graph.get_neighbors if stats is None else CountingNeighbors(graph.get_neighbors)
+    with timed(stats, 'search'):
+        if method == 'tarjan':
+            components = _tarjan(graph, get_neighbors)
+        else:
+            components = _kosaraju(graph, get_neighbors)
+    if stats is not None:
+        stats.add('vertices_settled', get_neighbors.calls)
+        stats.add('edges_scanned', get_neighbors.edges)
+    return components
+
+
+def _tarjan(graph, get_neighbors):
+    index = {}
+    lowlink = {}
+    on_stack = set()
+    component_stack = []
+    components = []
+
+    for root in graph.get_all_vertices():
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        component_stack.append(root)
+        on_stack.add(root)
+        stack = [(root, iter(get_neighbors(root)))]
+
+        while stack:
+            vertex, neighbors = stack[-1]
+            for neighbor, _ in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = lowlink[neighbor] = len(index)
+                    component_stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    stack.append((neighbor, iter(get_neighbors(neighbor))))
+                    break
+                elif neighbor in on_stack:
+                    lowlink[vertex] = min(lowlink[vertex], index[neighbor])
+            else:
+                stack.pop()
+                if stack:
+                    parent = stack[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[vertex])
+                if lowlink[vertex] == index[vertex]:
+                    # vertex is the root of a component: pop it off the stack
+                    component = set()
+                    while True:
+                        member = component_stack.pop()
+                        on_stack.remove(member)
+                        component.add(member)
+                        if member == vertex:
+                            break
+                    components.append(component)
+    return components
+
+
+def _kosaraju(graph, get_neighbors):
+    # First pass: record vertices by DFS finishing time
+    visited = set()
+    finish_order = []
+    for root in graph.get_all_vertices():
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [(root, iter(get_neighbors(root)))]
+        while stack:
+            vertex, neighbors = stack[-1]
+            for neighbor, _ in neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    stack.append((neighbor, iter(get_neighbors(neighbor))))
+                    break
+            else:
+                stack.pop()
+                finish_order.append(vertex)
+
+    reverse = {vertex: [] for vertex in graph.get_all_vertices()}
+    for vertex in reverse:
+        for neighbor, _ in graph.get_neighbors(vertex):
+            reverse[neighbor].append(vertex)
+
+    # Second pass: flood the reverse graph in decreasing finishing time
+    assigned = set()
+    components = []
+    for root in reversed(finish_order):
+        if root in assigned:
+            continue
+        assigned.add(root)
+        component = {root}
+        stack = [root]
+        while stack:
+            vertex = stack.pop()
+            for neighbor in reverse[vertex]:
+                if neighbor not in assigned:
+                    assigned.add(neighbor)
+                    component.add(neighbor)
+                    stack.append(neighbor)
+        components.append(component)
+    return components
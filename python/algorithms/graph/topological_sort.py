@@ -0,0 +1,79 @@
+# graph_project/algorithms/topological_sort.py
+from collections import deque
+
+from .stats import CountingNeighbors, timed
+
+def topological_sort(graph, stats=None):
+    """
+    Orders the vertices of a directed graph so that every edge points forward
+    (Kahn's algorithm). Runs in linear time without recursion.
+
+    Args:
+        graph (Graph): A directed Graph instance.
+        stats (AlgorithmStats): Optional collector for work counters and phase times.
+
+    Returns:
+        A tuple (order, cycle):
+        - order (list): The vertices in topological order, or None if the
+                        graph has a cycle.
+        - cycle (list): None if the graph is acyclic, otherwise a witness cycle
+                        [v0, v1, ..., vk, v0] whose consecutive vertices are
+                        joined by edges.
+        Raises TypeError if the graph is undirected.
+    """
+    if not graph._directed:
+        raise TypeError("Topological sort is defined for directed graphs.")
+
+    vertices = graph.get_all_vertices()
+    with timed(stats, 'setup'):
+        in_degree = dict.fromkeys(vertices, 0)
+        for vertex in vertices:
+            for neighbor, _ in graph.get_neighbors(vertex):
+                in_degree[neighbor] += 1
+
+    get_neighbors = graph.get_neighbors if stats is None else CountingNeighbors(graph.get_neighbors)
+    with timed(stats, 'search'):
+        queue = deque(vertex for vertex in vertices if in_degree[vertex] == 0)
+        order = []
+        while queue:
+            vertex = queue.popleft()
+            order.append(vertex)
+            for neighbor, _ in get_neighbors(vertex):
+                in_degree[neighbor] -= 1
+                if in_degree[neighbor] == 0:
+                    queue.append(neighbor)
+
+    if stats is not None:
+        stats.add('vertices_settled', get_neighbors.calls)
+        stats.add('edges_scanned', get_neighbors.edges)
+    if len(order) == len(vertices):
+        return order, None
+    with timed(stats, 'cycle_extraction'):
+        return None, _find_cycle(graph, in_degree)
+
+
+def _find_cycle(graph, in_degree):
+    """
+    Extracts a cycle from the vertices Kahn's algorithm could not remove.
+    Each of them still has an incoming edge from another remaining vertex,
+    so walking those edges backwards must eventually repeat a vertex.
+    """
+    remaining = [vertex for vertex, degree in in_degree.items() if degree > 0]
+    remaining_set = set(remaining)
+    predecessor = {}
+    for vertex in remaining:
+        for neighbor, _ in graph.get_neighbors(vertex):
+            if neighbor in remaining_set and neighbor not in predecessor:
+                predecessor[neighbor] = vertex
+
+    seen = {}
+    walk = []
+    vertex = remaining[0]
+    while vertex not in seen:
+        seen[vertex] = len(walk)
+        walk.append(vertex)
+        vertex = predecessor[vertex]
+
+    # walk follows edges backwards; reverse the looping part into edge order
+    cycle = walk[seen[vertex]:][::-1]
+    return cycle + [cycle[0]]
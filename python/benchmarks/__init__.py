@@ -0,0 +1,2 @@
+# Benchmark suite for the graph algorithms: seeded generators, a timing
+# runner and baseline comparison. Run with: python -m benchmarks.run --help
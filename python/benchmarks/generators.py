@@ -0,0 +1,155 @@
+# graph_project/benchmarks/generators.py
+import random
+
+from datastructures.graph.graph import Graph
+
+
+def erdos_renyi(n, average_degree=8, seed=0, directed=False, max_weight=100):
+    """
+    Builds a G(n, m) random graph with about n * average_degree / 2 edges
+    and uniform integer weights in [1, max_weight].
+
+    Args:
+        n (int): Number of vertices.
+        average_degree (float): Expected average degree.
+        seed (int): Random seed.
+        directed (bool): Whether the graph is directed.
+        max_weight (int): Largest edge weight.
+
+    Returns:
+        Graph: The generated graph.
+    """
+    rng = random.Random(seed)
+    graph = Graph(directed=directed)
+    for vertex in range(n):
+        graph.add_vertex(vertex)
+    num_edges = int(n * average_degree / 2)
+    graph.add_edges_from((rng.randrange(n), rng.randrange(n), rng.randint(1, max_weight))
+                         for _ in range(num_edges))
+    return graph
+
+
+def grid(n, seed=0, max_weight=10):
+    """
+    Builds a road-like square grid with about n vertices: every vertex is
+    joined to its right and lower neighbor with a random integer weight.
+
+    Args:
+        n (int): Approximate number of vertices (rounded down to a square).
+        seed (int): Random seed.
+        max_weight (int): Largest edge weight.
+
+    Returns:
+        Graph: The generated undirected graph, with (row, col) vertices.
+    """
+    rng = random.Random(seed)
+    side = max(int(n ** 0.5), 1)
+    graph = Graph()
+    for row in range(side):
+        for col in range(side):
+            graph.add_vertex((row, col))
+    edges = []
+    for row in range(side):
+        for col in range(side):
+            if col + 1 < side:
+                edges.append(((row, col), (row, col + 1), rng.randint(1, max_weight)))
+            if row + 1 < side:
+                edges.append(((row, col), (row + 1, col), rng.randint(1, max_weight)))
+    graph.add_edges_from(edges)
+    return graph
+
+
+def barabasi_albert(n, edges_per_vertex=3, seed=0, max_weight=100):
+    """
+    Builds a power-law graph by preferential attachment: every new vertex
+    connects to edges_per_vertex existing vertices chosen proportionally to
+    their degree.
+
+    Args:
+        n (int): Number of vertices.
+        edges_per_vertex (int): Edges added with each new vertex.
+        seed (int): Random seed.
+        max_weight (int): Largest edge weight.
+
+    Returns:
+        Graph: The generated undirected graph.
+    """
+    rng = random.Random(seed)
+    graph = Graph()
+    core = min(edges_per_vertex + 1, n)
+    edges = []
+    # Every endpoint of every edge, so sampling from it is degree-proportional
+    endpoints = []
+    for u in range(core):
+        graph.add_vertex(u)
+        for v in range(u):
+            edges.append((u, v, rng.randint(1, max_weight)))
+            endpoints += (u, v)
+    for u in range(core, n):
+        targets = set()
+        while len(targets) < min(edges_per_vertex, u):
+            targets.add(rng.choice(endpoints) if endpoints else rng.randrange(u))
+        for v in sorted(targets):
+            edges.append((u, v, rng.randint(1, max_weight)))
+            endpoints += (u, v)
+    graph.add_edges_from(edges)
+    return graph
+
+
+def chain(n, seed=0, directed=True, max_weight=10):
+    """
+    Builds a single path 0 -> 1 -> ... -> n-1, the worst case for
+    traversal depth.
+
+    Args:
+        n (int): Number of vertices.
+        seed (int): Random seed.
+        directed (bool): Whether the graph is directed.
+        max_weight (int): Largest edge weight.
+
+    Returns:
+        Graph: The generated graph.
+    """
+    rng = random.Random(seed)
+    graph = Graph(directed=directed)
+    graph.add_vertex(0)
+    graph.add_edges_from((i, i + 1, rng.randint(1, max_weight)) for i in range(n - 1))
+    return graph
+
+
+def clique(n, seed=0, max_weight=100):
+    """
+    Builds a complete undirected graph on n vertices.
+
+    Args:
+        n (int): Number of vertices.
+        seed (int): Random seed.
+        max_weight (int): Largest edge weight.
+
+    Returns:
+        Graph: The generated graph.
+    """
+    rng = random.Random(seed)
+    graph = Graph()
+    for vertex in range(n):
+        graph.add_vertex(vertex)
+    graph.add_edges_from((u, v, rng.randint(1, max_weight)) for u in range(n) for v in range(u + 1, n))
+    return graph
+
+
+def scaled_clique(n, seed=0):
+    """
+    A clique sized so its edge count stays comparable to the sparse
+    generators at the same n (4 * sqrt(n) vertices).
+    """
+    return clique(max(int(n ** 0.5) * 4, 2), seed=seed)
+
+
+# Generators used by the benchmark runner, each called as generator(n, seed=seed)
+GENERATORS = {
+    'erdos_renyi': erdos_renyi,
+    'grid': grid,
+    'barabasi_albert': barabasi_albert,
+    'chain': chain,
+    'clique': scaled_clique,
+}
@@ -0,0 +1,279 @@
+# graph_project/benchmarks/run.py
+"""
+Times the graph algorithms on seeded synthetic graphs and compares the
+results with a stored baseline.
+
+    python -m benchmarks.run --sizes 1000 10000 --output results.json
+    python -m benchmarks.run --baseline results.json --threshold 1.25
+    python -m benchmarks.run --check --sizes 1000 100000
+
+The process exits with status 1 when any timing is slower than the
+baseline by more than the threshold factor. --check instead validates the
+fast variants of the algorithms against the reference ones on the same
+generated graphs, and exits with status 1 on any mismatch.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+from algorithms.graph.bellman_ford import bellman_ford
+from algorithms.graph.bfs import bfs, frontier_bfs
+from algorithms.graph.connected_components import get_connected_components
+from algorithms.graph.cycle_detection import has_cycle
+from algorithms.graph.dfs import dfs
+from algorithms.graph.dijkstra import dijkstra
+from algorithms.graph.graph_coloring import graph_coloring
+from algorithms.graph.graph_homomorphism import is_homomorphism
+
+from .generators import GENERATORS, erdos_renyi
+
+DEFAULT_SIZES = (1000, 10000)
+
+
+def _single_source(algorithm):
+    def case(graph):
+        source = graph.get_all_vertices()[0]
+        return lambda: algorithm(graph, source)
+    return case
+
+
+def _whole_graph(algorithm, undirected_only=False):
+    def case(graph):
+        if undirected_only and graph._directed:
+            return None
+        return lambda: algorithm(graph)
+    return case
+
+
+def _homomorphism_case(graph):
+    # The identity mapping of a graph onto itself is always a homomorphism,
+    # so the check has to look at every edge
+    mapping = {vertex: vertex for vertex in graph.get_all_vertices()}
+    return lambda: is_homomorphism(graph, graph, mapping)
+
+
+# Each case prepares its inputs untimed and returns a zero-argument callable
+# to time, or None if the algorithm does not apply to the graph
+CASES = {
+    'bfs': _single_source(bfs),
+    'dfs': _single_source(dfs),
+    'dijkstra': _single_source(dijkstra),
+    'bellman_ford': _single_source(bellman_ford),
+    'connected_components': _whole_graph(get_connected_components, undirected_only=True),
+    'has_cycle': _whole_graph(has_cycle),
+    'graph_coloring': _whole_graph(graph_coloring),
+    'is_homomorphism': _homomorphism_case,
+}
+
+
+def _check_frontier_bfs(graph):
+    """
+    Checks that the vertices frontier_bfs reaches (hops >= 0) are exactly
+    those bfs() visits, from one source and from several at once, in every
+    direction mode. Returns a list of mismatch descriptions.
+    """
+    vertices = graph.get_all_vertices()
+    csr = graph.freeze()
+    source_sets = [vertices[:1], vertices[::max(len(vertices) // 5, 1)][:5]]
+    failures = []
+    for sources in source_sets:
+        expected = set()
+        for source in sources:
+            expected.update(bfs(csr, source))
+        for direction in ('auto', 'top_down', 'bottom_up'):
+            hops, _ = frontier_bfs(csr, sources, direction=direction)
+            reached = {csr.labels[i] for i in (hops >= 0).nonzero()[0].tolist()}
+            if reached != expected:
+                failures.append(f"frontier_bfs({len(sources)} sources, {direction}) reached "
+                                f"{len(reached)} vertices, bfs visits {len(expected)}")
+    return failures
+
+
+# Each check validates a fast algorithm against a reference one on a graph
+# and returns a list of mismatch descriptions
+CHECKS = {
+    'frontier_bfs': _check_frontier_bfs,
+}
+
+# Extra graphs for the checks only, so directed inputs are covered as well
+_CHECK_GENERATORS = {
+    'erdos_renyi_directed': lambda n, seed=0: erdos_renyi(n, seed=seed, directed=True),
+}
+
+
+def run_checks(sizes=DEFAULT_SIZES, generators=None, seed=0, progress=None):
+    """
+    Runs every check in CHECKS on every generated graph.
+
+    Args:
+        sizes (iterable): Graph sizes (vertex counts) to generate.
+        generators (iterable): Generator names (default: all of GENERATORS,
+                               plus a directed Erdos-Renyi graph).
+        seed (int): Seed passed to every generator.
+        progress (callable): Optional callback invoked with each result dict.
+
+    Returns:
+        list: One dict per check and graph: {generator, size, check, failures}.
+    """
+    available = dict(GENERATORS, **_CHECK_GENERATORS)
+    results = []
+    for generator in generators or available:
+        for size in sizes:
+            graph = available[generator](size, seed=seed)
+            for check, run in CHECKS.items():
+                result = {'generator': generator, 'size': size, 'check': check,
+                          'failures': run(graph)}
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+    return results
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, generators=None, algorithms=None, repeat=3, seed=0,
+                   progress=None):
+    """
+    Times every algorithm on every generated graph.
+
+    Args:
+        sizes (iterable): Graph sizes (vertex counts) to generate.
+        generators (iterable): Generator names (default: all of GENERATORS).
+        algorithms (iterable): Algorithm names (default: all of CASES).
+        repeat (int): Timed runs per case; the fastest one is reported.
+        seed (int): Seed passed to every generator.
+        progress (callable): Optional callback invoked with each result dict.
+
+    Returns:
+        dict: {'meta': {...}, 'results': [{generator, size, vertices, edges,
+              algorithm, seconds}, ...]}
+    """
+    results = []
+    for generator in generators or GENERATORS:
+        for size in sizes:
+            graph = GENERATORS[generator](size, seed=seed)
+            vertices = len(graph.get_all_vertices())
+            edges = sum(1 for _ in graph.iter_edges())
+            for algorithm in algorithms or CASES:
+                case = CASES[algorithm](graph)
+                if case is None:
+                    continue
+                best = float('inf')
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    case()
+                    best = min(best, time.perf_counter() - started)
+                result = {
+                    'generator': generator,
+                    'size': size,
+                    'vertices': vertices,
+                    'edges': edges,
+                    'algorithm': algorithm,
+                    'seconds': best,
+                }
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'seed': seed,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(current, baseline, threshold=1.25, min_seconds=0.001):
+    """
+    Finds cases that got slower than the baseline.
+
+    Args:
+        current (dict): Output of run_benchmarks.
+        baseline (dict): An earlier output of run_benchmarks.
+        threshold (float): Slowdown factor above which a case is flagged.
+        min_seconds (float): Cases faster than this in both runs are ignored,
+                             since their timings are mostly noise.
+
+    Returns:
+        list: One dict per regression with the case key, both timings and the ratio.
+    """
+    def key(result):
+        return result['generator'], result['size'], result['algorithm']
+
+    baseline_seconds = {key(r): r['seconds'] for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        before = baseline_seconds.get(key(result))
+        if before is None or max(before, result['seconds']) < min_seconds:
+            continue
+        ratio = result['seconds'] / before if before > 0 else float('inf')
+        if ratio > threshold:
+            generator, size, algorithm = key(result)
+            regressions.append({
+                'generator': generator,
+                'size': size,
+                'algorithm': algorithm,
+                'baseline_seconds': before,
+                'seconds': result['seconds'],
+                'ratio': ratio,
+            })
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--generators', nargs='+', choices=sorted(GENERATORS))
+    parser.add_argument('--algorithms', nargs='+', choices=sorted(CASES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Write the results as JSON to this file.')
+    parser.add_argument('--baseline', help='Compare against the results in this JSON file.')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Slowdown factor that counts as a regression (default 1.25).')
+    parser.add_argument('--check', action='store_true',
+                        help='Validate the fast algorithm variants instead of timing.')
+    args = parser.parse_args(argv)
+
+    if args.check:
+        def report_check(result):
+            status = 'ok' if not result['failures'] else 'FAILED'
+            print(f"{result['generator']:>20} n={result['size']:<8} {result['check']:<16}{status}")
+            for failure in result['failures']:
+                print(f"    {failure}")
+
+        results = run_checks(args.sizes, args.generators, seed=args.seed, progress=report_check)
+        return 1 if any(r['failures'] for r in results) else 0
+
+    def report(result):
+        print(f"{result['generator']:>16} n={result['size']:<8} {result['algorithm']:<22}"
+              f"{result['seconds'] * 1000:10.2f} ms")
+
+    current = run_benchmarks(args.sizes, args.generators, args.algorithms,
+                             repeat=args.repeat, seed=args.seed, progress=report)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r['generator']} n={r['size']} {r['algorithm']}: "
+                  f"{r['baseline_seconds'] * 1000:.2f} ms -> {r['seconds'] * 1000:.2f} ms "
+                  f"({r['ratio']:.2f}x)")
+        if regressions:
+            return 1
+        print(f"No regressions above {args.threshold:.2f}x.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,425 @@
+# graph_project/datastructures/graph/csr_graph.py
+from array import array
+
+
+class CSRGraph:
+    """
+    A frozen, array-backed graph in Compressed Sparse Row (CSR) form.
+
+    Vertex labels are interned to dense integer ids 0..n-1 (in the insertion
+    order of the source graph). The out-edges of vertex id i are stored in
+    targets[offsets[i]:offsets[i + 1]], with the matching edge weights in
+    weights[offsets[i]:offsets[i + 1]]. Undirected graphs store both
+    directions of every edge, just like Graph does.
+
+    The CSRGraph exposes the same read-only interface as Graph
+    (get_neighbors, get_all_vertices, get_all_edges, iter_edges), so any algorithm
+    written against Graph keeps working. The algorithms in algorithms.graph
+    detect a CSRGraph and run directly on the integer arrays instead.
+    """
+
+    def __init__(self, labels, offsets, targets, weights, directed=False):
+        """
+        Initializes the CSR graph from already-built buffers.
+        Most callers should use Graph.freeze() or CSRGraph.from_graph().
+
+        Args:
+            labels (list): Vertex labels, indexed by vertex id. A range(n)
+                           means the labels are the ids themselves, and any
+                           other sequence (such as the memory-mapped labels
+                           of a snapshot) is only indexed on first use.
+            offsets (array): Edge offsets per vertex id (length n + 1).
+            targets (array): Target vertex id of every edge (length m).
+            weights (array): Weight of every edge (length m).
+            directed (bool): Whether the graph is directed.
+        """
+        if len(offsets) != len(labels) + 1:
+            raise ValueError("offsets must have exactly one more entry than labels.")
+        if len(targets) != len(weights):
+            raise ValueError("targets and weights must have the same length.")
+
+        self.labels = labels
+        self._index = None
+        if isinstance(labels, range):
+            if labels != range(len(labels)):
+                raise ValueError("Range labels must be range(n).")
+            self._index = _IdentityIndex(len(labels))
+        elif isinstance(labels, list):
+            self._index = _build_index(labels)
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._directed = directed
+        self._reverse = None
+        self._mapping = None  # Backing mmap when loaded from a snapshot file
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Builds a CSRGraph from a Graph instance.
+
+        Args:
+            graph (Graph): The graph to freeze.
+
+        Returns:
+            CSRGraph: A compact, immutable copy of the graph.
+        """
+        labels = graph.get_all_vertices()
+        index = {label: i for i, label in enumerate(labels)}
+
+        offsets = array('q', [0])
+        targets = array('q')
+        weight_list = []
+        for vertex in labels:
+            for neighbor, weight in graph.get_neighbors(vertex):
+                targets.append(index[neighbor])
+                weight_list.append(weight)
+            offsets.append(len(targets))
+
+        return cls(labels, offsets, targets, _weight_array(weight_list),
+                   directed=graph._directed)
+
+    @classmethod
+    def from_edges(cls, edges, directed=False):
+        """
+        Builds a CSRGraph straight from an iterable of edges, without ever
+        materializing a Graph. Each edge is a (vertex1, vertex2) or
+        (vertex1, vertex2, weight) tuple. Duplicate edges keep the first weight.
+
+        Args:
+            edges (iterable): The edges of the graph.
+            directed (bool): Whether the graph is directed.
+
+        Returns:
+            CSRGraph: The built graph.
+        """
+        builder = CSRBuilder(directed=directed)
+        builder.add_edges(edges)
+        return builder.build()
+
+    @property
+    def index(self):
+        """
+        The {label: vertex id} mapping, built on first use when the labels
+        came from a snapshot.
+        """
+        if self._index is None:
+            self._index = _build_index(self.labels)
+        return self._index
+
+    @property
+    def version(self):
+        """
+        Always 0: a CSRGraph is immutable, so cached results never go stale.
+        """
+        return 0
+
+    @property
+    def weight_typecode(self):
+        """
+        'q' if the weights are int64, 'd' if they are float64. Works for
+        array buffers as well as memory-mapped memoryviews.
+        """
+        return getattr(self.weights, 'typecode', None) or self.weights.format
+
+    @property
+    def num_vertices(self):
+        """The number of vertices in the graph."""
+        return len(self.labels)
+
+    @property
+    def num_edges(self):
+        """The number of stored (directed) adjacency entries."""
+        return len(self.targets)
+
+    def reverse(self):
+        """
+        Returns the transpose of this graph (every edge u -> v becomes v -> u),
+        sharing the label table. Undirected graphs are their own reverse.
+        The result is built once and cached, since the graph is immutable.
+
+        Returns:
+            CSRGraph: The reversed graph.
+        """
+        if not self._directed:
+            return self
+        if self._reverse is None:
+            n = len(self.labels)
+            offsets, targets, weights = self.offsets, self.targets, self.weights
+            in_offsets = array('q', bytes(8 * (n + 1)))
+            for v in targets:
+                in_offsets[v + 1] += 1
+            for i in range(n):
+                in_offsets[i + 1] += in_offsets[i]
+
+            cursor = array('q', in_offsets[:-1])
+            in_targets = array('q', bytes(8 * len(targets)))
+            in_weights = array(self.weight_typecode, bytes(weights.itemsize * len(weights)))
+            for u in range(n):
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    position = cursor[v]
+                    cursor[v] = position + 1
+                    in_targets[position] = u
+                    in_weights[position] = weights[k]
+
+            reverse = CSRGraph(self.labels, in_offsets, in_targets, in_weights, directed=True)
+            reverse._index = self._index
+            reverse._reverse = self
+            self._reverse = reverse
+        return self._reverse
+
+    def neighbor_ids(self, vertex_id):
+        """
+        Gets the neighbor ids and edge weights of a vertex id.
+
+        Args:
+            vertex_id (int): The dense id of the vertex.
+
+        Returns:
+            A tuple (targets, weights) of array slices.
+        """
+        start, end = self.offsets[vertex_id], self.offsets[vertex_id + 1]
+        return self.targets[start:end], self.weights[start:end]
+
+    def get_neighbors(self, vertex):
+        """
+        Gets the neighbors of a given vertex along with edge weights.
+
+        Args:
+            vertex: The vertex label whose neighbors are to be retrieved.
+
+        Returns:
+            A list of (neighbor, weight) tuples, or an empty list if the
+            vertex is not in the graph or has no neighbors.
+        """
+        vertex_id = self.index.get(vertex)
+        if vertex_id is None:
+            return []
+        labels = self.labels
+        start, end = self.offsets[vertex_id], self.offsets[vertex_id + 1]
+        return [(labels[self.targets[k]], self.weights[k]) for k in range(start, end)]
+
+    def get_all_vertices(self):
+        """
+        Returns a list of all vertices in the graph.
+        """
+        return list(self.labels)
+
+    def get_all_edges(self):
+        """
+        Returns a list of all edges in the graph.
+        Each edge is represented as a tuple (vertex1, vertex2, weight).
+        For undirected graphs, each edge is listed once.
+        """
+        return list(self.iter_edges())
+
+    def iter_edges(self):
+        """
+        Yields the edges of get_all_edges() one at a time, without building the list.
+        """
+        labels, offsets, targets, weights = self.labels, self.offsets, self.targets, self.weights
+        directed = self._directed
+        for u in range(len(labels)):
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if directed or u <= v:
+                    yield labels[u], labels[v], weights[k]
+
+    def save(self, path):
+        """
+        Writes the graph to a binary snapshot file. See Graph.save().
+        """
+        from .snapshot import save_snapshot
+        save_snapshot(self, path)
+
+    @staticmethod
+    def load(path, mmap=True):
+        """
+        Loads a snapshot file. See Graph.load().
+        """
+        from .snapshot import load_snapshot
+        return load_snapshot(path, mmap=mmap)
+
+    def to_numpy(self):
+        """
+        Returns zero-copy NumPy views of the (offsets, targets, weights) buffers.
+        Requires NumPy to be installed.
+        """
+        import numpy as np
+        return (np.frombuffer(self.offsets, dtype=np.int64),
+                np.frombuffer(self.targets, dtype=np.int64),
+                np.frombuffer(self.weights, dtype=_NUMPY_WEIGHT_DTYPES[self.weight_typecode]))
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, vertex):
+        return vertex in self.index
+
+    def __str__(self):
+        """
+        String representation of the graph.
+        """
+        kind = 'Directed' if self._directed else 'Undirected'
+        return f"{kind} CSRGraph: {self.num_vertices} vertices, {self.num_edges} adjacency entries"
+
+
+class CSRBuilder:
+    """
+    Incrementally collects edges into flat arrays and packs them into a
+    CSRGraph. Memory use is a few machine words per edge, plus a set of
+    integer keys used to drop duplicate edges in amortized O(1).
+    Neighbor order matches what Graph.add_edge would produce.
+    """
+
+    def __init__(self, directed=False):
+        """
+        Initializes an empty builder.
+
+        Args:
+            directed (bool): Whether the built graph is directed.
+        """
+        self._directed = directed
+        self.labels = []
+        self.index = {}
+        self._sources = array('q')
+        self._targets = array('q')
+        self._weights = array('q')
+        self._seen = set()
+
+    def add_vertex(self, vertex):
+        """
+        Interns a vertex label and returns its dense id.
+        """
+        vertex_id = self.index.get(vertex)
+        if vertex_id is None:
+            vertex_id = self.index[vertex] = len(self.labels)
+            self.labels.append(vertex)
+        return vertex_id
+
+    def add_edges(self, edges):
+        """
+        Adds edges given as (vertex1, vertex2) or (vertex1, vertex2, weight) tuples.
+
+        Returns:
+            int: The number of edges that were actually added.
+        """
+        add_vertex = self.add_vertex
+        seen = self._seen
+        sources, targets = self._sources, self._targets
+        directed = self._directed
+        added = 0
+
+        for edge in edges:
+            if len(edge) == 2:
+                vertex1, vertex2 = edge
+                weight = 1
+            else:
+                vertex1, vertex2, weight = edge
+            u = add_vertex(vertex1)
+            v = add_vertex(vertex2)
+
+            key = (u << 32) | v if directed or u <= v else (v << 32) | u
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if self._weights.typecode == 'q' and type(weight) is not int:
+                self._weights = array('d', self._weights)
+            sources.append(u)
+            targets.append(v)
+            self._weights.append(weight)
+            if not directed and u != v:
+                sources.append(v)
+                targets.append(u)
+                self._weights.append(weight)
+            added += 1
+        return added
+
+    @property
+    def num_edges(self):
+        """The number of distinct edges added so far."""
+        return len(self._seen)
+
+    def build(self):
+        """
+        Packs the collected edges into a CSRGraph with a stable counting sort.
+
+        Returns:
+            CSRGraph: The built graph.
+        """
+        n = len(self.labels)
+        sources, targets, weights = self._sources, self._targets, self._weights
+
+        offsets = array('q', bytes(8 * (n + 1)))
+        for u in sources:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        cursor = array('q', offsets[:-1])
+        packed_targets = array('q', bytes(8 * len(targets)))
+        packed_weights = array(weights.typecode, bytes(weights.itemsize * len(weights)))
+        for k in range(len(sources)):
+            u = sources[k]
+            position = cursor[u]
+            cursor[u] = position + 1
+            packed_targets[position] = targets[k]
+            packed_weights[position] = weights[k]
+
+        return CSRGraph(list(self.labels), offsets, packed_targets, packed_weights,
+                        directed=self._directed)
+
+
+class _IdentityIndex:
+    """
+    The index of the labels 0..n-1, where every label is its own id,
+    answered without storing a dict.
+    """
+
+    def __init__(self, n):
+        self.n = n
+
+    def get(self, label, default=None):
+        if isinstance(label, int) and 0 <= label < self.n:
+            return int(label)
+        return default
+
+    def __getitem__(self, label):
+        vertex_id = self.get(label)
+        if vertex_id is None:
+            raise KeyError(label)
+        return vertex_id
+
+    def __contains__(self, label):
+        return self.get(label) is not None
+
+    def __iter__(self):
+        return iter(range(self.n))
+
+    def __len__(self):
+        return self.n
+
+
+def _build_index(labels):
+    index = {label: i for i, label in enumerate(labels)}
+    if len(index) != len(labels):
+        raise ValueError("Vertex labels must be unique.")
+    return index
+
+
+_NUMPY_WEIGHT_DTYPES = {'q': 'int64', 'd': 'float64'}
+
+
+def _weight_array(weights):
+    """
+    Packs edge weights into an int64 array when they are all integers,
+    otherwise into a float64 array.
+    """
+    if all(type(w) is int for w in weights):
+        try:
+            return array('q', weights)
+        except OverflowError:
+            pass
+    return array('d', weights)
@@ -1,9 +1,19 @@
 # graph_project/graph_definition.py
+from .csr_graph import CSRGraph
+from .snapshot import load_snapshot, save_snapshot
+from .union_find import UnionFind
+from .views import EdgeFilterView, ReverseView, SubgraphView
+
+# Neighbors of a vertex that is not in the graph; never mutated
+_NO_NEIGHBORS = {}
 
 class Graph:
     """
-    A graph data structure implemented using an adjacency list.
-    Supports both directed and undirected graphs, and weighted edges.
+    A graph data structure implemented using a hashed adjacency list: every
+    vertex maps to a dict of {neighbor: weight} in insertion order, so edge
+    lookups, weight updates and removals are O(1) and traversals stay
+    deterministic. Supports both directed and undirected graphs, and
+    weighted edges.
     """
 
     def __init__(self, directed=False):
@@ -14,8 +24,24 @@ class Graph:
             directed (bool): If True, the graph is directed.
                              If False (default), the graph is undirected.
         """
-        self._graph = {}  # Vertex: [(neighbor, weight), ...]
+        self._graph = {}  # Vertex: {neighbor: weight}
         self._directed = directed
+        self._version = 0  # Bumped on every mutation, see the version property
+        self._components = None  # UnionFind kept in sync once track_components() is called
+        self._reverse = None  # Directed graphs: vertex: {predecessor: weight}, once track_in_edges() is called
+        # Copy-on-write state, see snapshot(): whether the vertex dict is still
+        # shared with the last snapshot, and the vertices whose neighbor list
+        # this graph has copied since then (None until the first snapshot)
+        self._dict_shared = False
+        self._owned = None
+
+    @property
+    def version(self):
+        """
+        A counter that increases every time the graph is mutated.
+        Caches can store it alongside derived results to detect staleness.
+        """
+        return self._version
 
     def add_vertex(self, vertex):
         """
@@ -25,7 +51,16 @@ class Graph:
             vertex: The vertex to be added.
         """
         if vertex not in self._graph:
-            self._graph[vertex] = []
+            if self._dict_shared:
+                self._unshare()
+            self._graph[vertex] = {}
+            if self._owned is not None:
+                self._owned.add(vertex)
+            if self._reverse is not None:
+                self._reverse[vertex] = {}
+            self._version += 1
+            if self._components is not None:
+                self._components.add(vertex)
 
     def add_edge(self, vertex1, vertex2, weight=1):
         """
@@ -39,25 +74,220 @@ class Graph:
         """
         self.add_vertex(vertex1)
         self.add_vertex(vertex2)
+        if self._components is not None:
+            self._components.union(vertex1, vertex2)
 
         # Add edge from vertex1 to vertex2
-        # Avoid adding duplicate edges; you might want to update weight if it exists
-        # For this implementation, we simply add if not present by neighbor name
-        v1_neighbors = [n for n, w in self._graph[vertex1]]
-        if vertex2 not in v1_neighbors:
-            self._graph[vertex1].append((vertex2, weight))
-        # else:
-        #     print(f"Edge from {vertex1} to {vertex2} already exists or use update_edge_weight.")
-
+        # Duplicate edges are skipped and keep their weight; use set_weight to change it
+        if vertex2 not in self._graph[vertex1]:
+            self._writable_neighbors(vertex1)[vertex2] = weight
+            self._version += 1
+            if self._reverse is not None:
+                self._reverse[vertex2][vertex1] = weight
 
         if not self._directed:
             # If undirected, add an edge back from vertex2 to vertex1
-            v2_neighbors = [n for n, w in self._graph[vertex2]]
-            if vertex1 not in v2_neighbors:
-                self._graph[vertex2].append((vertex1, weight))
-            # else:
-            #     print(f"Edge from {vertex2} to {vertex1} already exists or use update_edge_weight.")
+            if vertex1 not in self._graph[vertex2]:
+                self._writable_neighbors(vertex2)[vertex1] = weight
+                self._version += 1
+
+    def add_edges_from(self, edges):
+        """
+        Adds many edges at once. Each edge is a (vertex1, vertex2) or
+        (vertex1, vertex2, weight) tuple; missing vertices are added.
+        Duplicate edges are skipped like in add_edge. The mutation bookkeeping
+        is done once per batch rather than once per edge.
+
+        Args:
+            edges (iterable): The edges to add.
+
+        Returns:
+            int: The number of edges that were actually added.
+        """
+        if self._dict_shared:
+            self._unshare()
+        graph = self._graph
+        owned = self._owned
+        reverse = self._reverse
+
+        def append_unique(vertex, neighbor, weight):
+            neighbors = graph[vertex]
+            if neighbor in neighbors:
+                return False
+            if owned is not None and vertex not in owned:
+                neighbors = self._writable_neighbors(vertex)
+            neighbors[neighbor] = weight
+            return True
+
+        added = 0
+        for edge in edges:
+            if len(edge) == 2:
+                vertex1, vertex2 = edge
+                weight = 1
+            else:
+                vertex1, vertex2, weight = edge
+            self.add_vertex(vertex1)
+            self.add_vertex(vertex2)
+            if self._components is not None:
+                self._components.union(vertex1, vertex2)
+
+            if append_unique(vertex1, vertex2, weight):
+                added += 1
+                if reverse is not None:
+                    reverse[vertex2][vertex1] = weight
+            if not self._directed:
+                append_unique(vertex2, vertex1, weight)
+        if added:
+            self._version += 1
+        return added
+
+    def has_edge(self, vertex1, vertex2):
+        """
+        Checks whether there is an edge from vertex1 to vertex2 in O(1).
+        """
+        return vertex2 in self._graph.get(vertex1, _NO_NEIGHBORS)
 
+    def get_weight(self, vertex1, vertex2):
+        """
+        Returns the weight of the edge from vertex1 to vertex2 in O(1).
+        Raises KeyError if there is no such edge.
+        """
+        try:
+            return self._graph[vertex1][vertex2]
+        except KeyError:
+            raise KeyError((vertex1, vertex2)) from None
+
+    def set_weight(self, vertex1, vertex2, weight):
+        """
+        Changes the weight of an existing edge in O(1) (in both directions
+        for undirected graphs). Raises KeyError if there is no such edge.
+
+        Args:
+            vertex1: The first vertex.
+            vertex2: The second vertex.
+            weight (int/float): The new weight.
+        """
+        self._replace_neighbor(vertex1, vertex2, weight)
+        if not self._directed and vertex1 != vertex2:
+            self._replace_neighbor(vertex2, vertex1, weight)
+        self._version += 1
+
+    def remove_edge(self, vertex1, vertex2):
+        """
+        Removes an edge in O(1) (in both directions for undirected graphs).
+        The vertices stay. Raises KeyError if there is no such edge.
+
+        Args:
+            vertex1: The first vertex.
+            vertex2: The second vertex.
+        """
+        self._replace_neighbor(vertex1, vertex2, None)
+        if not self._directed and vertex1 != vertex2:
+            self._replace_neighbor(vertex2, vertex1, None)
+        self._version += 1
+        if self._components is not None:
+            # A union-find cannot split a component, so rebuild it
+            self._components = UnionFind.from_graph(self)
+
+    def remove_vertex(self, vertex):
+        """
+        Removes a vertex and every edge touching it. Raises KeyError if the
+        vertex is not in the graph.
+
+        This takes O(degree) for undirected graphs and for directed graphs
+        with track_in_edges() on; otherwise finding the edges into the
+        vertex scans every vertex.
+
+        Args:
+            vertex: The vertex to remove.
+        """
+        if vertex not in self._graph:
+            raise KeyError(vertex)
+        if self._dict_shared:
+            self._unshare()
+
+        if not self._directed:
+            predecessors = list(self._graph[vertex])
+        elif self._reverse is not None:
+            predecessors = list(self._reverse.pop(vertex))
+            for neighbor in self._graph[vertex]:
+                if neighbor != vertex:
+                    del self._reverse[neighbor][vertex]
+        else:
+            predecessors = [u for u, neighbors in self._graph.items() if vertex in neighbors]
+
+        for predecessor in predecessors:
+            if predecessor != vertex:
+                del self._writable_neighbors(predecessor)[vertex]
+        del self._graph[vertex]
+        if self._owned is not None:
+            self._owned.discard(vertex)
+        self._version += 1
+        if self._components is not None:
+            self._components = UnionFind.from_graph(self)
+
+    def _replace_neighbor(self, vertex, neighbor, weight):
+        """
+        Sets the weight of the vertex -> neighbor entry, or deletes the entry
+        if weight is None, keeping the reverse index in sync.
+        """
+        if neighbor not in self._graph.get(vertex, _NO_NEIGHBORS):
+            raise KeyError((vertex, neighbor))
+        neighbors = self._writable_neighbors(vertex)
+        if weight is None:
+            del neighbors[neighbor]
+        else:
+            neighbors[neighbor] = weight
+        if self._reverse is not None:
+            if weight is None:
+                del self._reverse[neighbor][vertex]
+            else:
+                self._reverse[neighbor][vertex] = weight
+
+    def _writable_neighbors(self, vertex):
+        """
+        Returns the neighbor dict of vertex for modification, first copying it
+        if the last snapshot may still share it.
+        """
+        if self._dict_shared:
+            self._unshare()
+        owned = self._owned
+        if owned is None or vertex in owned:
+            return self._graph[vertex]
+        owned.add(vertex)
+        neighbors = self._graph[vertex] = dict(self._graph[vertex])
+        return neighbors
+
+    def _unshare(self):
+        self._graph = dict(self._graph)
+        self._dict_shared = False
+
+    def snapshot(self):
+        """
+        Returns an immutable view of the graph as it is now, in O(1).
+
+        The snapshot shares the vertex dict and neighbor dicts with this
+        graph. After it is taken, the first mutation copies the vertex dict
+        (references only) and every neighbor dict is copied the first time it
+        is modified, so the snapshot never changes. The in-edge index of
+        track_in_edges() is not shared. Reader threads can run
+        any algorithm on a snapshot without locks while one writer keeps
+        mutating the graph; call snapshot() from the writer thread.
+
+        Returns:
+            GraphSnapshot: The read-only view, a Graph whose mutators raise TypeError.
+        """
+        snapshot = GraphSnapshot.__new__(GraphSnapshot)
+        snapshot._graph = self._graph
+        snapshot._directed = self._directed
+        snapshot._version = self._version
+        snapshot._components = None
+        snapshot._reverse = None
+        snapshot._dict_shared = False
+        snapshot._owned = None
+        self._dict_shared = True
+        self._owned = set()
+        return snapshot
 
     def get_neighbors(self, vertex):
         """
@@ -67,10 +297,81 @@ class Graph:
             vertex: The vertex whose neighbors are to be retrieved.
 
         Returns:
-            A list of (neighbor, weight) tuples, or an empty list if the
-            vertex is not in the graph or has no neighbors.
+            A sized, reversible view of the (neighbor, weight) pairs, empty
+            if the vertex is not in the graph or has no neighbors.
+        """
+        return self._graph.get(vertex, _NO_NEIGHBORS).items()
+
+    def get_in_neighbors(self, vertex):
+        """
+        Gets the vertices with an edge into vertex, along with edge weights.
+        For undirected graphs this is get_neighbors(vertex). For directed
+        graphs it is O(in-degree) once track_in_edges() was called and scans
+        every vertex otherwise.
+
+        Args:
+            vertex: The vertex whose in-neighbors are to be retrieved.
+
+        Returns:
+            An iterable of (neighbor, weight) pairs.
         """
-        return self._graph.get(vertex, [])
+        if not self._directed:
+            return self.get_neighbors(vertex)
+        if self._reverse is not None:
+            return self._reverse.get(vertex, _NO_NEIGHBORS).items()
+        return [(u, neighbors[vertex]) for u, neighbors in self._graph.items() if vertex in neighbors]
+
+    def track_in_edges(self):
+        """
+        Starts keeping an index of the in-edges of every vertex up to date on
+        every mutation, so get_in_neighbors and remove_vertex need no scan of
+        the whole graph. Only directed graphs need one; it is built from the
+        current edges on the first call.
+        """
+        if self._directed and self._reverse is None:
+            reverse = {vertex: {} for vertex in self._graph}
+            for vertex, neighbors in self._graph.items():
+                for neighbor, weight in neighbors.items():
+                    reverse[neighbor][vertex] = weight
+            self._reverse = reverse
+
+    def reverse_view(self):
+        """
+        Returns a view of the graph with every edge reversed, without copying
+        the adjacency. For directed graphs the first call turns on
+        track_in_edges(), whose index backs the view.
+
+        Returns:
+            ReverseView: The view; it reflects later changes to the graph.
+        """
+        return ReverseView(self)
+
+    def subgraph_view(self, vertices):
+        """
+        Returns a view of the subgraph induced by vertices, without copying
+        the adjacency. Neighbor lists are filtered as they are read.
+
+        Args:
+            vertices (iterable): The vertices to keep.
+
+        Returns:
+            SubgraphView: The view; it reflects later edge changes to the graph.
+        """
+        return SubgraphView(self, vertices)
+
+    def edge_filter_view(self, predicate):
+        """
+        Returns a view with only the edges for which predicate(vertex1,
+        vertex2, weight) is true, without copying the adjacency.
+
+        Args:
+            predicate (callable): The edge filter. For undirected graphs it
+                                  should be symmetric in vertex1 and vertex2.
+
+        Returns:
+            EdgeFilterView: The view; it reflects later changes to the graph.
+        """
+        return EdgeFilterView(self, predicate)
 
     def get_all_vertices(self):
         """
@@ -84,20 +385,113 @@ class Graph:
         Each edge is represented as a tuple (vertex1, vertex2, weight).
         For undirected graphs, edges are listed once based on internal representation.
         """
-        edges = []
-        visited_undirected_edges = set() # To avoid duplicate edges in undirected graph output
+        return list(self.iter_edges())
 
-        for vertex, neighbors in self._graph.items():
-            for neighbor, weight in neighbors:
-                if self._directed:
-                    edges.append((vertex, neighbor, weight))
-                else:
-                    # For undirected, add edge only if not already added in reverse
-                    if (neighbor, vertex) not in visited_undirected_edges:
-                        edges.append((vertex, neighbor, weight))
-                        visited_undirected_edges.add((vertex, neighbor))
-        return edges
+    def iter_edges(self):
+        """
+        Yields the edges of get_all_edges() one at a time, in the same order,
+        without building the edge list. Prefer it when only iterating.
+
+        An undirected edge is stored in the neighbor lists of both endpoints
+        and is yielded from whichever endpoint was added to the graph first,
+        so only a vertex position index is needed instead of a set of every
+        edge seen. Do not mutate the graph while iterating.
+        """
+        if self._directed:
+            for vertex, neighbors in self._graph.items():
+                for neighbor, weight in neighbors.items():
+                    yield vertex, neighbor, weight
+            return
+
+        position = {vertex: i for i, vertex in enumerate(self._graph)}
+        for i, (vertex, neighbors) in enumerate(self._graph.items()):
+            for neighbor, weight in neighbors.items():
+                if i <= position[neighbor]:
+                    yield vertex, neighbor, weight
+
+    def track_components(self):
+        """
+        Starts keeping a union-find of the connected components up to date on
+        every add_vertex/add_edge, so component queries need no traversal.
+        The structure is bulk-built from the current edges on the first call.
+        For directed graphs the components are the weakly connected ones.
+        """
+        if self._components is None:
+            self._components = UnionFind.from_graph(self)
+
+    def component_of(self, vertex):
+        """
+        Returns the representative vertex of the component containing vertex.
+        Requires track_components(). Raises KeyError if the vertex is unknown.
+        """
+        return self._tracked_components().find(vertex)
+
+    def same_component(self, vertex1, vertex2):
+        """
+        Checks whether two vertices are in the same component.
+        Requires track_components().
+        """
+        return self._tracked_components().connected(vertex1, vertex2)
+
+    def component_count(self):
+        """
+        Returns the number of components. Requires track_components().
+        """
+        return self._tracked_components().component_count
+
+    def _tracked_components(self):
+        if self._components is None:
+            raise RuntimeError("Component tracking is off; call track_components() first.")
+        return self._components
+
+    def freeze(self):
+        """
+        Builds a compact, immutable CSRGraph copy of this graph.
+        Vertex labels are interned to dense integer ids in insertion order.
 
+        Returns:
+            CSRGraph: The frozen graph.
+        """
+        return CSRGraph.from_graph(self)
+
+
+    def save(self, path):
+        """
+        Writes the graph to a binary snapshot file (see snapshot.py for the layout).
+
+        Args:
+            path (str): The file to write.
+        """
+        save_snapshot(self, path)
+
+    @staticmethod
+    def load(path, mmap=True):
+        """
+        Loads a snapshot written by save(). The result is a frozen CSRGraph,
+        which every algorithm accepts; with mmap=True its arrays are
+        memory-mapped, so startup is near-instant and processes on the same
+        host share the page cache.
+
+        Args:
+            path (str): The file to read.
+            mmap (bool): If True (default), memory-map the arrays.
+
+        Returns:
+            CSRGraph: The loaded graph.
+        """
+        return load_snapshot(path, mmap=mmap)
+
+    def __contains__(self, vertex):
+        """
+        Checks whether a vertex is in the graph in O(1).
+        """
+        return vertex in self._graph
+
+    def __len__(self):
+        """
+        Returns the number of vertices in the graph.
+        """
+        return len(self._graph)
 
     def __str__(self):
         """
@@ -108,8 +502,40 @@ class Graph:
             return output + " (empty)"
         for vertex, neighbors in self._graph.items():
             if neighbors:
-                neighbor_str = ", ".join([f"{n}({w})" for n, w in neighbors])
+                neighbor_str = ", ".join([f"{n}({w})" for n, w in neighbors.items()])
             else:
                 neighbor_str = "(no outgoing edges)"
             output += f"  {vertex}: {neighbor_str}\n"
-        return output
\ No newline at end of file
+        return output
+
+
+class GraphSnapshot(Graph):
+    """
+    A read-only Graph returned by Graph.snapshot(). Every algorithm accepts
+    it; add_vertex, add_edge, add_edges_from, set_weight, remove_edge and
+    remove_vertex raise TypeError.
+    """
+
+    def add_vertex(self, vertex):
+        raise TypeError("Graph snapshots are read-only.")
+
+    def add_edge(self, vertex1, vertex2, weight=1):
+        raise TypeError("Graph snapshots are read-only.")
+
+    def add_edges_from(self, edges):
+        raise TypeError("Graph snapshots are read-only.")
+
+    def set_weight(self, vertex1, vertex2, weight):
+        raise TypeError("Graph snapshots are read-only.")
+
+    def remove_edge(self, vertex1, vertex2):
+        raise TypeError("Graph snapshots are read-only.")
+
+    def remove_vertex(self, vertex):
+        raise TypeError("Graph snapshots are read-only.")
+
+    def snapshot(self):
+        """
+        A snapshot never changes, so it is its own snapshot.
+        """
+        return self
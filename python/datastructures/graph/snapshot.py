@@ -0,0 +1,149 @@
+# graph_project/datastructures/graph/snapshot.py
+import mmap as _mmap
+import pickle
+import struct
+import sys
+from array import array
+
+from .csr_graph import CSRGraph
+
+# File layout (all integers little-endian, every section 8-byte aligned):
+#   header   magic, format version, directed flag, weight typecode, label kind,
+#            vertex count n, edge entry count m, label section size
+#   labels   int64[n] | int64 offsets[n + 1] + UTF-8 blob | pickle | nothing
+#            when the labels are exactly 0..n-1
+#   offsets  int64[n + 1]
+#   targets  int64[m]
+#   weights  int64[m] or float64[m]
+MAGIC = b'CHGRAPH\x00'
+FORMAT_VERSION = 1
+_HEADER = struct.Struct('<8sIBBBxQQQ')
+
+_LABELS_INT = 0
+_LABELS_STR = 1
+_LABELS_PICKLE = 2
+_LABELS_RANGE = 3
+
+
+def save_snapshot(graph, path):
+    """
+    Writes a graph to a versioned binary snapshot file.
+
+    Args:
+        graph (Graph or CSRGraph): The graph to save. A Graph is frozen first.
+        path (str): The file to write.
+    """
+    if sys.byteorder != 'little':
+        raise ValueError("Graph snapshots can only be written on little-endian hosts.")
+    csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+    label_kind, label_section = _encode_labels(csr.labels)
+
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, int(csr._directed),
+                             ord(csr.weight_typecode), label_kind,
+                             csr.num_vertices, csr.num_edges, len(label_section)))
+        f.write(label_section)
+        f.write(bytes(_padding(len(label_section))))
+        for buffer in (csr.offsets, csr.targets, csr.weights):
+            f.write(buffer)
+
+
+def load_snapshot(path, mmap=True):
+    """
+    Loads a snapshot written by save_snapshot as a CSRGraph.
+
+    With mmap=True the offset/target/weight arrays are memory-mapped
+    read-only instead of read, so loading costs only the label table and
+    every process that maps the same file shares one copy in the page cache.
+    Integer labels are mapped too, and labels 0..n-1 are not stored at all,
+    so such graphs load in constant time.
+
+    Labels that are neither all ints nor all strings are stored with pickle,
+    so only load such snapshots from trusted sources.
+
+    Args:
+        path (str): The file to read.
+        mmap (bool): If True (default), memory-map the arrays.
+
+    Returns:
+        CSRGraph: The loaded graph.
+        Raises ValueError if the file is not a snapshot of a supported version,
+        or if the host is big-endian (the arrays are stored little-endian).
+    """
+    if sys.byteorder != 'little':
+        raise ValueError("Graph snapshots can only be loaded on little-endian hosts.")
+    with open(path, 'rb') as f:
+        if mmap:
+            data = _mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ)
+        else:
+            data = f.read()
+
+    view = memoryview(data)
+    if len(view) < _HEADER.size:
+        raise ValueError(f"{path} is not a graph snapshot.")
+    magic, version, directed, weight_code, label_kind, n, m, label_size = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a graph snapshot.")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported graph snapshot version {version} (expected {FORMAT_VERSION}).")
+
+    position = _HEADER.size
+    labels = _decode_labels(label_kind, view[position:position + label_size], n, mmap)
+    position += label_size + _padding(label_size)
+
+    buffers = []
+    for typecode, length in (('q', n + 1), ('q', m), (chr(weight_code), m)):
+        section = view[position:position + 8 * length]
+        if len(section) != 8 * length:
+            raise ValueError(f"Truncated graph snapshot: {path}")
+        if mmap:
+            buffers.append(section.cast(typecode))
+        else:
+            buffer = array(typecode)
+            buffer.frombytes(section)
+            buffers.append(buffer)
+        position += 8 * length
+
+    graph = CSRGraph(labels, *buffers, directed=bool(directed))
+    if mmap:
+        # The memoryviews point into the mapping; keep it open as long as the graph lives
+        graph._mapping = data
+    return graph
+
+
+def _encode_labels(labels):
+    if all(type(label) is int for label in labels):
+        if all(label == i for i, label in enumerate(labels)):
+            return _LABELS_RANGE, b''
+        try:
+            return _LABELS_INT, array('q', labels).tobytes()
+        except OverflowError:
+            pass
+    if all(type(label) is str for label in labels):
+        encoded = [label.encode('utf-8') for label in labels]
+        offsets = array('q', [0])
+        for raw in encoded:
+            offsets.append(offsets[-1] + len(raw))
+        return _LABELS_STR, offsets.tobytes() + b''.join(encoded)
+    return _LABELS_PICKLE, pickle.dumps(labels, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_labels(kind, section, n, mmap=False):
+    if kind == _LABELS_RANGE:
+        return range(n)
+    if kind == _LABELS_INT:
+        if mmap:
+            # Read from the mapping like the arrays; the index is built on first use
+            return section.cast('q')
+        return array('q', section.tobytes()).tolist()
+    if kind == _LABELS_STR:
+        offsets = array('q', section[:8 * (n + 1)].tobytes())
+        blob = section[8 * (n + 1):].tobytes()
+        return [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(n)]
+    if kind == _LABELS_PICKLE:
+        return pickle.loads(section)
+    raise ValueError(f"Unknown label encoding {kind} in graph snapshot.")
+
+
+def _padding(size):
+    return -size % 8
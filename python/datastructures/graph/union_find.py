@@ -0,0 +1,117 @@
+# graph_project/datastructures/graph/union_find.py
+
+
+class UnionFind:
+    """
+    A disjoint-set (union-find) structure with path compression and union
+    by rank. find, union and connected run in near-constant amortized time.
+    Elements can be any hashable values and are added on first use.
+    """
+
+    def __init__(self, elements=()):
+        """
+        Initializes the structure with every element in its own set.
+
+        Args:
+            elements (iterable): Initial elements.
+        """
+        self._parent = {}
+        self._rank = {}
+        self._count = 0
+        for element in elements:
+            self.add(element)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Builds a union-find of the (weakly) connected components of a graph
+        in one pass over its edges.
+
+        Args:
+            graph (Graph): The graph.
+
+        Returns:
+            UnionFind: The components of the graph.
+        """
+        union_find = cls(graph.get_all_vertices())
+        union = union_find.union
+        for vertex in graph.get_all_vertices():
+            for neighbor, _ in graph.get_neighbors(vertex):
+                union(vertex, neighbor)
+        return union_find
+
+    def add(self, element):
+        """
+        Adds an element as a singleton set if it is not present yet.
+        """
+        if element not in self._parent:
+            self._parent[element] = element
+            self._rank[element] = 0
+            self._count += 1
+
+    def find(self, element):
+        """
+        Returns the representative of the set containing element,
+        compressing the path to it along the way.
+        Raises KeyError if the element is unknown.
+        """
+        parent = self._parent
+        root = element
+        while parent[root] != root:
+            root = parent[root]
+        while parent[element] != root:
+            parent[element], element = root, parent[element]
+        return root
+
+    def union(self, a, b):
+        """
+        Merges the sets containing a and b, adding either element if needed.
+
+        Returns:
+            bool: True if two different sets were merged.
+        """
+        self.add(a)
+        self.add(b)
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+
+        rank = self._rank
+        if rank[root_a] < rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        if rank[root_a] == rank[root_b]:
+            rank[root_a] += 1
+        self._count -= 1
+        return True
+
+    def connected(self, a, b):
+        """
+        Checks whether a and b are in the same set.
+        Returns False if either element is unknown.
+        """
+        if a not in self._parent or b not in self._parent:
+            return False
+        return self.find(a) == self.find(b)
+
+    @property
+    def component_count(self):
+        """The number of disjoint sets."""
+        return self._count
+
+    def components(self):
+        """
+        Returns the disjoint sets as a list of sets, ordered by the first
+        element of each set in insertion order.
+        """
+        groups = {}
+        for element in self._parent:
+            groups.setdefault(self.find(element), set()).add(element)
+        return list(groups.values())
+
+    def __contains__(self, element):
+        return element in self._parent
+
+    def __len__(self):
+        return len(self._parent)
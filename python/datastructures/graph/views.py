@@ -0,0 +1,189 @@
+# graph_project/datastructures/graph/views.py
+from .csr_graph import CSRGraph
+
+
+class GraphView:
+    """
+    Base class of the read-only views returned by Graph.reverse_view(),
+    Graph.subgraph_view() and Graph.edge_filter_view().
+
+    A view presents the read interface the algorithms use (get_neighbors,
+    get_all_vertices, iter_edges, ...) on top of another graph or view
+    without copying its adjacency, so views can be stacked. Views are live:
+    they reflect later changes to the underlying graph. Run algorithms on a
+    view of graph.snapshot() to get a view that never changes.
+    """
+
+    def __init__(self, graph):
+        """
+        Args:
+            graph (Graph or GraphView): The underlying graph.
+        """
+        self.graph = graph
+        self._directed = graph._directed
+
+    @property
+    def version(self):
+        """
+        The version counter of the underlying graph.
+        """
+        return self.graph.version
+
+    def get_neighbors(self, vertex):
+        """
+        Returns the (neighbor, weight) pairs of the edges leaving vertex in the view.
+        """
+        raise NotImplementedError
+
+    def get_in_neighbors(self, vertex):
+        """
+        Returns the (neighbor, weight) pairs of the edges entering vertex in the view.
+        """
+        raise NotImplementedError
+
+    def get_all_vertices(self):
+        """
+        Returns a list of all vertices in the view.
+        """
+        return self.graph.get_all_vertices()
+
+    def get_all_edges(self):
+        """
+        Returns a list of all edges in the view, as Graph.get_all_edges() does.
+        """
+        return list(self.iter_edges())
+
+    def iter_edges(self):
+        """
+        Yields the (vertex1, vertex2, weight) edges of the view, listing an
+        undirected edge once, from the endpoint that comes first.
+        """
+        vertices = self.get_all_vertices()
+        if self._directed:
+            for vertex in vertices:
+                for neighbor, weight in self.get_neighbors(vertex):
+                    yield vertex, neighbor, weight
+            return
+
+        position = {vertex: i for i, vertex in enumerate(vertices)}
+        for i, vertex in enumerate(vertices):
+            for neighbor, weight in self.get_neighbors(vertex):
+                if i <= position[neighbor]:
+                    yield vertex, neighbor, weight
+
+    # Views stack, see the Graph methods of the same names
+    def reverse_view(self):
+        return ReverseView(self)
+
+    def subgraph_view(self, vertices):
+        return SubgraphView(self, vertices)
+
+    def edge_filter_view(self, predicate):
+        return EdgeFilterView(self, predicate)
+
+    def freeze(self):
+        """
+        Builds a compact, immutable CSRGraph copy of the view.
+        """
+        return CSRGraph.from_graph(self)
+
+    def __contains__(self, vertex):
+        return vertex in self.graph
+
+    def __len__(self):
+        return len(self.graph)
+
+    def __str__(self):
+        kind = 'Directed' if self._directed else 'Undirected'
+        return f"{kind} {type(self).__name__}: {len(self)} vertices"
+
+
+class ReverseView(GraphView):
+    """
+    The graph with every edge reversed; for an undirected graph the same
+    edges. Creating the view over a directed Graph (or a view of one) builds
+    that Graph's in-edge index once, which it then keeps up to date (see
+    Graph.track_in_edges), so in-neighbor lookups never scan the graph.
+    """
+
+    def __init__(self, graph):
+        super().__init__(graph)
+        root = graph
+        while isinstance(root, GraphView):
+            root = root.graph
+        if self._directed:
+            root.track_in_edges()
+
+    def get_neighbors(self, vertex):
+        return self.graph.get_in_neighbors(vertex)
+
+    def get_in_neighbors(self, vertex):
+        return self.graph.get_neighbors(vertex)
+
+    def reverse_view(self):
+        return self.graph
+
+
+class SubgraphView(GraphView):
+    """
+    The subgraph induced by a set of vertices: only those vertices and the
+    edges between them.
+    """
+
+    def __init__(self, graph, vertices):
+        """
+        Args:
+            graph (Graph or GraphView): The underlying graph.
+            vertices (iterable): The vertices to keep, fixed when the view is
+                                 created; ones not in the graph are ignored.
+        """
+        super().__init__(graph)
+        self._keep = {vertex for vertex in vertices if vertex in graph}
+
+    def get_neighbors(self, vertex):
+        if vertex not in self._keep:
+            return []
+        keep = self._keep
+        return [(n, w) for n, w in self.graph.get_neighbors(vertex) if n in keep]
+
+    def get_in_neighbors(self, vertex):
+        if vertex not in self._keep:
+            return []
+        keep = self._keep
+        return [(n, w) for n, w in self.graph.get_in_neighbors(vertex) if n in keep]
+
+    def get_all_vertices(self):
+        # Kept in the order of the underlying graph, so traversals stay deterministic
+        keep = self._keep
+        return [vertex for vertex in self.graph.get_all_vertices() if vertex in keep]
+
+    def __contains__(self, vertex):
+        return vertex in self._keep and vertex in self.graph
+
+    def __len__(self):
+        return sum(1 for vertex in self._keep if vertex in self.graph)
+
+
+class EdgeFilterView(GraphView):
+    """
+    The graph with only the edges for which predicate(vertex1, vertex2, weight)
+    is true. All vertices are kept. For undirected graphs the predicate should
+    give the same answer for both directions of an edge.
+    """
+
+    def __init__(self, graph, predicate):
+        """
+        Args:
+            graph (Graph or GraphView): The underlying graph.
+            predicate (callable): predicate(vertex1, vertex2, weight) -> bool.
+        """
+        super().__init__(graph)
+        self.predicate = predicate
+
+    def get_neighbors(self, vertex):
+        predicate = self.predicate
+        return [(n, w) for n, w in self.graph.get_neighbors(vertex) if predicate(vertex, n, w)]
+
+    def get_in_neighbors(self, vertex):
+        predicate = self.predicate
+        return [(n, w) for n, w in self.graph.get_in_neighbors(vertex) if predicate(n, vertex, w)]
@@ -1,20 +1,142 @@
 # main.py
-# Adjust imports based on the new directory structure
+"""
+Runs a batch of queries against one graph, loaded once, and writes one JSON
+result per line. Queries use the JSON-lines format of service.server, e.g.
+{"id": 1, "op": "shortest_path", "source": "A", "target": "D"}; see its
+docstring for the operations. Per-query timings go to stderr.
 
-# Assuming graph_definition.py is inside datastructures/graph/
-from datastructures.graph.graph import Graph
+    python main.py --edges roads.tsv --int-vertices queries.jsonl > results.jsonl
+    python main.py --snapshot graph.bin < queries.jsonl
 
-# Assuming algorithm files are inside algorithms/graph/
-from algorithms.graph.bfs import bfs
-from algorithms.graph.dfs import dfs, dfs_recursive
-from algorithms.graph.dijkstra import dijkstra, get_shortest_path
-from algorithms.graph.bellman_ford import bellman_ford
-from algorithms.graph.cycle_detection import has_cycle # Assuming has_cycle is the generic one
-from algorithms.graph.connected_components import get_connected_components
-from algorithms.graph.graph_coloring import graph_coloring, print_coloring
-from algorithms.graph.graph_homomorphism import is_homomorphism, print_homomorphism_result
+Without --edges or --snapshot it runs a small demo of the algorithms.
+"""
+import argparse
+import json
+import sys
+import time
+from collections import OrderedDict
+
+from service.queries import (COMPUTATIONS, OPERATIONS, LatencyTracker, encode_response, error_message,
+                            load_graph, plan)
+
+
+def run_queries(graph, queries, output, cache_size=16, timings=sys.stderr):
+    """
+    Answers JSON-lines queries one after another.
+
+    Queries that need the same computation as a recent one (for example
+    several shortest_path queries from one source) reuse its result: the
+    last cache_size computation results are kept.
+
+    Args:
+        graph (Graph or CSRGraph): The graph to query.
+        queries (iterable): Lines of JSON, one query each; blank lines are skipped.
+        output (file): Where the JSON responses are written.
+        cache_size (int): Number of computation results kept for reuse.
+        timings (file): Where the per-query timings are written, or None.
+
+    Returns:
+        LatencyTracker: The latencies of the answered queries per operation.
+    """
+    latencies = LatencyTracker()
+    cache = OrderedDict()  # Computation key: result, least recently used first
+    for line in queries:
+        if not line.strip():
+            continue
+        started = time.perf_counter()
+        cached = False
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("A query must be a JSON object.")
+        except ValueError as e:
+            request = {}
+            response = {'id': None, 'ok': False, 'error': f"Bad request: {e}"}
+        else:
+            op = request.get('op')
+            response = {'id': request.get('id')}
+            try:
+                if op == 'stats':
+                    result = {'latency': latencies.report()}
+                else:
+                    key, finish = plan(request)
+                    cached = key in cache
+                    if cached:
+                        cache.move_to_end(key)
+                    else:
+                        cache[key] = COMPUTATIONS[key[0]](graph, *key[1:])
+                        if len(cache) > cache_size:
+                            cache.popitem(last=False)
+                    result = finish(cache[key])
+                response.update(ok=True, result=result)
+            except Exception as e:  # One failed query does not stop the batch
+                response.update(ok=False, error=error_message(e))
+        # A result JSON cannot encode is written as an error for this query only
+        output.write(encode_response(response) + '\n')
+
+        seconds = time.perf_counter() - started
+        op = request.get('op')
+        if op in OPERATIONS:
+            latencies.record(op, seconds)
+        if timings is not None:
+            note = ' (cached)' if cached else ''
+            print(f"{response['id']}\t{op}\t{1000 * seconds:.2f} ms{note}", file=timings)
+    return latencies
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--snapshot', help='Graph snapshot file written by Graph.save().')
+    source.add_argument('--edges', help='Edge list file (see load_edge_list).')
+    parser.add_argument('--directed', action='store_true', help='Treat the edge list as directed.')
+    parser.add_argument('--int-vertices', action='store_true', help='Parse edge list vertices as ints.')
+    parser.add_argument('--output', help='Write the results here instead of to stdout.')
+    parser.add_argument('--cache', type=int, default=16, help='Computation results kept for reuse.')
+    parser.add_argument('--quiet', action='store_true', help='Do not print per-query timings.')
+    parser.add_argument('queries', nargs='?', help='Query file (default: stdin).')
+    args = parser.parse_args(argv)
+    if args.snapshot is None and args.edges is None:
+        if args.queries is not None:
+            parser.error('a graph is required: pass --edges or --snapshot')
+        demo()
+        return 0
+
+    started = time.perf_counter()
+    graph = load_graph(args.snapshot, args.edges, args.directed, args.int_vertices)
+    print(f"Loaded {graph} in {time.perf_counter() - started:.3f} s", file=sys.stderr)
+
+    queries = open(args.queries, encoding='utf-8') if args.queries else sys.stdin
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        latencies = run_queries(graph, queries, output, args.cache,
+                                timings=None if args.quiet else sys.stderr)
+    finally:
+        if queries is not sys.stdin:
+            queries.close()
+        if output is not sys.stdout:
+            output.close()
+
+    for op, summary in latencies.report().items():
+        print(f"{op}: {summary['count']} queries, p50 {summary['p50_ms']:.2f} ms, "
+              f"p99 {summary['p99_ms']:.2f} ms, max {summary['max_ms']:.2f} ms", file=sys.stderr)
+    return 0
+
+
+def demo():
+    """
+    Runs every algorithm on small example graphs and prints the results.
+    """
+    from datastructures.graph.graph import Graph
+    from algorithms.graph.bfs import bfs
+    from algorithms.graph.dfs import dfs, dfs_recursive
+    from algorithms.graph.dijkstra import dijkstra, get_shortest_path
+    from algorithms.graph.bellman_ford import bellman_ford
+    from algorithms.graph.cycle_detection import has_cycle
+    from algorithms.graph.connected_components import get_connected_components
+    from algorithms.graph.graph_coloring import graph_coloring, print_coloring
+    from algorithms.graph.graph_homomorphism import check_homomorphism, print_homomorphism_result
 
-if __name__ == "__main__":
     # --- Undirected Graph Example ---
     print("--- Undirected Graph Example ---")
     g_undirected = Graph() # From datastructures.graph.graph_definition
@@ -49,8 +171,10 @@ if __name__ == "__main__":
 
     # Example vertex mapping from g_undirected to g2
     mapping = {"A": "X", "B": "Y", "C": "Z", "D": "X", "E": "Y", "F": "Z"}
-    homomorphism_result = is_homomorphism(g_undirected, g2, mapping)
+    homomorphism_result, failure = check_homomorphism(g_undirected, g2, mapping)
     print_homomorphism_result(homomorphism_result)
+    if failure:
+        print(f"  Failure: {failure}")
 
     distances_d, predecessors_d = dijkstra(g_undirected, "A")
     if distances_d:
@@ -130,4 +254,8 @@ if __name__ == "__main__":
         print(f"Bellman-Ford correctly detected error: {e}")
 
     print("\nBFS for non-existent vertex:", bfs(g_undirected, "Z_NOT_EXIST"))
-    print("DFS for non-existent vertex:", dfs(g_undirected, "Z_NOT_EXIST"))
\ No newline at end of file
+    print("DFS for non-existent vertex:", dfs(g_undirected, "Z_NOT_EXIST"))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2 @@
+# Query service for the graph library: an asyncio JSON-lines server.
+# Run with: python -m service.server --help
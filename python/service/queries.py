@@ -0,0 +1,234 @@
+# graph_project/service/queries.py
+"""
+The query operations of service.server, usable without a server: planning a
+JSON request into a shared computation, running it, and timing requests.
+The algorithm modules are imported on first use, so tools that answer only a
+few kinds of queries start without loading all of them.
+"""
+import json
+from collections import deque
+
+from datastructures.graph.edge_list import load_edge_list
+from datastructures.graph.snapshot import load_snapshot
+
+
+def _shortest_paths(graph, source):
+    from algorithms.graph.dijkstra import dijkstra
+    distances, predecessors = dijkstra(graph, source)
+    if distances is None:
+        raise KeyError(source)
+    return distances, predecessors
+
+
+def _bellman_ford(graph, source):
+    # spfa follows get_neighbors, so undirected edges are used both ways as
+    # in dijkstra, and negative cycles are reported instead of raising
+    from algorithms.graph.bellman_ford import spfa
+    distances, predecessors, negative_cycle = spfa(graph, source)
+    if distances is None:
+        raise KeyError(source)
+    return distances, predecessors, negative_cycle
+
+
+def _bfs_order(graph, source, max_depth):
+    from algorithms.graph.bfs import iter_bfs
+    if source not in graph:
+        raise KeyError(source)
+    return list(iter_bfs(graph, source, max_depth=max_depth))
+
+
+def _dfs_order(graph, source):
+    from algorithms.graph.dfs import dfs
+    if source not in graph:
+        raise KeyError(source)
+    return dfs(graph, source)
+
+
+def _components(graph):
+    if graph._directed:
+        from algorithms.graph.strongly_connected_components import strongly_connected_components
+        return strongly_connected_components(graph)
+    from algorithms.graph.connected_components import get_connected_components
+    return get_connected_components(graph)
+
+
+def _has_cycle(graph):
+    from algorithms.graph.cycle_detection import has_cycle
+    return has_cycle(graph)
+
+
+def _coloring(graph, strategy):
+    from algorithms.graph.graph_coloring import graph_coloring
+    return graph_coloring(graph, strategy)
+
+
+# The CPU-bound computations, identified by (name, *args) keys. Requests that
+# need the same key share one result: the server coalesces concurrent ones
+# and main.py caches recent ones.
+COMPUTATIONS = {
+    'dijkstra': _shortest_paths,
+    'bellman_ford': _bellman_ford,
+    'bfs': _bfs_order,
+    'dfs': _dfs_order,
+    'components': _components,
+    'has_cycle': _has_cycle,
+    'coloring': _coloring,
+}
+
+
+def _vertex(value):
+    """
+    JSON has no tuples, so vertex labels that are tuples arrive as lists.
+    """
+    if isinstance(value, list):
+        return tuple(_vertex(item) for item in value)
+    return value
+
+
+def _finite(distance):
+    return None if distance == float('inf') else distance
+
+
+OPERATIONS = ('shortest_path', 'distances', 'bellman_ford', 'bfs', 'dfs', 'components',
+              'component_of', 'has_cycle', 'coloring', 'stats')
+
+
+def _finite_distances(result):
+    distances = result[0]
+    return {'distances': [[v, d] for v, d in distances.items() if abs(d) != float('inf')]}
+
+
+def plan(request):
+    """
+    Maps a request to (computation key, finish), where finish turns the
+    shared computation result into this request's JSON result.
+    """
+    op = request.get('op')
+    if op == 'shortest_path':
+        source, target = _vertex(request['source']), _vertex(request['target'])
+
+        def finish(result):
+            from algorithms.graph.dijkstra import get_shortest_path
+            distances, predecessors = result
+            if target not in distances:
+                raise KeyError(target)
+            path = get_shortest_path(predecessors, source, target)
+            return {'distance': _finite(distances[target]), 'path': path}
+        return ('dijkstra', source), finish
+
+    if op == 'distances':
+        return ('dijkstra', _vertex(request['source'])), _finite_distances
+
+    if op == 'bellman_ford':
+        def finish(result):
+            distances, _, negative_cycle = result
+            return dict(_finite_distances(result),
+                        unbounded=[v for v, d in distances.items() if d == float('-inf')],
+                        negative_cycle=negative_cycle)
+        return ('bellman_ford', _vertex(request['source'])), finish
+
+    if op == 'bfs':
+        max_depth = request.get('max_depth')
+        return ('bfs', _vertex(request['source']), max_depth), lambda order: {'order': order}
+
+    if op == 'dfs':
+        return ('dfs', _vertex(request['source'])), lambda order: {'order': order}
+
+    if op == 'components':
+        return ('components',), lambda components: {'components': [list(c) for c in components]}
+
+    if op == 'component_of':
+        vertex = _vertex(request['vertex'])
+
+        def finish(components):
+            for component in components:
+                if vertex in component:
+                    return {'component': list(component)}
+            raise KeyError(vertex)
+        return ('components',), finish
+
+    if op == 'has_cycle':
+        return ('has_cycle',), lambda found: {'has_cycle': found}
+
+    if op == 'coloring':
+        def finish(colors):
+            return {'num_colors': len(set(colors.values())), 'colors': [[v, c] for v, c in colors.items()]}
+        return ('coloring', request.get('strategy', 'insertion')), finish
+
+    raise ValueError(f"Unknown op {op!r}; expected one of {sorted(OPERATIONS)}.")
+
+
+def error_message(error):
+    """
+    The error text of a failed request.
+    """
+    if isinstance(error, KeyError):
+        return f"Unknown vertex or missing field: {error.args[0]!r}"
+    if isinstance(error, (TypeError, ValueError)):
+        return str(error)
+    return f"{type(error).__name__}: {error}"
+
+
+def encode_response(response):
+    """
+    Encodes a response as one line of strict JSON. A result JSON cannot
+    represent (a label like a frozenset, or inf and NaN) becomes an error
+    response for the same id, so the client still gets its reply.
+
+    Returns:
+        str: The JSON text, without the trailing newline.
+    """
+    try:
+        return json.dumps(response, allow_nan=False)
+    except (TypeError, ValueError) as e:
+        return json.dumps({'id': response.get('id'), 'ok': False,
+                           'error': f"Result cannot be encoded as JSON: {e}"})
+
+
+class LatencyTracker:
+    """
+    Keeps the most recent request latencies of every operation and reports
+    their percentiles.
+    """
+
+    def __init__(self, window=10000):
+        """
+        Args:
+            window (int): Number of recent samples kept per operation.
+        """
+        self.window = window
+        self._samples = {}  # op: deque of seconds
+        self._counts = {}
+
+    def record(self, op, seconds):
+        samples = self._samples.get(op)
+        if samples is None:
+            samples = self._samples[op] = deque(maxlen=self.window)
+        samples.append(seconds)
+        self._counts[op] = self._counts.get(op, 0) + 1
+
+    def report(self):
+        """
+        Returns {op: {count, p50_ms, p90_ms, p99_ms, max_ms}}, with the
+        percentiles taken over the recent window.
+        """
+        report = {}
+        for op, samples in self._samples.items():
+            ordered = sorted(samples)
+            report[op] = {'count': self._counts[op]}
+            for name, q in (('p50_ms', 0.50), ('p90_ms', 0.90), ('p99_ms', 0.99)):
+                report[op][name] = 1000 * ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+            report[op]['max_ms'] = 1000 * ordered[-1]
+        return report
+
+
+def load_graph(snapshot=None, edges=None, directed=False, int_vertices=False):
+    """
+    Loads the graph to serve from a snapshot file or an edge list file.
+
+    Returns:
+        CSRGraph: The loaded graph.
+    """
+    if snapshot is not None:
+        return load_snapshot(snapshot, mmap=True)
+    return load_edge_list(edges, directed=directed, vertex_type=int if int_vertices else str, csr=True)
@@ -0,0 +1,246 @@
+# graph_project/service/server.py
+"""
+Serves shortest-path, traversal and component queries on one loaded graph
+over a local TCP or Unix socket, one JSON object per line.
+
+    python -m service.server --snapshot graph.bin --port 8765
+    python -m service.server --edges roads.tsv --int-vertices --unix /tmp/graph.sock
+
+Requests look like {"id": 1, "op": "shortest_path", "source": "A", "target": "D"}
+and every response echoes the id: {"id": 1, "ok": true, "result": {...}} or
+{"id": 1, "ok": false, "error": "..."}. Responses on one connection can
+arrive out of order, so clients should match them by id.
+
+Operations:
+    shortest_path   source, target      -> {"distance", "path"}
+    distances       source              -> {"distances": [[vertex, distance], ...]}
+    bellman_ford    source              -> {"distances", "unbounded", "negative_cycle"}
+    bfs             source, [max_depth] -> {"order": [...]}
+    dfs             source              -> {"order": [...]}
+    components                          -> {"components": [[...], ...]}
+    component_of    vertex              -> {"component": [...]}
+    has_cycle                           -> {"has_cycle": true/false}
+    coloring        [strategy]          -> {"num_colors", "colors": [[vertex, color], ...]}
+    stats                               -> latency percentiles per operation
+
+The requests are planned and answered by service.queries, which main.py
+reuses to run batches of the same queries from the command line.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from datastructures.graph.snapshot import load_snapshot
+from .queries import (COMPUTATIONS, OPERATIONS, LatencyTracker, encode_response, error_message,
+                      load_graph, plan)
+
+# Longest accepted request line, in bytes
+MAX_LINE = 1024 * 1024
+
+# Requests answered concurrently per connection; reading pauses at the limit
+MAX_PENDING = 64
+
+# Graph loaded once per worker process when the executor is a process pool
+_worker_graph = None
+
+
+class GraphServer:
+    """
+    Answers JSON queries on one graph, running the algorithms in an
+    executor so the event loop stays responsive.
+
+    Concurrent queries that need the same computation (for example several
+    shortest_path queries from one source) are coalesced: the first one
+    starts it and the others await the same future.
+    """
+
+    def __init__(self, graph, workers=None, snapshot_path=None, max_pending=MAX_PENDING):
+        """
+        Args:
+            graph (Graph or CSRGraph): The graph to serve. It must not be
+                                       mutated while the server runs.
+            workers (int): Executor size (default: os.cpu_count()).
+            snapshot_path (str): If given and workers > 1, run the algorithms
+                                 in worker processes that memory-map this
+                                 snapshot of the graph (see Graph.save()),
+                                 instead of in threads.
+            max_pending (int): Requests of one connection answered at once.
+                               Further lines are not read until one of them
+                               is answered, so a client that pipelines faster
+                               than it is served gets backpressure.
+        """
+        self.graph = graph
+        self.max_pending = max_pending
+        workers = workers or os.cpu_count() or 1
+        if snapshot_path is not None and workers > 1:
+            self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_load_worker_graph,
+                                                 initargs=(snapshot_path,))
+            self._in_processes = True
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=workers)
+            self._in_processes = False
+        self._in_flight = {}  # Computation key: asyncio.Future
+        self.latencies = LatencyTracker()
+        self.coalesced = 0
+
+    async def handle(self, request):
+        """
+        Answers one decoded request.
+
+        Args:
+            request (dict): The request object.
+
+        Returns:
+            dict: The response object.
+        """
+        started = time.perf_counter()
+        op = request.get('op')
+        response = {'id': request.get('id')}
+        try:
+            if op == 'stats':
+                result = {'latency': self.latencies.report(), 'coalesced': self.coalesced,
+                          'in_flight': len(self._in_flight)}
+            else:
+                key, finish = plan(request)
+                result = finish(await self._compute(key))
+            response.update(ok=True, result=result)
+        except Exception as e:  # Keep serving; report the failure to this client only
+            response.update(ok=False, error=error_message(e))
+        if op in OPERATIONS:
+            self.latencies.record(op, time.perf_counter() - started)
+        return response
+
+    async def _compute(self, key):
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        name, args = key[0], key[1:]
+        if self._in_processes:
+            future = loop.run_in_executor(self._executor, _compute_in_worker, name, args)
+        else:
+            future = loop.run_in_executor(self._executor, partial(COMPUTATIONS[name], self.graph, *args))
+        self._in_flight[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    async def _serve_connection(self, reader, writer):
+        lock = asyncio.Lock()
+        pending = asyncio.Semaphore(self.max_pending)
+        tasks = set()
+
+        async def respond(line):
+            try:
+                await answer(line)
+            finally:
+                pending.release()
+
+        async def answer(line):
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("A request must be a JSON object.")
+            except ValueError as e:
+                response = {'id': None, 'ok': False, 'error': f"Bad request: {e}"}
+            else:
+                response = await self.handle(request)
+            encoded = encode_response(response)
+            async with lock:
+                writer.write(encoded.encode('utf-8') + b'\n')
+                await writer.drain()
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # Line longer than MAX_LINE
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                await pending.acquire()
+                task = asyncio.ensure_future(respond(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host='127.0.0.1', port=8765, unix_path=None):
+        """
+        Starts listening on a Unix socket if unix_path is given, otherwise on TCP.
+
+        Returns:
+            asyncio.Server: The running server.
+        """
+        if unix_path is not None:
+            return await asyncio.start_unix_server(self._serve_connection, path=unix_path, limit=MAX_LINE)
+        return await asyncio.start_server(self._serve_connection, host, port, limit=MAX_LINE)
+
+    def close(self):
+        """
+        Shuts the executor down. Call after the asyncio server is closed.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _load_worker_graph(snapshot_path):
+    global _worker_graph
+    _worker_graph = load_snapshot(snapshot_path, mmap=True)
+
+
+def _compute_in_worker(name, args):
+    return COMPUTATIONS[name](_worker_graph, *args)
+
+
+async def _serve(args):
+    graph = load_graph(args.snapshot, args.edges, args.directed, args.int_vertices)
+    server = GraphServer(graph, workers=args.workers, snapshot_path=args.snapshot,
+                         max_pending=args.max_pending)
+    listener = await server.start(args.host, args.port, args.unix)
+    where = args.unix or f"{args.host}:{args.port}"
+    print(f"Serving {graph} on {where}", file=sys.stderr)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--snapshot', help='Graph snapshot file written by Graph.save().')
+    source.add_argument('--edges', help='Edge list file (see load_edge_list).')
+    parser.add_argument('--directed', action='store_true', help='Treat the edge list as directed.')
+    parser.add_argument('--int-vertices', action='store_true', help='Parse edge list vertices as ints.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='Listen on this Unix socket path instead of TCP.')
+    parser.add_argument('--workers', type=int, help='Executor size (default: CPU count).')
+    parser.add_argument('--max-pending', type=int, default=MAX_PENDING,
+                        help='Requests answered at once per connection.')
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())